@@ -960,6 +960,24 @@ enum HddsError hdds_writer_write(struct HddsDataWriter *aWriter,
                                  const void *aData,
                                  uintptr_t aLen);
 
+/**
+ * Write one sample to each of several writers in a single call
+ *
+ * Sample `i` is `lens[i]` bytes long and goes to `writers[i]`; the samples
+ * are packed back-to-back in `data`. Writing stops at the first failure,
+ * leaving the samples before it published.
+ *
+ * # Safety
+ * - `writers` must point to `count` valid pointers returned from `hdds_writer_create`
+ * - `lens` must point to `count` lengths
+ * - `data` must point to valid memory of at least the sum of `lens` bytes
+ */
+
+enum HddsError hdds_writer_write_batch(struct HddsDataWriter *const *aWriters,
+                                       const void *aData,
+                                       const uintptr_t *aLens,
+                                       uintptr_t aCount);
+
 /**
  * Destroy a `DataWriter`
  *
@@ -1058,6 +1076,42 @@ enum HddsError hdds_reader_take(struct HddsDataReader *aReader,
                                 uintptr_t aMaxLen,
                                 uintptr_t *aLenOut);
 
+/**
+ * Take up to `max_samples` samples in one call (non-blocking)
+ *
+ * Samples are copied back-to-back into `data_out`; the length of sample `i`
+ * is written to `lens_out[i]` and the number of samples to `count_out`.
+ * Taking stops at the first sample that does not fit in the remaining space;
+ * that sample is left in the reader for the next call.
+ *
+ * Returns `HddsNotFound` when no data is available, and `HddsOutOfMemory`
+ * when the first pending sample is larger than `max_len`.
+ *
+ * # Safety
+ * - `reader` must be a valid pointer returned from `hdds_reader_create`
+ * - `data_out` must point to a valid buffer of at least `max_len` bytes
+ * - `lens_out` must point to an array of at least `max_samples` elements
+ * - `count_out` must be a valid pointer to write the sample count
+ */
+
+enum HddsError hdds_reader_take_batch(struct HddsDataReader *aReader,
+                                      void *aDataOut,
+                                      uintptr_t aMaxLen,
+                                      uintptr_t *aLensOut,
+                                      uintptr_t aMaxSamples,
+                                      uintptr_t *aCountOut);
+
+/**
+ * Check whether the reader has a sample ready to take (non-blocking)
+ *
+ * Returns `false` for a null reader or when the pending data could not be
+ * decoded; the error then surfaces on the next take.
+ *
+ * # Safety
+ * - `reader` must be a valid pointer returned from `hdds_reader_create`
+ */
+ bool hdds_reader_has_data(struct HddsDataReader *aReader);
+
 /**
  * Destroy a `DataReader`
  *
@@ -2241,6 +2295,21 @@ struct HddsDataReader *hdds_subscriber_create_reader_with_qos(struct HddsSubscri
  */
  enum HddsError hdds_qos_add_partition(struct HddsQoS *aQos, const char *aPartition);
 
+/**
+ * Add several partition names to the QoS in one call.
+ *
+ * Equivalent to calling `hdds_qos_add_partition` once per name. Names are
+ * validated before any is added, so on error the QoS is left unchanged.
+ *
+ * # Safety
+ * - `qos` must be a valid pointer from `hdds_qos_*` functions.
+ * - `names` must be a valid array of `count` null-terminated C strings,
+ *   or NULL if `count` is 0.
+ */
+enum HddsError hdds_qos_add_partitions(struct HddsQoS *aQos,
+                                       const char *const *aNames,
+                                       uintptr_t aCount);
+
 /**
  * Check if QoS is reliable.
  *
@@ -2377,6 +2446,25 @@ struct HddsDataReader *hdds_subscriber_create_reader_with_qos(struct HddsSubscri
  */
  uintptr_t hdds_qos_get_max_samples_per_instance(const struct HddsQoS *aQos);
 
+/**
+ * Get the number of partition names.
+ *
+ * Returns 0 for the default (empty) partition.
+ *
+ * # Safety
+ * - `qos` must be a valid pointer from `hdds_qos_*` functions.
+ */
+ uintptr_t hdds_qos_get_partition_count(const struct HddsQoS *aQos);
+
+/**
+ * Check whether a partition name has been added to the QoS.
+ *
+ * # Safety
+ * - `qos` must be a valid pointer from `hdds_qos_*` functions.
+ * - `partition` must be a valid null-terminated C string.
+ */
+ bool hdds_qos_has_partition(const struct HddsQoS *aQos, const char *aPartition);
+
 /**
  * Set liveliness to automatic with given lease duration in nanoseconds.
  *
@@ -2753,6 +2841,56 @@ void hdds_telemetry_record_latency(struct HddsMetrics *aMetrics,
                                    uint64_t aStartNs,
                                    uint64_t aEndNs);
 
+/**
+ * Record a batch of latency samples in one call
+ *
+ * Equivalent to calling `hdds_telemetry_record_latency` once per pair, but
+ * crosses the FFI boundary and takes the sample lock only once.
+ *
+ * # Safety
+ * - `metrics` must be a valid handle
+ * - `start_ns` and `end_ns` must each point to `count` readable `u64` values
+ *
+ * # Arguments
+ * * `start_ns` - Start timestamps in nanoseconds
+ * * `end_ns` - End timestamps in nanoseconds, paired by index with `start_ns`
+ * * `count` - Number of samples
+ *
+ * # Returns
+ * `HddsError::HddsOk` on success
+ */
+
+enum HddsError hdds_telemetry_record_latency_batch(struct HddsMetrics *aMetrics,
+                                                   const uint64_t *aStartNs,
+                                                   const uint64_t *aEndNs,
+                                                   uintptr_t aCount);
+
+/**
+ * Export the retained latency samples as a power-of-two histogram
+ *
+ * Bucket 0 counts zero latencies; bucket `i > 0` counts latencies in
+ * `[2^(i-1), 2^i)` nanoseconds. The last bucket is open-ended and also
+ * counts every larger latency, so percentiles falling in it have no upper
+ * bound. 65 buckets give every `u64` its own bucket; with 64, latencies
+ * of `2^63` ns and above saturate into bucket 63. Percentiles can be
+ * derived from the buckets without transferring individual samples.
+ *
+ * # Safety
+ * - `metrics` must be a valid handle
+ * - `out_buckets` must point to `n_buckets` writable `u64` values
+ *
+ * # Arguments
+ * * `out_buckets` - Output bucket counts (overwritten)
+ * * `n_buckets` - Number of buckets (must be > 0)
+ *
+ * # Returns
+ * `HddsError::HddsOk` on success
+ */
+
+enum HddsError hdds_telemetry_snapshot_histogram(struct HddsMetrics *aMetrics,
+                                                 uint64_t *aOutBuckets,
+                                                 uintptr_t aNBuckets);
+
 /**
  * Start the telemetry export server
  *
@@ -2771,6 +2909,33 @@ void hdds_telemetry_record_latency(struct HddsMetrics *aMetrics,
  */
  struct HddsTelemetryExporter *hdds_telemetry_start_exporter(const char *aBindAddr, uint16_t aPort);
 
+/**
+ * Start the telemetry export server with frame coalescing
+ *
+ * Like `hdds_telemetry_start_exporter`, but queued frames are written to
+ * each client in one send once `chunk_bytes` are pending or
+ * `flush_interval_ms` has elapsed since the last flush. `chunk_bytes == 0`
+ * sends every frame immediately.
+ *
+ * # Safety
+ * - `bind_addr` must be a valid null-terminated C string.
+ * - The returned handle must be released with `hdds_telemetry_stop_exporter`.
+ *
+ * # Arguments
+ * * `bind_addr` - IP address to bind (e.g., "127.0.0.1" or "0.0.0.0")
+ * * `port` - Port number (default: 4242)
+ * * `chunk_bytes` - Flush threshold in bytes (e.g., 4096)
+ * * `flush_interval_ms` - Maximum time between flushes in milliseconds (e.g., 50)
+ *
+ * # Returns
+ * Handle to exporter, or NULL on error
+ */
+
+struct HddsTelemetryExporter *hdds_telemetry_start_exporter_buffered(const char *aBindAddr,
+                                                                     uint16_t aPort,
+                                                                     uintptr_t aChunkBytes,
+                                                                     uint32_t aFlushIntervalMs);
+
 /**
  * Stop and release the telemetry exporter
  *
@@ -707,6 +707,53 @@ pub unsafe extern "C" fn hdds_writer_write(
     }
 }
 
+/// Write one sample to each of several writers in a single call
+///
+/// Sample `i` is `lens[i]` bytes long and goes to `writers[i]`; the samples
+/// are packed back-to-back in `data`. Writing stops at the first failure,
+/// leaving the samples before it published.
+///
+/// # Safety
+/// - `writers` must point to `count` valid pointers returned from `hdds_writer_create`
+/// - `lens` must point to `count` lengths
+/// - `data` must point to valid memory of at least the sum of `lens` bytes
+#[no_mangle]
+pub unsafe extern "C" fn hdds_writer_write_batch(
+    writers: *const *mut HddsDataWriter,
+    data: *const c_void,
+    lens: *const usize,
+    count: usize,
+) -> HddsError {
+    if count == 0 {
+        return HddsError::HddsOk;
+    }
+    if writers.is_null() || data.is_null() || lens.is_null() {
+        return HddsError::HddsInvalidArgument;
+    }
+
+    let writers = std::slice::from_raw_parts(writers, count);
+    let lens = std::slice::from_raw_parts(lens, count);
+    if writers.iter().any(|w| w.is_null()) {
+        return HddsError::HddsInvalidArgument;
+    }
+
+    let mut offset = 0;
+    for (&writer, &len) in writers.iter().zip(lens) {
+        let writer_ref = &*writer.cast::<DataWriter<BytePayload>>();
+        let data_slice = std::slice::from_raw_parts(data.cast::<u8>().add(offset), len);
+        offset += len;
+
+        let payload = BytePayload {
+            data: data_slice.to_vec(),
+        };
+        if writer_ref.write(&payload).is_err() {
+            return HddsError::HddsOperationFailed;
+        }
+    }
+
+    HddsError::HddsOk
+}
+
 /// Destroy a `DataWriter`
 ///
 /// # Safety
@@ -990,6 +1037,93 @@ pub unsafe extern "C" fn hdds_reader_take(
     }
 }
 
+/// Take up to `max_samples` samples in one call (non-blocking)
+///
+/// Samples are copied back-to-back into `data_out`; the length of sample `i`
+/// is written to `lens_out[i]` and the number of samples to `count_out`.
+/// Taking stops at the first sample that does not fit in the remaining space;
+/// that sample is left in the reader for the next call.
+///
+/// Returns `HddsNotFound` when no data is available, and `HddsOutOfMemory`
+/// when the first pending sample is larger than `max_len`.
+///
+/// # Safety
+/// - `reader` must be a valid pointer returned from `hdds_reader_create`
+/// - `data_out` must point to a valid buffer of at least `max_len` bytes
+/// - `lens_out` must point to an array of at least `max_samples` elements
+/// - `count_out` must be a valid pointer to write the sample count
+#[no_mangle]
+pub unsafe extern "C" fn hdds_reader_take_batch(
+    reader: *mut HddsDataReader,
+    data_out: *mut c_void,
+    max_len: usize,
+    lens_out: *mut usize,
+    max_samples: usize,
+    count_out: *mut usize,
+) -> HddsError {
+    if reader.is_null() || data_out.is_null() || lens_out.is_null() || count_out.is_null() {
+        return HddsError::HddsInvalidArgument;
+    }
+    *count_out = 0;
+
+    let reader_ref = &*reader.cast::<DataReader<BytePayload>>();
+
+    let mut remaining = max_len;
+    let mut blocked = false;
+    let batch = reader_ref.take_batch_while(max_samples, |payload| {
+        if payload.data.len() > remaining {
+            blocked = true;
+            return false;
+        }
+        remaining -= payload.data.len();
+        true
+    });
+
+    match batch {
+        Ok(samples) if samples.is_empty() => {
+            if blocked {
+                HddsError::HddsOutOfMemory
+            } else {
+                HddsError::HddsNotFound
+            }
+        }
+        Ok(samples) => {
+            let lens = std::slice::from_raw_parts_mut(lens_out, samples.len());
+            let mut offset = 0;
+            for (payload, len) in samples.iter().zip(lens.iter_mut()) {
+                let n = payload.data.len();
+                std::ptr::copy_nonoverlapping(
+                    payload.data.as_ptr(),
+                    data_out.cast::<u8>().add(offset),
+                    n,
+                );
+                *len = n;
+                offset += n;
+            }
+            *count_out = samples.len();
+            HddsError::HddsOk
+        }
+        Err(_) => HddsError::HddsOperationFailed,
+    }
+}
+
+/// Check whether the reader has a sample ready to take (non-blocking)
+///
+/// Returns `false` for a null reader or when the pending data could not be
+/// decoded; the error then surfaces on the next take.
+///
+/// # Safety
+/// - `reader` must be a valid pointer returned from `hdds_reader_create`
+#[no_mangle]
+pub unsafe extern "C" fn hdds_reader_has_data(reader: *mut HddsDataReader) -> bool {
+    if reader.is_null() {
+        return false;
+    }
+
+    let reader_ref = &*reader.cast::<DataReader<BytePayload>>();
+    reader_ref.has_data().unwrap_or(false)
+}
+
 /// Destroy a `DataReader`
 ///
 /// # Safety
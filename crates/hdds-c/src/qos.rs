@@ -357,6 +357,47 @@ pub unsafe extern "C" fn hdds_qos_add_partition(
     HddsError::HddsOk
 }
 
+/// Add several partition names to the QoS in one call.
+///
+/// Equivalent to calling `hdds_qos_add_partition` once per name. Names are
+/// validated before any is added, so on error the QoS is left unchanged.
+///
+/// # Safety
+/// - `qos` must be a valid pointer from `hdds_qos_*` functions.
+/// - `names` must be a valid array of `count` null-terminated C strings,
+///   or NULL if `count` is 0.
+#[no_mangle]
+pub unsafe extern "C" fn hdds_qos_add_partitions(
+    qos: *mut HddsQoS,
+    names: *const *const c_char,
+    count: usize,
+) -> HddsError {
+    if qos.is_null() || (names.is_null() && count > 0) {
+        return HddsError::HddsInvalidArgument;
+    }
+    if count == 0 {
+        return HddsError::HddsOk;
+    }
+
+    let mut parsed = Vec::with_capacity(count);
+    for &name in std::slice::from_raw_parts(names, count) {
+        if name.is_null() {
+            return HddsError::HddsInvalidArgument;
+        }
+        let Ok(part_str) = CStr::from_ptr(name).to_str() else {
+            return HddsError::HddsInvalidArgument;
+        };
+        parsed.push(part_str);
+    }
+
+    let qos_ref = &mut *qos.cast::<QoS>();
+    for part_str in parsed {
+        qos_ref.partition.add(part_str);
+    }
+
+    HddsError::HddsOk
+}
+
 // =============================================================================
 // QoS Getters (for inspection/debugging)
 // =============================================================================
@@ -617,6 +658,44 @@ pub unsafe extern "C" fn hdds_qos_get_max_samples_per_instance(qos: *const HddsQ
     qos_ref.resource_limits.max_samples_per_instance
 }
 
+/// Get the number of partition names.
+///
+/// Returns 0 for the default (empty) partition.
+///
+/// # Safety
+/// - `qos` must be a valid pointer from `hdds_qos_*` functions.
+#[no_mangle]
+pub unsafe extern "C" fn hdds_qos_get_partition_count(qos: *const HddsQoS) -> usize {
+    if qos.is_null() {
+        return 0;
+    }
+
+    let qos_ref = &*qos.cast::<QoS>();
+    qos_ref.partition.len()
+}
+
+/// Check whether a partition name has been added to the QoS.
+///
+/// # Safety
+/// - `qos` must be a valid pointer from `hdds_qos_*` functions.
+/// - `partition` must be a valid null-terminated C string.
+#[no_mangle]
+pub unsafe extern "C" fn hdds_qos_has_partition(
+    qos: *const HddsQoS,
+    partition: *const c_char,
+) -> bool {
+    if qos.is_null() || partition.is_null() {
+        return false;
+    }
+
+    let Ok(part_str) = CStr::from_ptr(partition).to_str() else {
+        return false;
+    };
+
+    let qos_ref = &*qos.cast::<QoS>();
+    qos_ref.partition.names.iter().any(|name| name == part_str)
+}
+
 // =============================================================================
 // QoS Setters (additional)
 // =============================================================================
@@ -827,6 +906,24 @@ mod tests {
                 HddsError::HddsOk
             );
 
+            // Test batched partitions
+            let a = CString::new("a").unwrap();
+            let b = CString::new("b").unwrap();
+            let names = [a.as_ptr(), b.as_ptr()];
+            assert_eq!(
+                hdds_qos_add_partitions(qos, names.as_ptr(), names.len()),
+                HddsError::HddsOk
+            );
+            assert_eq!(hdds_qos_get_partition_count(qos), 3);
+            assert!(hdds_qos_has_partition(qos, part.as_ptr()));
+            assert!(hdds_qos_has_partition(qos, b.as_ptr()));
+            let c = CString::new("c").unwrap();
+            assert!(!hdds_qos_has_partition(qos, c.as_ptr()));
+            assert_eq!(
+                hdds_qos_add_partitions(qos, ptr::null(), 1),
+                HddsError::HddsInvalidArgument
+            );
+
             hdds_qos_destroy(qos);
         }
     }
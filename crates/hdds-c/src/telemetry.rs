@@ -7,6 +7,7 @@ use std::ffi::CStr;
 use std::os::raw::c_char;
 use std::ptr;
 use std::sync::Arc;
+use std::time::Duration;
 
 use super::HddsError;
 
@@ -167,6 +168,84 @@ pub unsafe extern "C" fn hdds_telemetry_record_latency(
     let _ = Arc::into_raw(arc);
 }
 
+/// Record a batch of latency samples in one call
+///
+/// Equivalent to calling `hdds_telemetry_record_latency` once per pair, but
+/// crosses the FFI boundary and takes the sample lock only once.
+///
+/// # Safety
+/// - `metrics` must be a valid handle
+/// - `start_ns` and `end_ns` must each point to `count` readable `u64` values
+///
+/// # Arguments
+/// * `start_ns` - Start timestamps in nanoseconds
+/// * `end_ns` - End timestamps in nanoseconds, paired by index with `start_ns`
+/// * `count` - Number of samples
+///
+/// # Returns
+/// `HddsError::HddsOk` on success
+#[no_mangle]
+pub unsafe extern "C" fn hdds_telemetry_record_latency_batch(
+    metrics: *mut HddsMetrics,
+    start_ns: *const u64,
+    end_ns: *const u64,
+    count: usize,
+) -> HddsError {
+    if metrics.is_null() || (count > 0 && (start_ns.is_null() || end_ns.is_null())) {
+        return HddsError::HddsInvalidArgument;
+    }
+    if count == 0 {
+        return HddsError::HddsOk;
+    }
+
+    let starts = std::slice::from_raw_parts(start_ns, count);
+    let ends = std::slice::from_raw_parts(end_ns, count);
+
+    let arc = Arc::from_raw(metrics.cast::<hdds::telemetry::MetricsCollector>());
+    arc.add_latency_samples(starts, ends);
+    let _ = Arc::into_raw(arc);
+
+    HddsError::HddsOk
+}
+
+/// Export the retained latency samples as a power-of-two histogram
+///
+/// Bucket 0 counts zero latencies; bucket `i > 0` counts latencies in
+/// `[2^(i-1), 2^i)` nanoseconds. The last bucket is open-ended and also
+/// counts every larger latency, so percentiles falling in it have no upper
+/// bound. 65 buckets give every `u64` its own bucket; with 64, latencies
+/// of `2^63` ns and above saturate into bucket 63. Percentiles can be
+/// derived from the buckets without transferring individual samples.
+///
+/// # Safety
+/// - `metrics` must be a valid handle
+/// - `out_buckets` must point to `n_buckets` writable `u64` values
+///
+/// # Arguments
+/// * `out_buckets` - Output bucket counts (overwritten)
+/// * `n_buckets` - Number of buckets (must be > 0)
+///
+/// # Returns
+/// `HddsError::HddsOk` on success
+#[no_mangle]
+pub unsafe extern "C" fn hdds_telemetry_snapshot_histogram(
+    metrics: *mut HddsMetrics,
+    out_buckets: *mut u64,
+    n_buckets: usize,
+) -> HddsError {
+    if metrics.is_null() || out_buckets.is_null() || n_buckets == 0 {
+        return HddsError::HddsInvalidArgument;
+    }
+
+    let buckets = std::slice::from_raw_parts_mut(out_buckets, n_buckets);
+
+    let arc = Arc::from_raw(metrics.cast::<hdds::telemetry::MetricsCollector>());
+    arc.latency_histogram(buckets);
+    let _ = Arc::into_raw(arc);
+
+    HddsError::HddsOk
+}
+
 // =============================================================================
 // Telemetry Exporter (TCP streaming server)
 // =============================================================================
@@ -207,6 +286,50 @@ pub unsafe extern "C" fn hdds_telemetry_start_exporter(
     }
 }
 
+/// Start the telemetry export server with frame coalescing
+///
+/// Like `hdds_telemetry_start_exporter`, but queued frames are written to
+/// each client in one send once `chunk_bytes` are pending or
+/// `flush_interval_ms` has elapsed since the last flush. `chunk_bytes == 0`
+/// sends every frame immediately.
+///
+/// # Safety
+/// - `bind_addr` must be a valid null-terminated C string.
+/// - The returned handle must be released with `hdds_telemetry_stop_exporter`.
+///
+/// # Arguments
+/// * `bind_addr` - IP address to bind (e.g., "127.0.0.1" or "0.0.0.0")
+/// * `port` - Port number (default: 4242)
+/// * `chunk_bytes` - Flush threshold in bytes (e.g., 4096)
+/// * `flush_interval_ms` - Maximum time between flushes in milliseconds (e.g., 50)
+///
+/// # Returns
+/// Handle to exporter, or NULL on error
+#[no_mangle]
+pub unsafe extern "C" fn hdds_telemetry_start_exporter_buffered(
+    bind_addr: *const c_char,
+    port: u16,
+    chunk_bytes: usize,
+    flush_interval_ms: u32,
+) -> *mut HddsTelemetryExporter {
+    if bind_addr.is_null() {
+        return ptr::null_mut();
+    }
+
+    let Ok(addr_str) = CStr::from_ptr(bind_addr).to_str() else {
+        return ptr::null_mut();
+    };
+
+    let flush_interval = Duration::from_millis(u64::from(flush_interval_ms));
+    match hdds::telemetry::init_exporter_buffered(addr_str, port, chunk_bytes, flush_interval) {
+        Ok(exporter) => Arc::into_raw(exporter) as *mut HddsTelemetryExporter,
+        Err(e) => {
+            log::error!("Failed to start telemetry exporter: {}", e);
+            ptr::null_mut()
+        }
+    }
+}
+
 /// Stop and release the telemetry exporter
 ///
 /// # Safety
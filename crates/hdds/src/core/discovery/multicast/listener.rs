@@ -10,7 +10,7 @@
 //! # Architecture (v212: mio/epoll)
 //!
 //! ```text
-//! mio::poll() -> recv_from(temp_buf) -> classify_rtps() -> RxPool::acquire() -> copy -> RxRing::push()
+//! mio::poll() -> recvmmsg(RxBatch) -> classify_rtps() -> RxPool::acquire() -> copy -> RxRing::push()
 //!                                          v
 //!                              DiscoveryCallback (SPDP/SEDP)
 //! ```
@@ -18,11 +18,13 @@
 //! # v212 Optimizations
 //! - **epoll**: Uses mio for event-driven I/O (no blocking timeout overhead)
 //! - **edge-triggered drain**: Process all available packets per poll event
+//! - **recvmmsg**: Drain up to `RX_BATCH_SIZE` datagrams per syscall (Linux)
 
 use super::control_parser::{
     parse_acknack_submessage, parse_all_heartbeat_submessages, parse_nack_frag_submessage,
 };
 use super::control_types::ControlMessage;
+use super::rx_batch::RxBatch;
 use super::{classify_rtps, PacketKind, RxMeta, RxPool};
 use crate::engine::wake::WakeNotifier;
 use crossbeam::channel::Sender;
@@ -313,8 +315,8 @@ impl MulticastListener {
             return;
         }
 
-        // Temporary buffer for recv_from (reused across iterations)
-        let mut temp_buf = vec![0u8; crate::config::MAX_PACKET_SIZE];
+        // Receive slots for recvmmsg (reused across iterations)
+        let mut rx_batch = RxBatch::new(crate::config::MAX_PACKET_SIZE);
 
         while running.load(Ordering::Relaxed) {
             // v212: Wait for socket readability with mio poll
@@ -334,94 +336,96 @@ impl MulticastListener {
 
                 // Drain all available packets (edge-triggered style)
                 loop {
-                    let (len, src_addr) = match mio_socket.recv_from(&mut temp_buf) {
-                        Ok(result) => result,
+                    let received = match rx_batch.recv(&mio_socket) {
+                        Ok(count) => count,
                         Err(e) if e.kind() == io::ErrorKind::WouldBlock => break,
                         Err(e) => {
-                            log::debug!("[hdds-mcast-rx] recv_from error: {:?}", e);
+                            log::debug!("[hdds-mcast-rx] recv error: {:?}", e);
                             break;
                         }
                     };
-                    log::debug!(
-                        "[MCAST] recv len={} src={} thread={:?}",
-                        len,
-                        src_addr,
-                        std::thread::current().id()
-                    );
-
-                    // Update metrics
-                    metrics.packets_received.fetch_add(1, Ordering::Relaxed);
-                    metrics
-                        .bytes_received
-                        .fetch_add(len as u64, Ordering::Relaxed);
-
-                    // Classify packet (returns kind, optional DATA payload offset, fragment metadata, and RTPS context)
-                    // v61 Blocker #1: Now captures INFO_DST/INFO_TS context for stateful RTPS parsing
-                    let (kind, payload_offset, fragment_metadata, rtps_context) =
-                        classify_rtps(&temp_buf[..len]);
-
-                    let kind_label = match kind {
-                        PacketKind::Data => "DATA",
-                        PacketKind::Heartbeat => "HEARTBEAT",
-                        PacketKind::AckNack => "ACKNACK",
-                        PacketKind::DataFrag => "DATA_FRAG",
-                        PacketKind::Gap => "GAP",
-                        PacketKind::NackFrag => "NACK_FRAG",
-                        PacketKind::HeartbeatFrag => "HEARTBEAT_FRAG",
-                        PacketKind::InfoTs => "INFO_TS",
-                        PacketKind::InfoSrc => "INFO_SRC",
-                        PacketKind::InfoDst => "INFO_DST",
-                        PacketKind::InfoReply => "INFO_REPLY",
-                        PacketKind::Pad => "PAD",
-                        PacketKind::SPDP => "SPDP",
-                        PacketKind::SEDP => "SEDP",
-                        PacketKind::TypeLookup => "TYPE_LOOKUP",
-                        PacketKind::Invalid => "INVALID",
-                        PacketKind::Unknown => "UNKNOWN",
-                    };
-                    log::debug!(
-                        "[MCAST] recv kind={} len={} src={} thread={:?}",
-                        kind_label,
-                        len,
-                        src_addr,
-                        std::thread::current().id()
-                    );
-
-                    // Drop invalid packets
-                    if matches!(kind, PacketKind::Invalid) {
-                        metrics.packets_invalid.fetch_add(1, Ordering::Relaxed);
-                        continue;
-                    }
-
-                    // v202/v203: Two-Ring Architecture - dispatch HEARTBEAT/ACKNACK to control channel
-                    // When control_tx is available, these control packets bypass the pool and go
-                    // to a dedicated ControlHandler thread. This prevents pool exhaustion under
-                    // high HEARTBEAT/ACKNACK load (RELIABLE QoS).
-                    //
-                    // v203: Extended to also bypass AckNack packets which were saturating the pool
-                    // (623 AckNack drops observed in EVENT test causing 0 samples received)
-                    if kind == PacketKind::Heartbeat {
-                        if let Some(ref tx) = control_tx {
-                            // v210: Parse ALL heartbeat submessages from the packet.
-                            // FastDDS bundles HBs for multiple writers (03C2, 04C2, 0200C2)
-                            // in one RTPS packet. Previous code only extracted the first one,
-                            // silently dropping SEDP pub/sub HBs.
-                            let all_hbs = parse_all_heartbeat_submessages(&temp_buf[..len]);
-
-                            if all_hbs.is_empty() {
-                                log::debug!(
+                    for slot in 0..received {
+                        let (temp_buf, len, src_addr) = rx_batch.datagram(slot);
+                        log::debug!(
+                            "[MCAST] recv len={} src={} thread={:?}",
+                            len,
+                            src_addr,
+                            std::thread::current().id()
+                        );
+
+                        // Update metrics
+                        metrics.packets_received.fetch_add(1, Ordering::Relaxed);
+                        metrics
+                            .bytes_received
+                            .fetch_add(len as u64, Ordering::Relaxed);
+
+                        // Classify packet (returns kind, optional DATA payload offset, fragment metadata, and RTPS context)
+                        // v61 Blocker #1: Now captures INFO_DST/INFO_TS context for stateful RTPS parsing
+                        let (kind, payload_offset, fragment_metadata, rtps_context) =
+                            classify_rtps(&temp_buf[..len]);
+
+                        let kind_label = match kind {
+                            PacketKind::Data => "DATA",
+                            PacketKind::Heartbeat => "HEARTBEAT",
+                            PacketKind::AckNack => "ACKNACK",
+                            PacketKind::DataFrag => "DATA_FRAG",
+                            PacketKind::Gap => "GAP",
+                            PacketKind::NackFrag => "NACK_FRAG",
+                            PacketKind::HeartbeatFrag => "HEARTBEAT_FRAG",
+                            PacketKind::InfoTs => "INFO_TS",
+                            PacketKind::InfoSrc => "INFO_SRC",
+                            PacketKind::InfoDst => "INFO_DST",
+                            PacketKind::InfoReply => "INFO_REPLY",
+                            PacketKind::Pad => "PAD",
+                            PacketKind::SPDP => "SPDP",
+                            PacketKind::SEDP => "SEDP",
+                            PacketKind::TypeLookup => "TYPE_LOOKUP",
+                            PacketKind::Invalid => "INVALID",
+                            PacketKind::Unknown => "UNKNOWN",
+                        };
+                        log::debug!(
+                            "[MCAST] recv kind={} len={} src={} thread={:?}",
+                            kind_label,
+                            len,
+                            src_addr,
+                            std::thread::current().id()
+                        );
+
+                        // Drop invalid packets
+                        if matches!(kind, PacketKind::Invalid) {
+                            metrics.packets_invalid.fetch_add(1, Ordering::Relaxed);
+                            continue;
+                        }
+
+                        // v202/v203: Two-Ring Architecture - dispatch HEARTBEAT/ACKNACK to control channel
+                        // When control_tx is available, these control packets bypass the pool and go
+                        // to a dedicated ControlHandler thread. This prevents pool exhaustion under
+                        // high HEARTBEAT/ACKNACK load (RELIABLE QoS).
+                        //
+                        // v203: Extended to also bypass AckNack packets which were saturating the pool
+                        // (623 AckNack drops observed in EVENT test causing 0 samples received)
+                        if kind == PacketKind::Heartbeat {
+                            if let Some(ref tx) = control_tx {
+                                // v210: Parse ALL heartbeat submessages from the packet.
+                                // FastDDS bundles HBs for multiple writers (03C2, 04C2, 0200C2)
+                                // in one RTPS packet. Previous code only extracted the first one,
+                                // silently dropping SEDP pub/sub HBs.
+                                let all_hbs = parse_all_heartbeat_submessages(&temp_buf[..len]);
+
+                                if all_hbs.is_empty() {
+                                    log::debug!(
                                     "[MCAST-RX] v189: Failed to parse HEARTBEAT from {}, len={}",
                                     src_addr,
                                     len
                                 );
-                            } else {
-                                // Extract peer GUID prefix from RTPS header
-                                let mut peer_guid_prefix = [0u8; 12];
-                                if len >= 20 {
-                                    peer_guid_prefix.copy_from_slice(&temp_buf[8..20]);
-                                }
+                                } else {
+                                    // Extract peer GUID prefix from RTPS header
+                                    let mut peer_guid_prefix = [0u8; 12];
+                                    if len >= 20 {
+                                        peer_guid_prefix.copy_from_slice(&temp_buf[8..20]);
+                                    }
 
-                                log::debug!(
+                                    log::debug!(
                                     "[MCAST-RX] v210: Parsed {} HEARTBEAT(s) from {} writers={:?}",
                                     all_hbs.len(),
                                     src_addr,
@@ -431,297 +435,301 @@ impl MulticastListener {
                                         .collect::<Vec<_>>()
                                 );
 
-                                for hb_info in all_hbs {
-                                    if let Some(msg) = ControlMessage::heartbeat(
-                                        src_addr,
-                                        peer_guid_prefix,
-                                        hb_info,
-                                        &temp_buf[..len],
-                                    ) {
-                                        // Non-blocking send - drop if channel full (HBs are idempotent)
-                                        if tx.try_send(msg).is_err() {
-                                            log::debug!(
+                                    for hb_info in all_hbs {
+                                        if let Some(msg) = ControlMessage::heartbeat(
+                                            src_addr,
+                                            peer_guid_prefix,
+                                            hb_info,
+                                            &temp_buf[..len],
+                                        ) {
+                                            // Non-blocking send - drop if channel full (HBs are idempotent)
+                                            if tx.try_send(msg).is_err() {
+                                                log::debug!(
                                         "[MCAST-RX] Control channel full, dropping HEARTBEAT from {}",
                                         src_addr
                                     );
+                                            }
                                         }
                                     }
                                 }
+                                // Skip synchronous callback and pool for this HEARTBEAT
+                                continue;
                             }
-                            // Skip synchronous callback and pool for this HEARTBEAT
-                            continue;
+                            // No control_tx: fall through to legacy synchronous callback
                         }
-                        // No control_tx: fall through to legacy synchronous callback
-                    }
-
-                    // v137: Parse and send ACKNACKs to control channel for SEDP response.
-                    //
-                    // RTI sends ACKNACKs asking for our publications (0x03c2).
-                    // We must respond with a HEARTBEAT indicating "empty writer" (lastSeq=0).
-                    // Without this, RTI never sends its SEDP Publications DATA.
-                    //
-                    // v203: Extended to also bypass non-SEDP AckNack packets which don't need processing.
-                    if kind == PacketKind::AckNack {
-                        if let Some(ref tx) = control_tx {
-                            // Parse ACKNACK and send to control channel
-                            if let Some(an_info) = parse_acknack_submessage(&temp_buf[..len]) {
-                                // Extract peer GUID prefix from RTPS header
-                                let mut peer_guid_prefix = [0u8; 12];
-                                if len >= 20 {
-                                    peer_guid_prefix.copy_from_slice(&temp_buf[8..20]);
-                                }
 
-                                if let Some(msg) = ControlMessage::acknack(
-                                    src_addr,
-                                    peer_guid_prefix,
-                                    an_info.clone(),
-                                    &temp_buf[..len],
-                                ) {
-                                    // Non-blocking send - drop if channel full (ACKNACKs can be retried)
-                                    log::debug!(
+                        // v137: Parse and send ACKNACKs to control channel for SEDP response.
+                        //
+                        // RTI sends ACKNACKs asking for our publications (0x03c2).
+                        // We must respond with a HEARTBEAT indicating "empty writer" (lastSeq=0).
+                        // Without this, RTI never sends its SEDP Publications DATA.
+                        //
+                        // v203: Extended to also bypass non-SEDP AckNack packets which don't need processing.
+                        if kind == PacketKind::AckNack {
+                            if let Some(ref tx) = control_tx {
+                                // Parse ACKNACK and send to control channel
+                                if let Some(an_info) = parse_acknack_submessage(&temp_buf[..len]) {
+                                    // Extract peer GUID prefix from RTPS header
+                                    let mut peer_guid_prefix = [0u8; 12];
+                                    if len >= 20 {
+                                        peer_guid_prefix.copy_from_slice(&temp_buf[8..20]);
+                                    }
+
+                                    if let Some(msg) = ControlMessage::acknack(
+                                        src_addr,
+                                        peer_guid_prefix,
+                                        an_info.clone(),
+                                        &temp_buf[..len],
+                                    ) {
+                                        // Non-blocking send - drop if channel full (ACKNACKs can be retried)
+                                        log::debug!(
                                 "[MCAST-RX] v204: Sending ACKNACK to control channel: writer={:02x?} from {} ranges={}",
                                 an_info.writer_entity_id,
                                 src_addr,
                                 an_info.missing_ranges.len()
                             );
-                                    if tx.try_send(msg).is_err() {
-                                        log::debug!(
+                                        if tx.try_send(msg).is_err() {
+                                            log::debug!(
                                     "[MCAST-RX] Control channel full, dropping ACKNACK from {}",
                                     src_addr
                                 );
-                                    }
-                                } else {
-                                    log::debug!(
+                                        }
+                                    } else {
+                                        log::debug!(
                                 "[MCAST-RX] v204: ControlMessage::acknack returned None for ACKNACK from {}",
                                 src_addr
                             );
-                                }
-                            } else {
-                                log::debug!(
+                                    }
+                                } else {
+                                    log::debug!(
                             "[MCAST-RX] v204: parse_acknack_submessage returned None for {} bytes from {}",
                             len,
                             src_addr
                         );
+                                }
+                                // Skip synchronous callback and pool for this ACKNACK
+                                continue;
                             }
-                            // Skip synchronous callback and pool for this ACKNACK
-                            continue;
+                            // No control_tx: fall through to pool-based processing
                         }
-                        // No control_tx: fall through to pool-based processing
-                    }
-
-                    // Handle NACK_FRAG packets (fragment retransmission requests)
-                    if kind == PacketKind::NackFrag {
-                        if let Some(ref tx) = control_tx {
-                            // Parse NACK_FRAG and send to control channel
-                            if let Some(nf_info) = parse_nack_frag_submessage(&temp_buf[..len]) {
-                                // Extract peer GUID prefix from RTPS header
-                                let mut peer_guid_prefix = [0u8; 12];
-                                if len >= 20 {
-                                    peer_guid_prefix.copy_from_slice(&temp_buf[8..20]);
-                                }
 
-                                if let Some(msg) = ControlMessage::nack_frag(
-                                    src_addr,
-                                    peer_guid_prefix,
-                                    nf_info.clone(),
-                                    &temp_buf[..len],
-                                ) {
-                                    log::debug!(
+                        // Handle NACK_FRAG packets (fragment retransmission requests)
+                        if kind == PacketKind::NackFrag {
+                            if let Some(ref tx) = control_tx {
+                                // Parse NACK_FRAG and send to control channel
+                                if let Some(nf_info) = parse_nack_frag_submessage(&temp_buf[..len])
+                                {
+                                    // Extract peer GUID prefix from RTPS header
+                                    let mut peer_guid_prefix = [0u8; 12];
+                                    if len >= 20 {
+                                        peer_guid_prefix.copy_from_slice(&temp_buf[8..20]);
+                                    }
+
+                                    if let Some(msg) = ControlMessage::nack_frag(
+                                        src_addr,
+                                        peer_guid_prefix,
+                                        nf_info.clone(),
+                                        &temp_buf[..len],
+                                    ) {
+                                        log::debug!(
                                 "[MCAST-RX] Sending NACK_FRAG to control channel: writer={:02x?} sn={} frags={:?} from {}",
                                 nf_info.writer_entity_id,
                                 nf_info.writer_sn,
                                 nf_info.missing_fragments,
                                 src_addr
                             );
-                                    if tx.try_send(msg).is_err() {
-                                        log::debug!(
+                                        if tx.try_send(msg).is_err() {
+                                            log::debug!(
                                     "[MCAST-RX] Control channel full, dropping NACK_FRAG from {}",
                                     src_addr
                                 );
+                                        }
                                     }
                                 }
+                                // Skip synchronous callback and pool for this NACK_FRAG
+                                continue;
                             }
-                            // Skip synchronous callback and pool for this NACK_FRAG
-                            continue;
+                            // No control_tx: fall through to pool-based processing
                         }
-                        // No control_tx: fall through to pool-based processing
-                    }
-
-                    // Invoke discovery callback for discovery packets (DATA/DATA_FRAG/SPDP/SEDP/TYPE_LOOKUP/Heartbeat)
-                    // RTI uses DATA_FRAG for SPDP announcements and builtin writers for SEDP.
-                    // v104: Also invoke for HEARTBEAT to enable SEDP NACK responses
-                    // Callback processes discovery synchronously before ring push
-                    // v0.4.0+: Panic boundary to prevent callback failures from killing listener thread
-                    // v202: HEARTBEATs with control_tx are handled above, skip here
-                    if matches!(
-                        kind,
-                        PacketKind::Data
-                            | PacketKind::DataFrag
-                            | PacketKind::SPDP
-                            | PacketKind::SEDP
-                            | PacketKind::TypeLookup
-                            | PacketKind::Heartbeat
-                    ) {
-                        if let Some(ref callback) = discovery_callback {
-                            if std::env::var("HDDS_INTEROP_DIAGNOSTICS").is_ok() {
-                                let head_len = len.min(16);
-                                log::debug!(
-                                    "[MCAST-RX] kind={} len={} src={} head={:02x?}",
-                                    kind_label,
-                                    len,
-                                    src_addr,
-                                    &temp_buf[..head_len]
-                                );
-                            }
-                            if std::env::var("HDDS_INTEROP_DIAGNOSTICS").is_ok() {
-                                let head_len = len.min(16);
-                                log::debug!(
-                                    "[MCAST-RX] kind={} len={} src={} head={:02x?}",
-                                    kind_label,
-                                    len,
-                                    src_addr,
-                                    &temp_buf[..head_len]
-                                );
-                            }
-                            // Extract CDR payload from RTPS packet using classifier-provided offset
-                            // For standard HDDS packets: offset = 20 (16-byte header + 4-byte submessage header)
-                            // For RTI packets after recovery: offset = variable (e.g., 24 if DATA at offset 20)
-                            //
-                            // v62: Fix fallback offset: 20 (RTPS header) + 24 (DATA submessage header) = 44
-                            // Previous value of 40 was 4 bytes short, reading tail of writerSeqNum as encapsulation
-                            const LEGACY_RTPS_DATA_PAYLOAD_OFFSET: usize = 44;
-                            let offset = payload_offset.unwrap_or(LEGACY_RTPS_DATA_PAYLOAD_OFFSET);
-
-                            if len >= offset {
-                                // v124: Pass full RTPS packet + offset to callback
-                                // Callback receives full packet (for DialectDetector) + offset (for CDR extraction)
-                                let full_packet = &temp_buf[..len];
 
-                                log::debug!(
+                        // Invoke discovery callback for discovery packets (DATA/DATA_FRAG/SPDP/SEDP/TYPE_LOOKUP/Heartbeat)
+                        // RTI uses DATA_FRAG for SPDP announcements and builtin writers for SEDP.
+                        // v104: Also invoke for HEARTBEAT to enable SEDP NACK responses
+                        // Callback processes discovery synchronously before ring push
+                        // v0.4.0+: Panic boundary to prevent callback failures from killing listener thread
+                        // v202: HEARTBEATs with control_tx are handled above, skip here
+                        if matches!(
+                            kind,
+                            PacketKind::Data
+                                | PacketKind::DataFrag
+                                | PacketKind::SPDP
+                                | PacketKind::SEDP
+                                | PacketKind::TypeLookup
+                                | PacketKind::Heartbeat
+                        ) {
+                            if let Some(ref callback) = discovery_callback {
+                                if std::env::var("HDDS_INTEROP_DIAGNOSTICS").is_ok() {
+                                    let head_len = len.min(16);
+                                    log::debug!(
+                                        "[MCAST-RX] kind={} len={} src={} head={:02x?}",
+                                        kind_label,
+                                        len,
+                                        src_addr,
+                                        &temp_buf[..head_len]
+                                    );
+                                }
+                                if std::env::var("HDDS_INTEROP_DIAGNOSTICS").is_ok() {
+                                    let head_len = len.min(16);
+                                    log::debug!(
+                                        "[MCAST-RX] kind={} len={} src={} head={:02x?}",
+                                        kind_label,
+                                        len,
+                                        src_addr,
+                                        &temp_buf[..head_len]
+                                    );
+                                }
+                                // Extract CDR payload from RTPS packet using classifier-provided offset
+                                // For standard HDDS packets: offset = 20 (16-byte header + 4-byte submessage header)
+                                // For RTI packets after recovery: offset = variable (e.g., 24 if DATA at offset 20)
+                                //
+                                // v62: Fix fallback offset: 20 (RTPS header) + 24 (DATA submessage header) = 44
+                                // Previous value of 40 was 4 bytes short, reading tail of writerSeqNum as encapsulation
+                                const LEGACY_RTPS_DATA_PAYLOAD_OFFSET: usize = 44;
+                                let offset =
+                                    payload_offset.unwrap_or(LEGACY_RTPS_DATA_PAYLOAD_OFFSET);
+
+                                if len >= offset {
+                                    // v124: Pass full RTPS packet + offset to callback
+                                    // Callback receives full packet (for DialectDetector) + offset (for CDR extraction)
+                                    let full_packet = &temp_buf[..len];
+
+                                    log::debug!(
                             "[callback] v124: Received DATA packet, len={}, cdr_offset={}, passing full packet",
                             len,
                             offset
                         );
 
-                                let callback_result =
-                                    std::panic::catch_unwind(std::panic::AssertUnwindSafe(|| {
-                                        callback(
-                                            kind,
-                                            full_packet,
-                                            offset,
-                                            fragment_metadata,
-                                            src_addr,
-                                        );
-                                    }));
+                                    let callback_result = std::panic::catch_unwind(
+                                        std::panic::AssertUnwindSafe(|| {
+                                            callback(
+                                                kind,
+                                                full_packet,
+                                                offset,
+                                                fragment_metadata,
+                                                src_addr,
+                                            );
+                                        }),
+                                    );
 
-                                if let Err(e) = callback_result {
-                                    metrics.callback_errors.fetch_add(1, Ordering::Relaxed);
+                                    if let Err(e) = callback_result {
+                                        metrics.callback_errors.fetch_add(1, Ordering::Relaxed);
+                                        log::debug!(
+                                            "[hdds-mcast-rx:{}] Discovery callback panicked: {:?}",
+                                            std::process::id(),
+                                            e
+                                        );
+                                        // Continue processing, don't crash listener thread
+                                    }
+                                } else {
                                     log::debug!(
-                                        "[hdds-mcast-rx:{}] Discovery callback panicked: {:?}",
-                                        std::process::id(),
-                                        e
-                                    );
-                                    // Continue processing, don't crash listener thread
-                                }
-                            } else {
-                                log::debug!(
                             "[hdds-mcast-rx] DATA packet too short for payload: {} bytes (need >= 44)",
                             len
                         );
+                                }
                             }
                         }
-                    }
-
-                    // Only process relevant packet types for ring buffer
-                    // SPDP/SEDP are handled by discovery callback above, not sent to ring
-                    if !matches!(
-                        kind,
-                        PacketKind::Data
-                            | PacketKind::DataFrag
-                            | PacketKind::Heartbeat
-                            | PacketKind::HeartbeatFrag
-                            | PacketKind::AckNack
-                            | PacketKind::SPDP
-                            | PacketKind::SEDP
-                    ) {
-                        continue;
-                    }
-
-                    // Skip SPDP/SEDP packets - they were already handled by discovery callback
-                    if matches!(kind, PacketKind::SPDP | PacketKind::SEDP) {
-                        continue;
-                    }
-
-                    // Acquire buffer from pool
-                    let buffer_id = match pool.acquire_for_listener() {
-                        Some(id) => id,
-                        None => {
-                            // Pool exhausted
-                            metrics.packets_dropped.fetch_add(1, Ordering::Relaxed);
-                            log::debug!(
+
+                        // Only process relevant packet types for ring buffer
+                        // SPDP/SEDP are handled by discovery callback above, not sent to ring
+                        if !matches!(
+                            kind,
+                            PacketKind::Data
+                                | PacketKind::DataFrag
+                                | PacketKind::Heartbeat
+                                | PacketKind::HeartbeatFrag
+                                | PacketKind::AckNack
+                                | PacketKind::SPDP
+                                | PacketKind::SEDP
+                        ) {
+                            continue;
+                        }
+
+                        // Skip SPDP/SEDP packets - they were already handled by discovery callback
+                        if matches!(kind, PacketKind::SPDP | PacketKind::SEDP) {
+                            continue;
+                        }
+
+                        // Acquire buffer from pool
+                        let buffer_id = match pool.acquire_for_listener() {
+                            Some(id) => id,
+                            None => {
+                                // Pool exhausted
+                                metrics.packets_dropped.fetch_add(1, Ordering::Relaxed);
+                                log::debug!(
                                 "[hdds-mcast-rx] Pool exhausted, dropping {:?} packet ({} bytes)",
                                 kind,
                                 len
                             );
-                            continue;
+                                continue;
+                            }
+                        };
+
+                        // Copy packet to pool buffer
+                        // SAFETY: buffer_id is valid (just acquired), no concurrent access
+                        unsafe {
+                            let pool_ptr = Arc::as_ptr(&pool);
+                            let buf = (*pool_ptr.cast_mut()).get_buffer_mut(buffer_id);
+                            buf[..len].copy_from_slice(&temp_buf[..len]);
                         }
-                    };
 
-                    // Copy packet to pool buffer
-                    // SAFETY: buffer_id is valid (just acquired), no concurrent access
-                    unsafe {
-                        let pool_ptr = Arc::as_ptr(&pool);
-                        let buf = (*pool_ptr.cast_mut()).get_buffer_mut(buffer_id);
-                        buf[..len].copy_from_slice(&temp_buf[..len]);
-                    }
-
-                    // Build metadata (including payload offset / fragment info when available)
-                    let mut meta = if let Some(offset) = payload_offset {
-                        if let Some(frag_meta) = fragment_metadata {
-                            RxMeta::new_with_fragment(src_addr, len, kind, offset, frag_meta)
+                        // Build metadata (including payload offset / fragment info when available)
+                        let mut meta = if let Some(offset) = payload_offset {
+                            if let Some(frag_meta) = fragment_metadata {
+                                RxMeta::new_with_fragment(src_addr, len, kind, offset, frag_meta)
+                            } else {
+                                RxMeta::new_with_offset(src_addr, len, kind, offset)
+                            }
                         } else {
-                            RxMeta::new_with_offset(src_addr, len, kind, offset)
-                        }
-                    } else {
-                        RxMeta::new(src_addr, len, kind)
-                    };
-                    // v61 Blocker #1: Apply accumulated RTPS context from INFO_DST/INFO_TS submessages
-                    meta.rtps_context = rtps_context;
-
-                    // v62: Log RTPS context propagation when non-empty (avoid unwrap in hot path)
-                    if let Some(dest_prefix) = rtps_context.destination_guid_prefix {
-                        log::debug!(
-                            "[RTPS-CONTEXT] Applied INFO_DST: dest_prefix={:02x?}",
-                            dest_prefix
-                        );
-                    }
-                    if let Some((sec, frac)) = rtps_context.source_timestamp {
-                        log::debug!(
-                            "[RTPS-CONTEXT] Applied INFO_TS: timestamp=({}, {})",
-                            sec,
-                            frac
-                        );
-                    }
+                            RxMeta::new(src_addr, len, kind)
+                        };
+                        // v61 Blocker #1: Apply accumulated RTPS context from INFO_DST/INFO_TS submessages
+                        meta.rtps_context = rtps_context;
 
-                    // Push to ring (non-blocking)
-                    if ring.push((meta, buffer_id)).is_err() {
-                        // Ring full, release buffer to avoid leak
-                        if let Err(e) = pool.release(buffer_id) {
+                        // v62: Log RTPS context propagation when non-empty (avoid unwrap in hot path)
+                        if let Some(dest_prefix) = rtps_context.destination_guid_prefix {
+                            log::debug!(
+                                "[RTPS-CONTEXT] Applied INFO_DST: dest_prefix={:02x?}",
+                                dest_prefix
+                            );
+                        }
+                        if let Some((sec, frac)) = rtps_context.source_timestamp {
                             log::debug!(
-                                "[hdds-mcast-rx] CRITICAL: Failed to release buffer {}: {}",
-                                buffer_id,
-                                e
+                                "[RTPS-CONTEXT] Applied INFO_TS: timestamp=({}, {})",
+                                sec,
+                                frac
                             );
                         }
-                        metrics.packets_dropped.fetch_add(1, Ordering::Relaxed);
-                        log::debug!("[hdds-mcast-rx] Ring full, dropping {:?} packet", kind);
-                    } else {
-                        // v211: Always notify to ensure router wakes from idle
-                        // The spin loop in router catches most hot traffic before condvar
-                        if let Some(ref n) = notifier {
-                            n.notify();
+
+                        // Push to ring (non-blocking)
+                        if ring.push((meta, buffer_id)).is_err() {
+                            // Ring full, release buffer to avoid leak
+                            if let Err(e) = pool.release(buffer_id) {
+                                log::debug!(
+                                    "[hdds-mcast-rx] CRITICAL: Failed to release buffer {}: {}",
+                                    buffer_id,
+                                    e
+                                );
+                            }
+                            metrics.packets_dropped.fetch_add(1, Ordering::Relaxed);
+                            log::debug!("[hdds-mcast-rx] Ring full, dropping {:?} packet", kind);
+                        } else {
+                            // v211: Always notify to ensure router wakes from idle
+                            // The spin loop in router catches most hot traffic before condvar
+                            if let Some(ref n) = notifier {
+                                n.notify();
+                            }
                         }
-                    }
+                    } // end batch
                 } // end inner drain loop
             } // end for event
         } // end while running
@@ -49,6 +49,7 @@ pub mod overlapped_sockets;
 pub mod pool;
 pub mod probe_metrics;
 pub mod rtps_packet;
+pub mod rx_batch;
 pub mod spdp;
 pub mod tiny_vec;
 
@@ -0,0 +1,161 @@
+// SPDX-License-Identifier: Apache-2.0 OR MIT
+// Copyright (c) 2025-2026 naskel.com
+
+//! Batched datagram receive for the listener drain loop.
+//!
+//! On Linux, [`RxBatch::recv`] pulls up to [`RX_BATCH_SIZE`] datagrams with a
+//! single `recvmmsg(2)` call, so a burst costs one syscall per batch instead of
+//! one per packet. Other platforms fall back to a single `recv_from` per call.
+//!
+//! Every slot must hold a full `MAX_PACKET_SIZE` datagram (a truncated
+//! datagram is lost), so the batch is kept small: each listener thread owns
+//! `RX_BATCH_SIZE * MAX_PACKET_SIZE` bytes of receive buffer.
+
+use std::io;
+use std::net::{Ipv4Addr, SocketAddr};
+
+/// Maximum number of datagrams returned by one [`RxBatch::recv`] call.
+pub const RX_BATCH_SIZE: usize = 4;
+
+/// Reusable receive buffers for one listener thread.
+pub struct RxBatch {
+    /// `RX_BATCH_SIZE` contiguous slots of `stride` bytes each
+    buf: Vec<u8>,
+    stride: usize,
+    lens: [usize; RX_BATCH_SIZE],
+    addrs: [SocketAddr; RX_BATCH_SIZE],
+}
+
+impl RxBatch {
+    /// Allocate receive slots large enough for `max_packet` byte datagrams.
+    pub fn new(max_packet: usize) -> Self {
+        crate::trace_fn!("RxBatch::new");
+        Self {
+            buf: vec![0u8; max_packet * RX_BATCH_SIZE],
+            stride: max_packet,
+            lens: [0; RX_BATCH_SIZE],
+            addrs: [SocketAddr::from((Ipv4Addr::UNSPECIFIED, 0)); RX_BATCH_SIZE],
+        }
+    }
+
+    /// Receive up to [`RX_BATCH_SIZE`] datagrams without blocking.
+    ///
+    /// Returns the number of datagrams stored (at least 1), readable through
+    /// [`RxBatch::datagram`]. Returns `WouldBlock` when the socket is drained.
+    #[cfg(target_os = "linux")]
+    pub fn recv(&mut self, socket: &mio::net::UdpSocket) -> io::Result<usize> {
+        use std::os::unix::io::AsRawFd;
+
+        // SAFETY: all-zero is a valid bit pattern for these plain C structs.
+        let mut names: [libc::sockaddr_storage; RX_BATCH_SIZE] = unsafe { std::mem::zeroed() };
+        let mut iovecs: [libc::iovec; RX_BATCH_SIZE] = unsafe { std::mem::zeroed() };
+        let mut msgs: [libc::mmsghdr; RX_BATCH_SIZE] = unsafe { std::mem::zeroed() };
+
+        for (slot, iov) in self
+            .buf
+            .chunks_exact_mut(self.stride)
+            .zip(iovecs.iter_mut())
+        {
+            iov.iov_base = slot.as_mut_ptr().cast();
+            iov.iov_len = slot.len();
+        }
+        for ((msg, iov), name) in msgs.iter_mut().zip(iovecs.iter_mut()).zip(names.iter_mut()) {
+            msg.msg_hdr.msg_name = (name as *mut libc::sockaddr_storage).cast();
+            msg.msg_hdr.msg_namelen = std::mem::size_of::<libc::sockaddr_storage>() as _;
+            msg.msg_hdr.msg_iov = iov as *mut libc::iovec;
+            msg.msg_hdr.msg_iovlen = 1;
+        }
+
+        // SAFETY: every mmsghdr points at a live iovec and sockaddr_storage on
+        // this stack frame, and every iovec at a distinct `stride`-byte slot
+        // of self.buf; none of them outlive this call.
+        let received = unsafe {
+            libc::recvmmsg(
+                socket.as_raw_fd(),
+                msgs.as_mut_ptr(),
+                RX_BATCH_SIZE as _,
+                libc::MSG_DONTWAIT as _,
+                std::ptr::null_mut(),
+            )
+        };
+        if received < 0 {
+            return Err(io::Error::last_os_error());
+        }
+
+        let received = received as usize;
+        for (i, (msg, name)) in msgs.iter().zip(names.iter()).take(received).enumerate() {
+            self.lens[i] = msg.msg_len as usize;
+            // SAFETY: the kernel filled `name` with `msg_namelen` valid bytes.
+            let addr = unsafe { socket2::SockAddr::new(*name, msg.msg_hdr.msg_namelen) };
+            self.addrs[i] = addr
+                .as_socket()
+                .unwrap_or_else(|| SocketAddr::from((Ipv4Addr::UNSPECIFIED, 0)));
+        }
+        Ok(received)
+    }
+
+    /// Receive one datagram without blocking (portable fallback).
+    ///
+    /// Returns 1 on success, `WouldBlock` when the socket is drained.
+    #[cfg(not(target_os = "linux"))]
+    pub fn recv(&mut self, socket: &mio::net::UdpSocket) -> io::Result<usize> {
+        let (len, addr) = socket.recv_from(&mut self.buf[..self.stride])?;
+        self.lens[0] = len;
+        self.addrs[0] = addr;
+        Ok(1)
+    }
+
+    /// Datagram `index` of the last [`RxBatch::recv`] call.
+    ///
+    /// Returns the receive slot, the datagram length within it, and the source
+    /// address. `index` must be below the count returned by `recv`.
+    pub fn datagram(&self, index: usize) -> (&[u8], usize, SocketAddr) {
+        let start = index * self.stride;
+        (
+            &self.buf[start..start + self.stride],
+            self.lens[index],
+            self.addrs[index],
+        )
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_recv_drains_queued_datagrams() {
+        let rx = mio::net::UdpSocket::bind("127.0.0.1:0".parse().expect("addr")).expect("bind rx");
+        let tx = std::net::UdpSocket::bind("127.0.0.1:0").expect("bind tx");
+        let rx_addr = rx.local_addr().expect("rx addr");
+        for payload in [&b"one"[..], b"two", b"three"] {
+            tx.send_to(payload, rx_addr).expect("send");
+        }
+
+        let mut batch = RxBatch::new(64);
+        let mut got = Vec::new();
+        for _ in 0..1000 {
+            match batch.recv(&rx) {
+                Ok(count) => {
+                    assert!((1..=RX_BATCH_SIZE).contains(&count));
+                    for i in 0..count {
+                        let (buf, len, src) = batch.datagram(i);
+                        assert_eq!(src, tx.local_addr().expect("tx addr"));
+                        got.push(buf[..len].to_vec());
+                    }
+                }
+                Err(e) if e.kind() == io::ErrorKind::WouldBlock => {
+                    if got.len() == 3 {
+                        break;
+                    }
+                    std::thread::sleep(std::time::Duration::from_millis(1));
+                }
+                Err(e) => panic!("recv failed: {e}"),
+            }
+        }
+        assert_eq!(
+            got,
+            vec![b"one".to_vec(), b"two".to_vec(), b"three".to_vec()]
+        );
+    }
+}
@@ -189,14 +189,17 @@ mod platform {
         handle: &EventHandle,
         timeout: Option<Duration>,
     ) -> Result<(), WaitsetWaitError> {
-        let timeout_ms = timeout
-            .and_then(|d| {
-                d.as_millis()
-                    .try_into()
-                    .ok()
-                    .map(|ms: i32| if ms < 0 { i32::MAX } else { ms })
+        // ppoll takes a timespec, so sub-millisecond timeouts are honoured
+        // instead of being truncated to 0 ms (an immediate timeout) by poll.
+        let timeout_ts = timeout.and_then(|d| {
+            Some(libc::timespec {
+                tv_sec: d.as_secs().try_into().ok()?,
+                tv_nsec: d.subsec_nanos().try_into().ok()?,
             })
-            .unwrap_or(-1);
+        });
+        let timeout_ptr = timeout_ts
+            .as_ref()
+            .map_or(std::ptr::null(), |ts| ts as *const libc::timespec);
 
         let mut pollfd = libc::pollfd {
             fd: *handle,
@@ -205,9 +208,10 @@ mod platform {
         };
 
         loop {
-            // SAFETY: poll_target points to our stack-allocated pollfd structure.
+            // SAFETY: poll_target points to our stack-allocated pollfd structure;
+            // timeout_ptr is null (block forever) or points to timeout_ts.
             let poll_target = std::ptr::addr_of_mut!(pollfd);
-            let res = unsafe { libc::poll(poll_target, 1, timeout_ms) };
+            let res = unsafe { libc::ppoll(poll_target, 1, timeout_ptr, std::ptr::null()) };
             if res == 0 {
                 return Err(WaitsetWaitError::Timeout);
             }
@@ -319,12 +323,12 @@ mod platform {
         handle: &EventHandle,
         timeout: Option<Duration>,
     ) -> Result<(), WaitsetWaitError> {
+        // poll() takes whole milliseconds: round up, so a sub-millisecond
+        // timeout still sleeps instead of turning into a busy 0 ms poll.
         let timeout_ms = timeout
-            .and_then(|d| {
-                d.as_millis()
-                    .try_into()
-                    .ok()
-                    .map(|ms: i32| if ms < 0 { i32::MAX } else { ms })
+            .map(|d| {
+                let ms = d.as_nanos().div_ceil(1_000_000);
+                i32::try_from(ms).unwrap_or(i32::MAX)
             })
             .unwrap_or(-1);
 
@@ -381,6 +385,12 @@ mod platform {
             // SAFETY: buf is a stack buffer; we drain all pending bytes from the read end.
             let ret = unsafe { libc::read(handle.read_fd, buf.as_mut_ptr().cast(), buf.len()) };
             if ret > 0 {
+                if (ret as usize) < buf.len() {
+                    // Short read: the pipe is empty. Signals are coalesced
+                    // through the slot bitmap, so this is the common case
+                    // and saves the extra read that would return EAGAIN.
+                    break;
+                }
                 continue; // drain more
             }
             if ret == 0 {
@@ -47,3 +47,19 @@ fn signal_multiple_slots_once() {
 
     assert_eq!(signaled, vec![slot_a, slot_b]);
 }
+
+#[cfg(target_os = "linux")]
+#[test]
+fn sub_millisecond_timeout_is_not_truncated() {
+    use super::WaitsetWaitError;
+    use std::time::Instant;
+
+    let driver = WaitsetDriver::new(8).expect("driver");
+    let timeout = Duration::from_micros(500);
+
+    let start = Instant::now();
+    let result = driver.wait(Some(timeout));
+
+    assert!(matches!(result, Err(WaitsetWaitError::Timeout)));
+    assert!(start.elapsed() >= timeout);
+}
@@ -11,7 +11,7 @@
 use crate::core::discovery::multicast::SedpEndpointKind;
 use crate::core::discovery::GUID;
 use crate::protocol::discovery::SedpData;
-use std::sync::{Arc, RwLock};
+use std::sync::{Arc, OnceLock, RwLock};
 
 /// SEDP announcements cache type.
 ///
@@ -92,9 +92,18 @@ pub(super) fn generate_guid(participant_id: u8, entity_id: [u8; 4]) -> GUID {
 
 /// Get host ID from local IPv4 or timestamp fallback.
 ///
+/// Probed once per process and cached: the probe opens and connects a UDP
+/// socket, which would otherwise be repeated for every participant created.
+fn get_host_id() -> [u8; 4] {
+    static HOST_ID: OnceLock<[u8; 4]> = OnceLock::new();
+    *HOST_ID.get_or_init(probe_host_id)
+}
+
+/// Probe host ID from local IPv4 or timestamp fallback.
+///
 /// Tries to connect to 8.8.8.8:80 to get local IPv4 address octets.
 /// Falls back to timestamp-based random if network unavailable.
-fn get_host_id() -> [u8; 4] {
+fn probe_host_id() -> [u8; 4] {
     if let Ok(Ok(std::net::SocketAddr::V4(v4addr))) = std::net::UdpSocket::bind("0.0.0.0:0")
         .and_then(|s| s.connect("8.8.8.8:80").map(|_| s.local_addr()))
     {
@@ -127,6 +136,13 @@ mod tests {
         assert_eq!(guard.len(), 0);
     }
 
+    #[test]
+    fn test_host_id_is_cached() {
+        let first = generate_guid(1, [0x00, 0x00, 0x01, 0xc1]);
+        let second = generate_guid(2, [0x00, 0x00, 0x01, 0xc1]);
+        assert_eq!(first.as_bytes()[2..6], second.as_bytes()[2..6]);
+    }
+
     #[test]
     fn test_guid_generation() {
         let participant_id = 42;
@@ -17,6 +17,11 @@
 //! read()  -> peek from take_cursor, marks sample as READ
 //! take()  -> removes sample, advances take_cursor
 //! ```
+//!
+//! The buffer length is mirrored in an atomic after every change made under
+//! the lock, so `is_empty()` and the take paths answer "no data" with a
+//! single atomic load. A reader draining until empty only locks while there
+//! is something to take.
 
 use parking_lot::Mutex;
 use std::collections::VecDeque;
@@ -137,6 +142,8 @@ impl<T> CachedSample<T> {
 pub struct SampleCache<T> {
     /// Ring buffer of cached samples.
     buffer: Mutex<VecDeque<CachedSample<T>>>,
+    /// `buffer.len()` as of the last change, readable without the lock.
+    len: AtomicUsize,
     /// Read cursor position (for read operations).
     /// Samples before this cursor have been read at least once.
     read_cursor: AtomicUsize,
@@ -151,6 +158,7 @@ impl<T> SampleCache<T> {
     pub fn new(max_samples: usize) -> Self {
         Self {
             buffer: Mutex::new(VecDeque::with_capacity(max_samples)),
+            len: AtomicUsize::new(0),
             read_cursor: AtomicUsize::new(0),
             max_samples,
             total_received: AtomicUsize::new(0),
@@ -180,18 +188,19 @@ impl<T> SampleCache<T> {
         }
 
         buffer.push_back(sample);
+        self.len.store(buffer.len(), Ordering::Release);
         self.total_received.fetch_add(1, Ordering::Relaxed);
     }
 
     /// Number of samples currently in cache.
     #[allow(dead_code)] // DDS API - diagnostics
     pub fn len(&self) -> usize {
-        self.buffer.lock().len()
+        self.len.load(Ordering::Acquire)
     }
 
-    /// Check if cache is empty.
+    /// Check if cache is empty (lock-free).
     pub fn is_empty(&self) -> bool {
-        self.buffer.lock().is_empty()
+        self.len() == 0
     }
 
     /// Total samples received since creation.
@@ -207,13 +216,13 @@ impl<T> SampleCache<T> {
     /// Returns and removes the oldest sample.
     /// Returns `None` if cache is empty.
     pub fn take(&self) -> Option<T> {
-        let mut buffer = self.buffer.lock();
-
-        if buffer.is_empty() {
+        if self.is_empty() {
             return None;
         }
 
+        let mut buffer = self.buffer.lock();
         let sample = buffer.pop_front()?;
+        self.len.store(buffer.len(), Ordering::Release);
 
         // Adjust read cursor
         let cursor = self.read_cursor.load(Ordering::Relaxed);
@@ -227,6 +236,10 @@ impl<T> SampleCache<T> {
     /// Take up to `max` samples, removing them from cache.
     #[allow(dead_code)] // DDS API - batch operations
     pub fn take_batch(&self, max: usize) -> Vec<T> {
+        if self.is_empty() {
+            return Vec::new();
+        }
+
         let mut buffer = self.buffer.lock();
         let count = max.min(buffer.len());
         let mut result = Vec::with_capacity(count);
@@ -236,6 +249,7 @@ impl<T> SampleCache<T> {
                 result.push(sample.data);
             }
         }
+        self.len.store(buffer.len(), Ordering::Release);
 
         // Reset read cursor (samples removed from front)
         let cursor = self.read_cursor.load(Ordering::Relaxed);
@@ -245,6 +259,40 @@ impl<T> SampleCache<T> {
         result
     }
 
+    /// Take up to `max` samples, stopping at the first one `accept` rejects.
+    ///
+    /// The rejected sample (and everything after it) stays in the cache, so a
+    /// caller with a bounded output buffer never drops data it cannot hold.
+    pub fn take_batch_while<F>(&self, max: usize, mut accept: F) -> Vec<T>
+    where
+        F: FnMut(&T) -> bool,
+    {
+        if self.is_empty() {
+            return Vec::new();
+        }
+
+        let mut buffer = self.buffer.lock();
+        let mut result = Vec::with_capacity(max.min(buffer.len()));
+
+        while result.len() < max {
+            match buffer.front() {
+                Some(sample) if accept(&sample.data) => {}
+                _ => break,
+            }
+            if let Some(sample) = buffer.pop_front() {
+                result.push(sample.data);
+            }
+        }
+        self.len.store(buffer.len(), Ordering::Release);
+
+        // Reset read cursor (samples removed from front)
+        let cursor = self.read_cursor.load(Ordering::Relaxed);
+        let new_cursor = cursor.saturating_sub(result.len());
+        self.read_cursor.store(new_cursor, Ordering::Relaxed);
+
+        result
+    }
+
     /// Reset read cursor to beginning (re-read all samples).
     #[allow(dead_code)] // DDS API - cursor management
     pub fn reset_read_cursor(&self) {
@@ -256,6 +304,7 @@ impl<T> SampleCache<T> {
     pub fn clear(&self) {
         let mut buffer = self.buffer.lock();
         buffer.clear();
+        self.len.store(0, Ordering::Release);
         self.read_cursor.store(0, Ordering::Relaxed);
     }
 
@@ -277,6 +326,7 @@ impl<T> SampleCache<T> {
         let pos = buffer.iter().position(|s| s.instance_handle == handle)?;
 
         let sample = buffer.remove(pos)?;
+        self.len.store(buffer.len(), Ordering::Release);
 
         // Adjust read cursor if we removed a sample before it
         let cursor = self.read_cursor.load(Ordering::Relaxed);
@@ -319,6 +369,7 @@ impl<T> SampleCache<T> {
                 }
             }
         }
+        self.len.store(buffer.len(), Ordering::Release);
 
         // Adjust read cursor
         if removed_before_cursor > 0 {
@@ -510,6 +561,59 @@ mod tests {
         assert_eq!(cache.len(), 0);
     }
 
+    #[test]
+    fn test_take_batch_while() {
+        let cache: SampleCache<i32> = SampleCache::new(10);
+
+        for i in 1..=5 {
+            cache.push(CachedSample::new(i, i as u64, 0));
+        }
+
+        let mut budget = 6;
+        let batch = cache.take_batch_while(10, |v| {
+            if *v > budget {
+                return false;
+            }
+            budget -= *v;
+            true
+        });
+        assert_eq!(batch, vec![1, 2, 3]);
+        assert_eq!(cache.len(), 2);
+
+        let batch = cache.take_batch_while(1, |_| true);
+        assert_eq!(batch, vec![4]);
+        assert_eq!(cache.take(), Some(5));
+    }
+
+    #[test]
+    fn test_len_tracks_every_removal() {
+        let cache: SampleCache<i32> = SampleCache::new(10);
+        let h1 = make_handle(1);
+        assert!(cache.is_empty());
+        assert_eq!(cache.take(), None);
+        assert!(cache.take_batch(4).is_empty());
+
+        for i in 1..=6 {
+            cache.push(CachedSample::with_instance(i, i as u64, 0, h1));
+        }
+        assert_eq!(cache.len(), 6);
+
+        cache.take();
+        assert_eq!(cache.len(), 5);
+        cache.take_batch(2);
+        assert_eq!(cache.len(), 3);
+        cache.take_batch_while(1, |_| true);
+        assert_eq!(cache.len(), 2);
+        cache.take_instance(h1);
+        assert_eq!(cache.len(), 1);
+        cache.take_instance_batch(h1, 10);
+        assert!(cache.is_empty());
+
+        cache.push(CachedSample::new(7, 7, 0));
+        cache.clear();
+        assert!(cache.is_empty());
+    }
+
     #[test]
     fn test_read_batch() {
         let cache: SampleCache<i32> = SampleCache::new(10);
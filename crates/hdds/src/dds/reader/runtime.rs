@@ -235,6 +235,27 @@ impl<T: DDS> DataReader<T> {
         Ok(messages)
     }
 
+    /// Take up to `max` samples under one cache lock, stopping at the first
+    /// sample `accept` rejects; that sample remains available to later takes.
+    pub fn take_batch_while<F>(&self, max: usize, accept: F) -> Result<Vec<T>>
+    where
+        F: FnMut(&T) -> bool,
+    {
+        self.pump_ring_to_cache()?;
+        Ok(self.cache.take_batch_while(max, accept))
+    }
+
+    /// Whether a `take()` would currently return a sample.
+    ///
+    /// Moves pending samples from the network ring into the cache first, so
+    /// the answer covers data that has arrived but not been taken yet. Never
+    /// blocks; intended for drain loops that should stop as soon as the
+    /// reader is empty instead of waiting out a timeout.
+    pub fn has_data(&self) -> Result<bool> {
+        self.pump_ring_to_cache()?;
+        Ok(!self.cache.is_empty())
+    }
+
     // =========================================================================
     // DDS Standard API (v0.9+)
     // =========================================================================
@@ -26,6 +26,14 @@
 //!   │                                   │
 //!   ├──DATA retransmit────────────────▶
 //! ```
+//!
+//! ## Coalescing with the write path
+//!
+//! While the application is writing, `DataWriter::write()` already emits a
+//! HEARTBEAT right after the DATA it sends. The writer records that send in
+//! [`HeartbeatSchedulerState::mark_sent`], and the periodic thread skips any
+//! tick that falls within one period of it, so an active writer carries its
+//! heartbeats on its data traffic and the thread only speaks when it is idle.
 
 use crate::protocol::builder::{self, RtpsEndpointContext};
 use crate::reliability::HistoryCache;
@@ -33,7 +41,7 @@ use crate::transport::UdpTransport;
 use std::sync::atomic::{AtomicBool, AtomicU32, AtomicU64, Ordering};
 use std::sync::Arc;
 use std::thread::{self, JoinHandle};
-use std::time::Duration;
+use std::time::{Duration, Instant};
 
 /// Default heartbeat period in milliseconds (RTPS recommendation: 100ms)
 pub const DEFAULT_HEARTBEAT_PERIOD_MS: u64 = 100;
@@ -47,6 +55,10 @@ pub struct HeartbeatSchedulerState {
     pub stop: AtomicBool,
     /// Heartbeat counter (monotonically increasing per RTPS spec)
     pub count: AtomicU32,
+    /// Time of the last HEARTBEAT sent from the write path, in nanoseconds
+    /// since `epoch` (0 = none yet)
+    last_sent_ns: AtomicU64,
+    epoch: Instant,
 }
 
 impl HeartbeatSchedulerState {
@@ -56,6 +68,8 @@ impl HeartbeatSchedulerState {
             last_seq: AtomicU64::new(0),
             stop: AtomicBool::new(false),
             count: AtomicU32::new(1),
+            last_sent_ns: AtomicU64::new(0),
+            epoch: Instant::now(),
         }
     }
 
@@ -64,6 +78,23 @@ impl HeartbeatSchedulerState {
         self.last_seq.store(seq, Ordering::Release);
     }
 
+    /// Record that the writer just sent a HEARTBEAT alongside its data.
+    pub fn mark_sent(&self) {
+        // Clamp to 1 so a send at the epoch instant still counts as recorded
+        let now_ns = self.epoch.elapsed().as_nanos().max(1) as u64;
+        self.last_sent_ns.store(now_ns, Ordering::Relaxed);
+    }
+
+    /// Whether the write path sent a HEARTBEAT less than `period` ago.
+    pub fn sent_within(&self, period: Duration) -> bool {
+        let last_ns = self.last_sent_ns.load(Ordering::Relaxed);
+        if last_ns == 0 {
+            return false;
+        }
+        let now_ns = self.epoch.elapsed().as_nanos() as u64;
+        now_ns.saturating_sub(last_ns) < period.as_nanos() as u64
+    }
+
     /// Signal the thread to stop.
     pub fn signal_stop(&self) {
         self.stop.store(true, Ordering::Release);
@@ -180,6 +211,11 @@ fn heartbeat_loop(
             continue;
         }
 
+        if state.sent_within(period) {
+            // The write path already sent one this period
+            continue;
+        }
+
         let first_seq = history_cache.oldest_seq().unwrap_or(1);
         let count = state.next_count();
 
@@ -226,6 +262,16 @@ mod tests {
         assert!(state.should_stop());
     }
 
+    #[test]
+    fn test_state_sent_within() {
+        let state = HeartbeatSchedulerState::new();
+        assert!(!state.sent_within(Duration::from_secs(60)));
+
+        state.mark_sent();
+        assert!(state.sent_within(Duration::from_secs(60)));
+        assert!(!state.sent_within(Duration::ZERO));
+    }
+
     #[test]
     fn test_state_count_increment() {
         let state = HeartbeatSchedulerState::new();
@@ -662,7 +662,14 @@ impl<T: DDS> DataWriter<T> {
         };
         if let Err(e) = transport.send(&rtps_packet) {
             log::debug!("Failed to send Heartbeat: {}", e);
-        } else if let Some(ref metrics) = self.reliable_metrics {
+            return;
+        }
+
+        // Lets the periodic thread skip its next tick while data is flowing
+        if let Some(ref scheduler) = self._heartbeat_scheduler {
+            scheduler.state().mark_sent();
+        }
+        if let Some(ref metrics) = self.reliable_metrics {
             metrics.increment_heartbeats_sent(1);
         }
     }
@@ -17,15 +17,28 @@ use std::net::{SocketAddr, TcpListener, TcpStream};
 use std::sync::atomic::{AtomicBool, Ordering};
 use std::sync::{Arc, Mutex};
 use std::thread;
-use std::time::Duration;
+use std::time::{Duration, Instant};
 
 /// Telemetry exporter: binary fixed-width LE over TCP admin port.
 ///
 /// Starts a TCP server on the specified port and pushes telemetry frames
 /// to connected clients at 10 Hz (100ms interval).
+///
+/// Frames can optionally be coalesced (see [`Exporter::start_buffered`]) so
+/// that bursts of pushes reach each client in one write instead of one
+/// write per frame.
 pub struct Exporter {
     clients: Arc<Mutex<Vec<TcpStream>>>,
     shutdown: Arc<AtomicBool>,
+    pending: Arc<Mutex<PendingFrames>>,
+    chunk_bytes: usize,
+    flush_interval: Duration,
+}
+
+/// Encoded frames waiting to be sent to clients.
+struct PendingFrames {
+    buf: Vec<u8>,
+    last_flush: Instant,
 }
 
 impl Exporter {
@@ -41,6 +54,29 @@ impl Exporter {
     /// # Performance
     /// Non-blocking server, accepts multiple concurrent clients.
     pub fn start(bind_addr: &str, port: u16) -> io::Result<Self> {
+        Self::start_buffered(bind_addr, port, 0, Duration::ZERO)
+    }
+
+    /// Start exporter that coalesces frames before writing to clients.
+    ///
+    /// Encoded frames accumulate until `chunk_bytes` are pending or
+    /// `flush_interval` has elapsed since the last flush, then go out in a
+    /// single write per client. The interval is checked on each push and
+    /// by the accept thread (every ~10 ms), so a queued frame is sent even
+    /// if no further push follows. `chunk_bytes == 0` sends every frame
+    /// immediately, like [`Exporter::start`].
+    ///
+    /// # Arguments
+    /// - `bind_addr`: IP address to bind (e.g., "127.0.0.1")
+    /// - `port`: TCP port (typically 4242)
+    /// - `chunk_bytes`: Flush threshold in bytes (e.g., 4096)
+    /// - `flush_interval`: Maximum time between flushes (e.g., 50 ms)
+    pub fn start_buffered(
+        bind_addr: &str,
+        port: u16,
+        chunk_bytes: usize,
+        flush_interval: Duration,
+    ) -> io::Result<Self> {
         let addr = format_string(format_args!("{}:{}", bind_addr, port));
         let addr: SocketAddr = addr.parse().map_err(|e| {
             io::Error::new(
@@ -64,21 +100,39 @@ impl Exporter {
 
         let clients = Arc::new(Mutex::new(Vec::new()));
         let shutdown = Arc::new(AtomicBool::new(false));
+        let pending = Arc::new(Mutex::new(PendingFrames {
+            buf: Vec::with_capacity(chunk_bytes),
+            last_flush: Instant::now(),
+        }));
 
         let clients_clone = Arc::clone(&clients);
         let shutdown_clone = Arc::clone(&shutdown);
+        let pending_clone = Arc::clone(&pending);
 
-        // Spawn accept thread.
+        // Spawn accept thread (also flushes frames older than flush_interval).
         thread::spawn(move || {
-            accept_loop(listener, clients_clone, shutdown_clone);
+            accept_loop(
+                listener,
+                clients_clone,
+                shutdown_clone,
+                pending_clone,
+                flush_interval,
+            );
         });
 
-        Ok(Self { clients, shutdown })
+        Ok(Self {
+            clients,
+            shutdown,
+            pending,
+            chunk_bytes,
+            flush_interval,
+        })
     }
 
     /// Push telemetry frame to all connected clients.
     ///
-    /// Encodes frame to binary LE format and sends to all clients.
+    /// Encodes frame to binary LE format and sends to all clients, or queues
+    /// it when the exporter buffers (see [`Exporter::start_buffered`]).
     /// Disconnected clients are removed automatically.
     ///
     /// # Performance
@@ -89,20 +143,32 @@ impl Exporter {
             Err(_) => return,
         };
 
-        let mut clients = match self.clients.lock() {
-            Ok(lock) => lock,
-            Err(e) => {
-                log::debug!("[Exporter::push] clients lock poisoned, recovering");
-                e.into_inner()
-            }
-        };
+        let mut pending = self.lock_pending();
+        pending.buf.extend_from_slice(&bytes);
+
+        if pending.buf.len() < self.chunk_bytes
+            && pending.last_flush.elapsed() < self.flush_interval
+        {
+            return;
+        }
+        flush_pending(&self.clients, &mut pending);
+    }
 
-        // Send to all clients, remove disconnected ones.
-        clients.retain_mut(|client| client.write_all(&bytes).is_ok());
+    /// Send any queued frames to clients now.
+    pub fn flush(&self) {
+        let mut pending = self.lock_pending();
+        flush_pending(&self.clients, &mut pending);
+    }
+
+    fn lock_pending(&self) -> std::sync::MutexGuard<'_, PendingFrames> {
+        lock_pending(&self.pending)
     }
 
     /// Shutdown exporter and close all connections.
+    ///
+    /// Queued frames are flushed first.
     pub fn shutdown(&self) {
+        self.flush();
         self.shutdown.store(true, Ordering::Relaxed);
 
         // Close all client connections.
@@ -117,16 +183,57 @@ impl Exporter {
     }
 }
 
+fn lock_pending(pending: &Mutex<PendingFrames>) -> std::sync::MutexGuard<'_, PendingFrames> {
+    match pending.lock() {
+        Ok(lock) => lock,
+        Err(e) => {
+            log::debug!("[Exporter] pending lock poisoned, recovering");
+            e.into_inner()
+        }
+    }
+}
+
+/// Write queued frames to every client. Lock order: pending, then clients.
+fn flush_pending(clients: &Mutex<Vec<TcpStream>>, pending: &mut PendingFrames) {
+    pending.last_flush = Instant::now();
+    if pending.buf.is_empty() {
+        return;
+    }
+
+    let mut clients = match clients.lock() {
+        Ok(lock) => lock,
+        Err(e) => {
+            log::debug!("[Exporter] clients lock poisoned, recovering");
+            e.into_inner()
+        }
+    };
+
+    // Send to all clients, remove disconnected ones.
+    clients.retain_mut(|client| client.write_all(&pending.buf).is_ok());
+    pending.buf.clear();
+}
+
 fn accept_loop(
     listener: TcpListener,
     clients: Arc<Mutex<Vec<TcpStream>>>,
     shutdown: Arc<AtomicBool>,
+    pending: Arc<Mutex<PendingFrames>>,
+    flush_interval: Duration,
 ) {
     loop {
         if shutdown.load(Ordering::Relaxed) {
             break;
         }
 
+        // Max-age flush: frames queued by a push that did not reach the
+        // threshold must not wait for the next push.
+        {
+            let mut pending = lock_pending(&pending);
+            if !pending.buf.is_empty() && pending.last_flush.elapsed() >= flush_interval {
+                flush_pending(&clients, &mut pending);
+            }
+        }
+
         // Try accept (non-blocking).
         match listener.accept() {
             Ok((stream, _addr)) => {
@@ -238,4 +345,64 @@ mod tests {
 
         exporter.shutdown();
     }
+
+    #[test]
+    fn test_exporter_buffered_coalesces_frames() {
+        use std::io::Read;
+
+        let exporter = Exporter::start_buffered("127.0.0.1", 0, 4096, Duration::from_secs(60))
+            .expect("Exporter should bind to random port");
+
+        // Register a connected client directly (the accept loop is not
+        // needed to exercise the buffering path).
+        let listener = TcpListener::bind("127.0.0.1:0").expect("bind");
+        let mut reader = TcpStream::connect(listener.local_addr().expect("addr")).expect("connect");
+        let (writer, _) = listener.accept().expect("accept");
+        exporter.clients.lock().expect("clients").push(writer);
+
+        let frame = Frame::new(0);
+        exporter.push(&frame);
+        exporter.push(&frame);
+
+        // Below threshold and interval: nothing sent yet.
+        assert_eq!(exporter.lock_pending().buf.len(), 32);
+
+        exporter.flush();
+        let mut received = [0u8; 32];
+        reader.read_exact(&mut received).expect("read");
+        assert!(exporter.lock_pending().buf.is_empty());
+
+        exporter.shutdown();
+    }
+
+    #[test]
+    fn test_exporter_buffered_flushes_on_interval() {
+        use std::io::Read;
+
+        let exporter = Exporter::start_buffered("127.0.0.1", 0, 4096, Duration::from_millis(200))
+            .expect("Exporter should bind to random port");
+
+        let listener = TcpListener::bind("127.0.0.1:0").expect("bind");
+        let mut reader = TcpStream::connect(listener.local_addr().expect("addr")).expect("connect");
+        reader
+            .set_read_timeout(Some(Duration::from_secs(2)))
+            .expect("timeout");
+        let (writer, _) = listener.accept().expect("accept");
+        exporter.clients.lock().expect("clients").push(writer);
+
+        // A single frame, below the byte threshold and never followed by
+        // another push: the accept thread's timer must send it. The flush
+        // restarts the interval so the push itself does not send it.
+        exporter.flush();
+        exporter.push(&Frame::new(0));
+        assert_eq!(exporter.lock_pending().buf.len(), 16);
+
+        let mut received = [0u8; 16];
+        reader
+            .read_exact(&mut received)
+            .expect("frame flushed by timer");
+        assert!(exporter.lock_pending().buf.is_empty());
+
+        exporter.shutdown();
+    }
 }
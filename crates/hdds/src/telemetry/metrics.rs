@@ -168,6 +168,25 @@ impl MetricsCollector {
         }
     }
 
+    /// Add a batch of latency samples under a single lock acquisition
+    ///
+    /// # Arguments
+    /// - `start_ns`: Start timestamps (nanoseconds)
+    /// - `end_ns`: End timestamps (nanoseconds), paired by index with `start_ns`
+    ///
+    /// Equivalent to calling [`add_latency_sample`](Self::add_latency_sample)
+    /// for each pair; extra elements in the longer slice are ignored.
+    pub fn add_latency_samples(&self, start_ns: &[u64], end_ns: &[u64]) {
+        if let Ok(mut samples) = self.latency_samples.lock() {
+            for (&start, &end) in start_ns.iter().zip(end_ns) {
+                if samples.len() >= self.max_samples {
+                    samples.pop_front(); // Drop oldest if full
+                }
+                samples.push_back(end.saturating_sub(start));
+            }
+        }
+    }
+
     /// Snapshot current metrics into a Frame
     ///
     /// # Returns
@@ -206,6 +225,37 @@ impl MetricsCollector {
     pub fn latency_sample_count(&self) -> usize {
         self.latency_samples.lock().map(|s| s.len()).unwrap_or(0)
     }
+
+    /// Bucket the retained latency samples into a power-of-two histogram
+    ///
+    /// Bucket 0 counts zero latencies; bucket `i > 0` counts latencies in
+    /// `[2^(i-1), 2^i)` nanoseconds. The last bucket is open-ended: samples
+    /// beyond it are counted in it. Unlike [`snapshot`](Self::snapshot), no
+    /// sort is needed, and histograms from several collectors can be merged
+    /// by adding buckets.
+    ///
+    /// # Arguments
+    /// - `buckets`: Output counts (zeroed first); 65 buckets give every
+    ///   `u64` its own bucket (with 64, latencies of `2^63` ns and above
+    ///   saturate into bucket 63)
+    ///
+    /// # Returns
+    /// Total number of samples bucketed.
+    pub fn latency_histogram(&self, buckets: &mut [u64]) -> u64 {
+        buckets.fill(0);
+        let Some(last) = buckets.len().checked_sub(1) else {
+            return 0;
+        };
+
+        let Ok(samples) = self.latency_samples.lock() else {
+            return 0;
+        };
+        for &latency in samples.iter() {
+            let idx = (u64::BITS - latency.leading_zeros()) as usize;
+            buckets[idx.min(last)] += 1;
+        }
+        samples.len() as u64
+    }
 }
 
 /// Snapshot all atomic counters into Frame fields
@@ -386,6 +436,42 @@ mod tests {
         assert_eq!(m.latency_sample_count(), 10);
     }
 
+    #[test]
+    fn test_latency_samples_batch() {
+        let m = MetricsCollector::with_capacity(10);
+
+        let starts = [0u64; 15];
+        let ends: Vec<u64> = (1..=15).collect();
+        m.add_latency_samples(&starts, &ends);
+
+        // Same FIFO bound as the single-sample path
+        assert_eq!(m.latency_sample_count(), 10);
+    }
+
+    #[test]
+    fn test_latency_histogram() {
+        let m = MetricsCollector::new();
+        for latency in [0, 1, 2, 3, 4, 1000] {
+            m.add_latency_sample(0, latency);
+        }
+
+        let mut buckets = [0u64; 8];
+        assert_eq!(m.latency_histogram(&mut buckets), 6);
+
+        // 0 -> b0, 1 -> b1, 2..=3 -> b2, 4 -> b3, 1000 clamped into b7
+        assert_eq!(buckets, [1, 1, 2, 1, 0, 0, 0, 1]);
+    }
+
+    #[test]
+    fn test_latency_histogram_covers_u64() {
+        let m = MetricsCollector::new();
+        m.add_latency_sample(0, u64::MAX);
+
+        let mut buckets = [0u64; 65];
+        m.latency_histogram(&mut buckets);
+        assert_eq!(buckets[64], 1);
+    }
+
     #[test]
     fn test_snapshot_empty_latencies() {
         let m = MetricsCollector::new();
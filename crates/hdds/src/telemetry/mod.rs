@@ -72,6 +72,28 @@ pub fn init_exporter(bind_addr: &str, port: u16) -> std::io::Result<Arc<Exporter
     Ok(exporter)
 }
 
+/// Initialize global telemetry exporter with frame coalescing
+///
+/// See [`Exporter::start_buffered`] for the meaning of `chunk_bytes` and
+/// `flush_interval`.
+pub fn init_exporter_buffered(
+    bind_addr: &str,
+    port: u16,
+    chunk_bytes: usize,
+    flush_interval: std::time::Duration,
+) -> std::io::Result<Arc<Exporter>> {
+    log::debug!("[hdds] telemetry::init_exporter_buffered({bind_addr}:{port}) starting");
+    let exporter = Arc::new(Exporter::start_buffered(
+        bind_addr,
+        port,
+        chunk_bytes,
+        flush_interval,
+    )?);
+    log::debug!("[hdds] telemetry::init_exporter_buffered({bind_addr}:{port}) ready");
+    GLOBAL_EXPORTER.set(exporter.clone()).ok();
+    Ok(exporter)
+}
+
 /// Get global exporter (returns None if not initialized)
 pub fn get_exporter() -> Option<Arc<Exporter>> {
     GLOBAL_EXPORTER.get().cloned()
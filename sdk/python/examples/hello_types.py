@@ -13,6 +13,9 @@ from typing import List, Dict, Optional, Union as UnionType, Tuple
 from enum import IntEnum
 import struct
 
+# SensorData wire layout: timestamp (u64) @0, id (u32) @8, value (f32) @12
+_SENSOR_DATA_CDR2_LE = struct.Struct('<QIf')
+
 @dataclass
 class SensorData:
     """IDL: struct SensorData { uint64_t timestamp; uint32_t id; float value; }"""
@@ -22,44 +25,16 @@ class SensorData:
 
     def encode_cdr2_le(self) -> bytes:
         """Encode to CDR2 little-endian format."""
-        parts: List[bytes] = []
-        offset = 0
-        # align to 8 and pack timestamp
-        pad = (8 - (offset % 8)) % 8
-        parts.append(b'\x00' * pad)
-        offset += pad
-        parts.append(struct.pack('<Q', self.timestamp))
-        offset += 8
-        # align to 4 and pack id
-        pad = (4 - (offset % 4)) % 4
-        parts.append(b'\x00' * pad)
-        offset += pad
-        parts.append(struct.pack('<I', self.id))
-        offset += 4
-        # align to 4 and pack value
-        pad = (4 - (offset % 4)) % 4
-        parts.append(b'\x00' * pad)
-        offset += pad
-        parts.append(struct.pack('<f', self.value))
-        offset += 4
-        return b''.join(parts)
+        # All members are naturally aligned (offsets 0, 8, 12), so the
+        # whole struct is a single fixed-layout pack with no padding.
+        return _SENSOR_DATA_CDR2_LE.pack(self.timestamp, self.id, self.value)
 
     @classmethod
     def decode_cdr2_le(cls, data: bytes) -> Tuple['SensorData', int]:
         """Decode from CDR2 little-endian format. Returns (instance, bytes_read)."""
-        offset = 0
-        # align and unpack timestamp
-        offset += (8 - (offset % 8)) % 8
-        _timestamp, = struct.unpack_from('<Q', data, offset)
-        offset += 8
-        # align and unpack id
-        offset += (4 - (offset % 4)) % 4
-        _id, = struct.unpack_from('<I', data, offset)
-        offset += 4
-        # align and unpack value
-        offset += (4 - (offset % 4)) % 4
-        _value, = struct.unpack_from('<f', data, offset)
-        offset += 4
+        # Same fixed layout as encode: one unpack for the whole struct.
+        _timestamp, _id, _value = _SENSOR_DATA_CDR2_LE.unpack_from(data, 0)
+        offset = _SENSOR_DATA_CDR2_LE.size
         return cls(timestamp=_timestamp, id=_id, value=_value), offset
 
     @classmethod
@@ -12,6 +12,7 @@ Main entry points:
     - ``Participant``: DDS domain participant (start here).
     - ``QoS``: Quality of Service configuration with fluent builder API.
     - ``WaitSet``: Blocking synchronization on data availability.
+    - ``PeriodicTimer``: Drift-free fixed-rate loop pacing.
     - ``ReaderListener`` / ``WriterListener``: Callback-based event notification.
 
 Submodules:
@@ -29,8 +30,9 @@ Example:
 
 from .participant import Participant, TransportMode
 from .qos import QoS
-from .entities import DataWriter, DataReader, Publisher, Subscriber
+from .entities import DataWriter, DataReader, Publisher, Subscriber, WriterGroup
 from .waitset import WaitSet, GuardCondition
+from .timer import PeriodicTimer
 from ._native import HddsException, HddsError, LogLevel
 
 # Submodules
@@ -66,8 +68,10 @@ __all__ = [
     "DataReader",
     "Publisher",
     "Subscriber",
+    "WriterGroup",
     "WaitSet",
     "GuardCondition",
+    "PeriodicTimer",
     # Functions
     "version",
     # Errors
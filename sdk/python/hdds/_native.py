@@ -72,7 +72,16 @@ def _find_library() -> str:
 
 
 def _load_library() -> ctypes.CDLL:
-    """Load the hdds-c library."""
+    """Load the hdds-c library.
+
+    The library must be loaded with ``ctypes.CDLL`` (not ``PyDLL``): CDLL
+    drops the GIL for the duration of every foreign call, so a thread
+    blocked in ``hdds_waitset_wait()`` or copying a large sample in
+    ``hdds_reader_take()`` / ``hdds_writer_write()`` does not stall other
+    Python threads. The reader/writer entry points only take ``&self`` on the
+    Rust side and synchronize internally, so no Python-side lock is needed;
+    listener callbacks re-acquire the GIL through their CFUNCTYPE thunks.
+    """
     lib_path = _find_library()
     try:
         return ctypes.CDLL(lib_path)
@@ -227,6 +236,11 @@ def _setup_signatures(lib: ctypes.CDLL) -> None:
     lib.hdds_writer_write.argtypes = [c_void_p, POINTER(c_uint8), c_size_t]
     lib.hdds_writer_write.restype = c_int32
 
+    lib.hdds_writer_write_batch.argtypes = [
+        POINTER(c_void_p), POINTER(c_uint8), POINTER(c_size_t), c_size_t,
+    ]
+    lib.hdds_writer_write_batch.restype = c_int32
+
     lib.hdds_writer_destroy.argtypes = [c_void_p]
     lib.hdds_writer_destroy.restype = None
 
@@ -245,6 +259,14 @@ def _setup_signatures(lib: ctypes.CDLL) -> None:
     lib.hdds_reader_take.argtypes = [c_void_p, POINTER(c_uint8), c_size_t, POINTER(c_size_t)]
     lib.hdds_reader_take.restype = c_int32
 
+    lib.hdds_reader_take_batch.argtypes = [
+        c_void_p, POINTER(c_uint8), c_size_t, POINTER(c_size_t), c_size_t, POINTER(c_size_t),
+    ]
+    lib.hdds_reader_take_batch.restype = c_int32
+
+    lib.hdds_reader_has_data.argtypes = [c_void_p]
+    lib.hdds_reader_has_data.restype = c_bool
+
     lib.hdds_reader_get_status_condition.argtypes = [c_void_p]
     lib.hdds_reader_get_status_condition.restype = c_void_p
 
@@ -309,6 +331,9 @@ def _setup_signatures(lib: ctypes.CDLL) -> None:
     lib.hdds_qos_add_partition.argtypes = [c_void_p, c_char_p]
     lib.hdds_qos_add_partition.restype = c_int32
 
+    lib.hdds_qos_add_partitions.argtypes = [c_void_p, POINTER(c_char_p), c_size_t]
+    lib.hdds_qos_add_partitions.restype = c_int32
+
     lib.hdds_qos_set_liveliness_automatic_ns.argtypes = [c_void_p, c_uint64]
     lib.hdds_qos_set_liveliness_automatic_ns.restype = c_int32
 
@@ -376,6 +401,12 @@ def _setup_signatures(lib: ctypes.CDLL) -> None:
     lib.hdds_qos_get_max_samples_per_instance.argtypes = [c_void_p]
     lib.hdds_qos_get_max_samples_per_instance.restype = c_size_t
 
+    lib.hdds_qos_get_partition_count.argtypes = [c_void_p]
+    lib.hdds_qos_get_partition_count.restype = c_size_t
+
+    lib.hdds_qos_has_partition.argtypes = [c_void_p, c_char_p]
+    lib.hdds_qos_has_partition.restype = c_bool
+
     # -------------------------------------------------------------------------
     # WaitSet
     # -------------------------------------------------------------------------
@@ -555,9 +586,20 @@ def _setup_signatures(lib: ctypes.CDLL) -> None:
     lib.hdds_telemetry_record_latency.argtypes = [c_void_p, c_uint64, c_uint64]
     lib.hdds_telemetry_record_latency.restype = None
 
+    lib.hdds_telemetry_record_latency_batch.argtypes = [
+        c_void_p, POINTER(c_uint64), POINTER(c_uint64), c_size_t,
+    ]
+    lib.hdds_telemetry_record_latency_batch.restype = c_int32
+
+    lib.hdds_telemetry_snapshot_histogram.argtypes = [c_void_p, POINTER(c_uint64), c_size_t]
+    lib.hdds_telemetry_snapshot_histogram.restype = c_int32
+
     lib.hdds_telemetry_start_exporter.argtypes = [c_char_p, c_uint16]
     lib.hdds_telemetry_start_exporter.restype = c_void_p
 
+    lib.hdds_telemetry_start_exporter_buffered.argtypes = [c_char_p, c_uint16, c_size_t, c_uint32]
+    lib.hdds_telemetry_start_exporter_buffered.restype = c_void_p
+
     lib.hdds_telemetry_stop_exporter.argtypes = [c_void_p]
     lib.hdds_telemetry_stop_exporter.restype = None
 
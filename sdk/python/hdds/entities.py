@@ -18,8 +18,9 @@ Copyright (c) 2025-2026 naskel.com
 """
 
 from __future__ import annotations
-from typing import Optional, Any, TYPE_CHECKING
+from typing import Optional, Any, List, Union, TYPE_CHECKING
 import ctypes
+import threading
 
 from .qos import QoS
 
@@ -27,6 +28,35 @@ if TYPE_CHECKING:
     pass
 
 
+# Per-thread staging buffer handed to hdds_writer_write(). The native side
+# copies the sample before returning, so one buffer per thread can be reused
+# (and grown when needed) instead of allocating a ctypes array per write.
+_write_scratch = threading.local()
+_WRITE_SCRATCH_MIN = 4096
+
+# Per-thread receive buffer for DataReader.take(). The sample is copied out
+# into a bytes object before take() returns, so the buffer can be reused.
+_take_scratch = threading.local()
+
+
+def _write_buffer(size: int) -> ctypes.Array:
+    """Return this thread's write staging buffer, holding at least size bytes."""
+    buf = getattr(_write_scratch, 'buf', None)
+    if buf is None or len(buf) < size:
+        buf = (ctypes.c_uint8 * max(size, _WRITE_SCRATCH_MIN))()
+        _write_scratch.buf = buf
+    return buf
+
+
+def _take_buffer(size: int) -> ctypes.Array:
+    """Return this thread's take() receive buffer, holding at least size bytes."""
+    buf = getattr(_take_scratch, 'buf', None)
+    if buf is None or len(buf) < size:
+        buf = (ctypes.c_uint8 * size)()
+        _take_scratch.buf = buf
+    return buf
+
+
 class DataWriter:
     """DDS DataWriter for publishing data to a topic.
 
@@ -75,21 +105,24 @@ class DataWriter:
         """
         return self._qos
 
-    def write(self, data: bytes) -> None:
+    def write(self, data: Union[bytes, bytearray, memoryview]) -> None:
         """Write a data sample to the topic.
 
-        The data must be raw bytes (typically CDR-serialized). For typed
-        publishing, use ``write_typed()`` instead.
+        The data must be raw bytes (typically CDR-serialized). A
+        ``bytearray`` or ``memoryview`` is also accepted, so a publisher
+        can serialize into one preallocated buffer with
+        ``struct.pack_into()`` and write a slice of it on every iteration.
+        For typed publishing, use ``write_typed()`` instead.
 
         Args:
             data: Raw bytes to publish.
 
         Raises:
             RuntimeError: If the writer has been destroyed or the write fails.
-            TypeError: If data is not bytes.
+            TypeError: If data is not a bytes-like object.
             HddsException: If the native write operation fails.
         """
-        if not isinstance(data, bytes):
+        if not isinstance(data, (bytes, bytearray, memoryview)):
             raise TypeError(f"Expected bytes, got {type(data).__name__}")
         self._write_raw(data)
 
@@ -115,7 +148,7 @@ class DataWriter:
         data = msg.encode_cdr2_le()
         self._write_raw(data)
 
-    def _write_raw(self, data: bytes) -> None:
+    def _write_raw(self, data: Union[bytes, bytearray, memoryview]) -> None:
         """Write raw bytes."""
         from ._native import get_lib, check_error
 
@@ -123,8 +156,16 @@ class DataWriter:
             raise RuntimeError("Writer has been destroyed")
 
         lib = get_lib()
-        data_ptr = (ctypes.c_uint8 * len(data)).from_buffer_copy(data)
-        err = lib.hdds_writer_write(self._handle, data_ptr, len(data))
+        if isinstance(data, bytes):
+            size = len(data)
+            buf = _write_buffer(size)
+            ctypes.memmove(buf, data, size)
+        else:
+            view = memoryview(data).cast('B')
+            size = view.nbytes
+            buf = _write_buffer(size)
+            memoryview(buf).cast('B')[:size] = view
+        err = lib.hdds_writer_write(self._handle, buf, size)
         check_error(err)
 
     def set_listener(self, listener) -> None:
@@ -158,10 +199,102 @@ class DataWriter:
             lib.hdds_writer_destroy(self._handle)
             self._handle = None
 
+    def close(self) -> None:
+        """Destroy the writer now rather than when its participant closes.
+
+        Safe to call multiple times; the participant skips writers that are
+        already closed. Called automatically when exiting a ``with`` block::
+
+            with participant.create_writer("topic") as writer:
+                ...
+        """
+        self._destroy()
+
+    def __enter__(self) -> DataWriter:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
     def __repr__(self) -> str:
         return f"DataWriter(topic={self._topic_name!r})"
 
 
+class WriterGroup:
+    """A fixed set of DataWriters published to together.
+
+    ``write_all()`` hands one sample per writer to the native layer in a
+    single FFI call, instead of one ``write()`` call per writer. Useful
+    when a publisher emits one sample on each of several topics per tick.
+
+    Created via ``Participant.create_writer_group()``. The writers stay
+    owned by the participant; the group only references them.
+
+    Example:
+        >>> group = participant.create_writer_group(["Sensor", "Status"])
+        >>> group.write_all([sensor_bytes, status_bytes])
+    """
+
+    def __init__(self, writers: List[DataWriter]):
+        """Group existing writers; order defines the ``write_all()`` order."""
+        self._writers = list(writers)
+        count = len(self._writers)
+        self._handles = (ctypes.c_void_p * count)(*(w._handle for w in self._writers))
+        self._lens = (ctypes.c_size_t * count)()
+
+    @property
+    def writers(self) -> List[DataWriter]:
+        """Get the grouped writers, in ``write_all()`` order.
+
+        Returns:
+            List of DataWriter instances.
+        """
+        return list(self._writers)
+
+    def write_all(self, payloads: List[Union[bytes, bytearray, memoryview]]) -> None:
+        """Write ``payloads[i]`` to the i-th writer, in one native call.
+
+        Args:
+            payloads: One bytes-like sample per writer, in group order.
+
+        Raises:
+            ValueError: If the number of payloads does not match the group.
+            RuntimeError: If a writer has been destroyed.
+            HddsException: If a native write fails; samples before the
+                failing one have been published.
+        """
+        from ._native import get_lib, check_error
+
+        count = len(self._writers)
+        if len(payloads) != count:
+            raise ValueError(f"Expected {count} payloads, got {len(payloads)}")
+        for writer in self._writers:
+            if not writer._handle:
+                raise RuntimeError("Writer has been destroyed")
+
+        views = [memoryview(p).cast('B') for p in payloads]
+        sizes = [view.nbytes for view in views]
+        lens = self._lens
+        lens[:] = sizes  # one bulk store into the c_size_t array
+
+        buf = _write_buffer(sum(sizes))
+        staging = memoryview(buf).cast('B')
+        offset = 0
+        for view in views:
+            end = offset + view.nbytes
+            staging[offset:end] = view
+            offset = end
+
+        check_error(get_lib().hdds_writer_write_batch(self._handles, buf, lens, count))
+
+    def __len__(self) -> int:
+        return len(self._writers)
+
+    def __repr__(self) -> str:
+        topics = [w.topic_name for w in self._writers]
+        return f"WriterGroup(topics={topics!r})"
+
+
 class DataReader:
     """DDS DataReader for subscribing to data on a topic.
 
@@ -199,6 +332,14 @@ class DataReader:
         reader._handle = handle
         reader._qos = qos
         reader._status_condition = None
+        # take_view() slots: (ctypes array, memoryview) pairs over one slab
+        reader._view_buffer = None
+        reader._view_slot_size = 0
+        reader._view_slots = []
+        reader._view_next = 0
+        max_payload = qos.get_max_payload() if qos is not None else None
+        if max_payload:
+            reader._alloc_view_slots(max_payload, max(1, qos.get_history_depth()))
         return reader
 
     @property
@@ -219,6 +360,31 @@ class DataReader:
         """
         return self._qos
 
+    def has_data(self) -> bool:
+        """Check whether a sample is ready to take (non-blocking).
+
+        Cheaper than a zero-timeout ``WaitSet.wait()``: it only inspects the
+        reader's cache and never sleeps. Use it to end a drain loop as soon
+        as the reader is empty rather than waiting out a timeout.
+
+        Returns:
+            True if the next ``take()`` would return a sample.
+
+        Raises:
+            RuntimeError: If the reader has been destroyed.
+
+        Example:
+            >>> while reader.has_data():
+            ...     for view in reader.take_batch(64):
+            ...         process(view)
+        """
+        from ._native import get_lib
+
+        if not self._handle:
+            raise RuntimeError("Reader has been destroyed")
+
+        return bool(get_lib().hdds_reader_has_data(self._handle))
+
     def take(self, buffer_size: int = DEFAULT_BUFFER_SIZE) -> Optional[bytes]:
         """Take one sample from the reader (non-blocking).
 
@@ -268,17 +434,197 @@ class DataReader:
         msg, _ = msg_type.decode_cdr2_le(data)
         return msg
 
+    def take_view(self, buffer_size: Optional[int] = None) -> Optional[memoryview]:
+        """Take one sample as a view into this reader's receive buffer.
+
+        Like ``take()``, but skips copying the sample into a new ``bytes``
+        object. The view aliases a buffer owned by the reader and is only
+        valid until the next ``take_view()`` call on the same reader, so
+        decode it (or copy it with ``bytes(view)``) before taking again.
+        The returned memoryview is a context manager, which makes the
+        lifetime explicit; check for None first, since that is returned
+        when no sample is available::
+
+            view = reader.take_view()
+            if view is not None:
+                with view:
+                    msg_id, text = deserialize(view)
+
+        If the reader's QoS is ``preallocated(max_payload)``, the buffer is a
+        slab of ``history depth`` slots allocated at reader creation and
+        used in rotation, so each view stays valid for the next
+        ``depth - 1`` calls as well.
+
+        The receive buffer is per reader; do not share one reader's views
+        between threads.
+
+        Args:
+            buffer_size: Maximum size of data to read in bytes. Defaults to
+                the preallocated slot size, else ``DEFAULT_BUFFER_SIZE``.
+
+        Returns:
+            A read-only memoryview of the sample, or None if no data is
+            available.
+
+        Raises:
+            RuntimeError: If the reader has been destroyed.
+            HddsException: If the native take operation fails.
+        """
+        if buffer_size is None:
+            buffer_size = self._view_slot_size or self.DEFAULT_BUFFER_SIZE
+        elif buffer_size > self._view_slot_size:
+            # Earlier views keep the old slab alive, so they remain valid
+            self._alloc_view_slots(buffer_size, len(self._view_slots) or 1)
+        if not self._view_slots:
+            self._alloc_view_slots(buffer_size, 1)
+
+        slots = self._view_slots
+        index = self._view_next
+        self._view_next = (index + 1) % len(slots)
+        buf, view = slots[index]
+        size = self._take_into(buf, buffer_size)
+        if size is None:
+            return None
+        return view[:size].toreadonly()
+
+    def _alloc_view_slots(self, slot_size: int, count: int) -> None:
+        """Internal: allocate the take_view() slab as count slots of slot_size bytes."""
+        slab = (ctypes.c_uint8 * (slot_size * count))()
+        whole = memoryview(slab).cast('B')
+        slot_type = ctypes.c_uint8 * slot_size
+        self._view_buffer = slab
+        self._view_slot_size = slot_size
+        self._view_slots = [
+            (slot_type.from_buffer(slab, i * slot_size),
+             whole[i * slot_size:(i + 1) * slot_size])
+            for i in range(count)
+        ]
+        self._view_next = 0
+
+    def take_batch(
+        self,
+        max_n: int = 64,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ) -> List[memoryview]:
+        """Take up to ``max_n`` samples with a single native call.
+
+        Drains the reader in one FFI round trip instead of calling
+        ``take()`` until it returns None. Samples are packed into one
+        freshly allocated buffer of ``buffer_size`` bytes and returned as
+        read-only memoryviews into it, so they stay valid for as long as
+        the caller holds them. Taking stops early if the next sample would
+        not fit; it is left in the reader for the next call.
+
+        Args:
+            max_n: Maximum number of samples to take.
+            buffer_size: Total receive buffer size in bytes for the batch.
+
+        Returns:
+            A list of memoryviews in arrival order; empty if no data is
+            available.
+
+        Raises:
+            RuntimeError: If the reader has been destroyed.
+            HddsException: If the native take fails, including when the
+                next sample alone is larger than ``buffer_size``.
+
+        Example:
+            >>> for view in reader.take_batch(64):
+            ...     process(view)
+        """
+        from ._native import get_lib, HddsError
+
+        if not self._handle:
+            raise RuntimeError("Reader has been destroyed")
+
+        lib = get_lib()
+        buf = (ctypes.c_uint8 * buffer_size)()
+        lens = (ctypes.c_size_t * max_n)()
+        count = ctypes.c_size_t(0)
+
+        err = lib.hdds_reader_take_batch(
+            self._handle,
+            buf,
+            buffer_size,
+            lens,
+            max_n,
+            ctypes.byref(count)
+        )
+
+        if err == HddsError.NOT_FOUND:
+            return []
+        if err != HddsError.OK:
+            from ._native import HddsException
+            raise HddsException(err)
+
+        view = memoryview(buf).cast('B').toreadonly()
+        samples = []
+        offset = 0
+        for size in lens[:count.value]:
+            samples.append(view[offset:offset + size])
+            offset += size
+        return samples
+
+    def take_batch_typed(
+        self,
+        msg_type: type,
+        max_n: int = 64,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        copy: bool = True,
+    ) -> List[Any]:
+        """Take up to ``max_n`` samples in one native call and decode them.
+
+        Combines ``take_batch()`` with ``take_typed()``: the reader is
+        drained in a single FFI round trip, then each sample is decoded
+        with ``msg_type.decode_cdr2_le``.
+
+        Generated decoders take ``bytes``, so each sample is copied out of
+        the batch buffer before decoding. Pass ``copy=False`` to hand the
+        decoder the ``take_batch()`` memoryview itself; only do so for
+        decoders that accept any bytes-like object (e.g. ones built on
+        ``struct.unpack_from``).
+
+        Args:
+            msg_type: The message class with ``decode_cdr2_le`` class method.
+            max_n: Maximum number of samples to take.
+            buffer_size: Total receive buffer size in bytes for the batch.
+            copy: Copy each sample to ``bytes`` before decoding.
+
+        Returns:
+            Decoded message instances in arrival order; empty if no data
+            is available.
+
+        Raises:
+            RuntimeError: If the reader has been destroyed.
+            HddsException: If the native take fails.
+
+        Example:
+            >>> for msg in reader.take_batch_typed(HelloWorld):
+            ...     print(msg.message)
+        """
+        decode = msg_type.decode_cdr2_le
+        views = self.take_batch(max_n, buffer_size)
+        if copy:
+            # Generated decoders expect bytes, not memoryview
+            return [decode(bytes(view))[0] for view in views]
+        return [decode(view)[0] for view in views]
+
     def _take_raw(self, buffer_size: int) -> Optional[bytes]:
         """Non-blocking take."""
+        buf = _take_buffer(buffer_size)
+        size = self._take_into(buf, buffer_size)
+        if size is None:
+            return None  # No data available
+        return ctypes.string_at(buf, size)
+
+    def _take_into(self, buffer: ctypes.Array, buffer_size: int) -> Optional[int]:
+        """Take one sample into buffer; return its size, or None if empty."""
         from ._native import get_lib, HddsError
 
         if not self._handle:
             raise RuntimeError("Reader has been destroyed")
 
         lib = get_lib()
-
-        # Allocate buffer
-        buffer = (ctypes.c_uint8 * buffer_size)()
         actual_size = ctypes.c_size_t(0)
 
         err = lib.hdds_reader_take(
@@ -294,7 +640,7 @@ class DataReader:
             from ._native import HddsException
             raise HddsException(err)
 
-        return bytes(buffer[:actual_size.value])
+        return actual_size.value
 
     def get_status_condition(self) -> ctypes.c_void_p:
         """Get the status condition handle for WaitSet integration.
@@ -352,6 +698,23 @@ class DataReader:
             self._handle = None
             self._status_condition = None
 
+    def close(self) -> None:
+        """Destroy the reader now rather than when its participant closes.
+
+        Safe to call multiple times; the participant skips readers that are
+        already closed. Called automatically when exiting a ``with`` block::
+
+            with participant.create_reader("topic") as reader:
+                ...
+        """
+        self._destroy()
+
+    def __enter__(self) -> DataReader:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+
     def __repr__(self) -> str:
         return f"DataReader(topic={self._topic_name!r})"
 
@@ -24,6 +24,7 @@ Copyright (c) 2025-2026 naskel.com
 """
 
 import ctypes
+import sys
 from ctypes import (
     c_void_p,
     c_uint8,
@@ -427,7 +428,9 @@ class WriterListener:
         def _on_offered_incompatible_qos(policy_id, policy_name_ptr, _user_data):
             name = ""
             if policy_name_ptr:
-                name = policy_name_ptr.decode("utf-8", errors="replace")
+                # A handful of policy names repeat for every event; intern them
+                # so handlers that tally by name share one string per policy.
+                name = sys.intern(policy_name_ptr.decode("utf-8", errors="replace"))
             listener_ref.on_offered_incompatible_qos(policy_id, name)
 
         def _on_liveliness_lost(_user_data):
@@ -21,11 +21,12 @@ Copyright (c) 2025-2026 naskel.com
 
 from __future__ import annotations
 from enum import IntEnum
-from typing import Optional, TYPE_CHECKING
+from typing import Iterable, Optional, TYPE_CHECKING
 import ctypes
+import sys
 
 from .qos import QoS
-from .entities import DataWriter, DataReader, Publisher, Subscriber
+from .entities import DataWriter, DataReader, Publisher, Subscriber, WriterGroup
 
 if TYPE_CHECKING:
     pass
@@ -108,7 +109,7 @@ class Participant:
         lib = get_lib()
         name_ptr = lib.hdds_participant_name(self._handle)
         if name_ptr:
-            return name_ptr.decode('utf-8')
+            return sys.intern(name_ptr.decode('utf-8'))
         return self._name
 
     @property
@@ -188,6 +189,28 @@ class Participant:
         self._writers.append(writer)
         return writer
 
+    def create_writer_group(
+        self,
+        topic_names: Iterable[str],
+        qos: Optional[QoS] = None,
+    ) -> WriterGroup:
+        """
+        Create one DataWriter per topic, grouped for batched writes.
+
+        Args:
+            topic_names: Topics to write to; order defines payload order
+                         in ``WriterGroup.write_all()``
+            qos: QoS configuration shared by all writers (default if None)
+
+        Returns:
+            WriterGroup over the new writers
+
+        Example:
+            >>> group = participant.create_writer_group(["Sensor", "Status"])
+            >>> group.write_all([sensor_bytes, status_bytes])
+        """
+        return WriterGroup([self.create_writer(name, qos=qos) for name in topic_names])
+
     def create_reader(
         self,
         topic_name: str,
@@ -30,11 +30,52 @@ Copyright (c) 2025-2026 naskel.com
 
 from __future__ import annotations
 from enum import Enum, auto
-from typing import Optional, List, TYPE_CHECKING
+from typing import Optional
 import ctypes
+import functools
+import os
 
-if TYPE_CHECKING:
-    from ._native import ctypes
+
+@functools.lru_cache(maxsize=256)
+def _encode_partition(name: str) -> bytes:
+    """UTF-8 encode a partition name, interned across QoS objects.
+
+    Applications typically create many entities over a handful of
+    partitions, so each name is encoded once and the same bytes object is
+    handed to the native layer on every later ``partition()`` call.
+    """
+    return name.encode('utf-8')
+
+
+def _load_xml(loader: str, path: str) -> Optional[QoS]:
+    """Load an XML profile with the named native loader, parsing it once.
+
+    Returns a private copy of the parsed profile, or None if the file
+    cannot be read or parsed. The parse is cached per (loader, file,
+    modification time), so later loads of an unchanged file only cost a
+    ``stat()`` and a native clone; editing the file invalidates the entry.
+    """
+    path = os.path.abspath(path)
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        mtime_ns = -1  # let the native loader report the failure
+    parsed = _parse_xml(loader, path, mtime_ns)
+    if parsed is None:
+        return None
+    from ._native import get_lib
+    handle = get_lib().hdds_qos_clone(parsed._handle)
+    if not handle:
+        raise RuntimeError("Failed to clone QoS handle")
+    return QoS._wrap(handle)
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_xml(loader: str, path: str, mtime_ns: int) -> Optional[QoS]:
+    """Internal: run a native XML loader; cached by _load_xml()."""
+    from ._native import get_lib
+    handle = getattr(get_lib(), loader)(path.encode('utf-8'))
+    return QoS._wrap(handle) if handle else None
 
 
 class Reliability(Enum):
@@ -102,10 +143,18 @@ class QoS:
         >>> qos = QoS.from_file("fastdds_profile.xml")
     """
 
+    # Profiles are built per endpoint; the state lives in the native handle,
+    # so instances need no __dict__. _max_payload is the Python-side reader
+    # hint set by preallocated(); it is not part of the native QoS.
+    __slots__ = ('_handle', '_owned', '_frozen', '_shared_from', '_max_payload')
+
     def __init__(self, _handle: Optional[ctypes.c_void_p] = None):
         """Create QoS. Use factory methods instead."""
         self._handle = _handle
         self._owned = _handle is None  # Track if we own the handle
+        self._frozen = False
+        self._shared_from = None
+        self._max_payload = None
 
         if self._handle is None:
             from ._native import get_lib
@@ -113,6 +162,17 @@ class QoS:
             self._handle = lib.hdds_qos_default()
             self._owned = True
 
+    @classmethod
+    def _wrap(cls, handle: ctypes.c_void_p, owned: bool = True) -> QoS:
+        """Internal: build a QoS around an existing native handle."""
+        qos = cls.__new__(cls)
+        qos._handle = handle
+        qos._owned = owned
+        qos._frozen = False
+        qos._shared_from = None
+        qos._max_payload = None
+        return qos
+
     def __del__(self):
         """Clean up native handle."""
         if self._owned and self._handle:
@@ -130,10 +190,7 @@ class QoS:
         from ._native import get_lib
         lib = get_lib()
         handle = lib.hdds_qos_default()
-        qos = cls.__new__(cls)
-        qos._handle = handle
-        qos._owned = True
-        return qos
+        return cls._wrap(handle)
 
     @classmethod
     def reliable(cls) -> QoS:
@@ -141,10 +198,7 @@ class QoS:
         from ._native import get_lib
         lib = get_lib()
         handle = lib.hdds_qos_reliable()
-        qos = cls.__new__(cls)
-        qos._handle = handle
-        qos._owned = True
-        return qos
+        return cls._wrap(handle)
 
     @classmethod
     def best_effort(cls) -> QoS:
@@ -152,10 +206,7 @@ class QoS:
         from ._native import get_lib
         lib = get_lib()
         handle = lib.hdds_qos_best_effort()
-        qos = cls.__new__(cls)
-        qos._handle = handle
-        qos._owned = True
-        return qos
+        return cls._wrap(handle)
 
     @classmethod
     def rti_defaults(cls) -> QoS:
@@ -163,10 +214,7 @@ class QoS:
         from ._native import get_lib
         lib = get_lib()
         handle = lib.hdds_qos_rti_defaults()
-        qos = cls.__new__(cls)
-        qos._handle = handle
-        qos._owned = True
-        return qos
+        return cls._wrap(handle)
 
     @classmethod
     def from_file(cls, path: str) -> QoS:
@@ -174,7 +222,9 @@ class QoS:
         Load QoS from XML profile file.
 
         Supports FastDDS, RTI Connext, and other vendor formats.
-        Vendor is auto-detected from XML structure.
+        Vendor is auto-detected from XML structure. The parsed file is
+        cached, so creating many entities from one profile file parses it
+        once; each call still returns an independent QoS.
 
         **Note:** This method requires the ``qos-loaders`` Cargo feature to be
         enabled when building HDDS. If not available, raises ``NotImplementedError``.
@@ -206,25 +256,14 @@ class QoS:
         from ._native import get_lib
         lib = get_lib()
 
-        # Try auto-detect vendor format first (hdds_qos_from_xml)
-        if hasattr(lib, 'hdds_qos_from_xml'):
-            handle = lib.hdds_qos_from_xml(path.encode('utf-8'))
-            if handle:
-                qos = cls.__new__(cls)
-                qos._handle = handle
-                qos._owned = True
-                return qos
-            raise ValueError(f"Failed to load QoS from {path}")
-
-        # Fall back to FastDDS-specific loader
-        if hasattr(lib, 'hdds_qos_load_fastdds_xml'):
-            handle = lib.hdds_qos_load_fastdds_xml(path.encode('utf-8'))
-            if handle:
-                qos = cls.__new__(cls)
-                qos._handle = handle
-                qos._owned = True
+        # Try auto-detect vendor format first (hdds_qos_from_xml), then
+        # fall back to the FastDDS-specific loader
+        for loader in ('hdds_qos_from_xml', 'hdds_qos_load_fastdds_xml'):
+            if hasattr(lib, loader):
+                qos = _load_xml(loader, path)
+                if qos is None:
+                    raise ValueError(f"Failed to load QoS from {path}")
                 return qos
-            raise ValueError(f"Failed to load QoS from {path}")
 
         raise NotImplementedError("QoS.from_file() requires qos-loaders feature")
 
@@ -256,37 +295,80 @@ class QoS:
                 "QoS.from_fastdds_xml() requires qos-loaders feature"
             )
 
-        handle = lib.hdds_qos_load_fastdds_xml(path.encode('utf-8'))
-        if not handle:
+        qos = _load_xml('hdds_qos_load_fastdds_xml', path)
+        if qos is None:
             raise ValueError(f"Failed to load FastDDS QoS from {path}")
-
-        qos = cls.__new__(cls)
-        qos._handle = handle
-        qos._owned = True
         return qos
 
     def clone(self) -> QoS:
         """Create an independent deep copy of this QoS profile.
 
+        If the profile is frozen, no native copy is made: the returned
+        QoS shares this profile's handle (see ``freeze()``).
+
         Returns:
             A new QoS instance with the same settings.
         """
+        if self._frozen:
+            return self._retain()
+
         from ._native import get_lib
         lib = get_lib()
         handle = lib.hdds_qos_clone(self._handle)
         if not handle:
             raise RuntimeError("Failed to clone QoS handle")
-        qos = QoS.__new__(QoS)
-        qos._handle = handle
-        qos._owned = True
+        qos = QoS._wrap(handle)
+        qos._max_payload = self._max_payload
         return qos
 
+    def freeze(self) -> QoS:
+        """Mark this QoS profile immutable so it can be shared.
+
+        Once frozen, builder methods raise ``RuntimeError`` and ``clone()``
+        returns a lightweight view of the same native handle instead of
+        allocating a copy. Useful when many endpoints use one profile::
+
+            qos = QoS.reliable().history_depth(10).freeze()
+            readers = [p.create_reader(t, qos=qos.clone()) for t in topics]
+
+        Freezing is irreversible; use ``clone()`` before freezing if a
+        mutable copy is needed.
+
+        Returns:
+            self (for chaining).
+        """
+        self._frozen = True
+        return self
+
+    @property
+    def is_frozen(self) -> bool:
+        """True if this profile has been frozen with ``freeze()``."""
+        return self._frozen
+
+    def _retain(self) -> QoS:
+        """Internal: share the native handle of a frozen profile.
+
+        The view does not own the handle; it keeps the owning QoS alive
+        through ``_shared_from`` so the handle outlives every view.
+        """
+        qos = QoS._wrap(self._handle, owned=False)
+        qos._frozen = True
+        qos._shared_from = self._shared_from or self
+        qos._max_payload = self._max_payload
+        return qos
+
+    def _check_mutable(self) -> None:
+        """Internal: raise if the profile has been frozen."""
+        if self._frozen:
+            raise RuntimeError("QoS is frozen; clone() it before freezing to modify")
+
     # -------------------------------------------------------------------------
     # Fluent builder methods
     # -------------------------------------------------------------------------
 
     def transient_local(self) -> QoS:
         """Set durability to TRANSIENT_LOCAL (late-joiner support)."""
+        self._check_mutable()
         from ._native import get_lib, check_error
         lib = get_lib()
         check_error(lib.hdds_qos_set_transient_local(self._handle))
@@ -294,6 +376,7 @@ class QoS:
 
     def volatile(self) -> QoS:
         """Set durability to VOLATILE (no caching)."""
+        self._check_mutable()
         from ._native import get_lib, check_error
         lib = get_lib()
         check_error(lib.hdds_qos_set_volatile(self._handle))
@@ -308,13 +391,43 @@ class QoS:
         Returns:
             self (for chaining).
         """
+        self._check_mutable()
         from ._native import get_lib, check_error
         lib = get_lib()
         check_error(lib.hdds_qos_set_history_depth(self._handle, depth))
         return self
 
+    def preallocated(self, max_payload: int) -> QoS:
+        """Preallocate reader receive slots for samples of up to max_payload bytes.
+
+        A DataReader created with this QoS allocates one contiguous slab of
+        ``history depth x max_payload`` bytes when it is created, and
+        ``take_view()`` fills its fixed slots in rotation instead of sizing
+        a buffer on first use. Each view then stays valid for the next
+        ``depth - 1`` calls, so the reader can hold its whole history
+        without copying. Has no effect on writers.
+
+        Args:
+            max_payload: Largest serialized sample, in bytes.
+
+        Returns:
+            self (for chaining).
+
+        Raises:
+            ValueError: If max_payload is not positive.
+
+        Example:
+            >>> qos = QoS.reliable().history_depth(10).preallocated(512)
+        """
+        self._check_mutable()
+        if max_payload <= 0:
+            raise ValueError(f"max_payload must be positive, got {max_payload}")
+        self._max_payload = max_payload
+        return self
+
     def history_keep_all(self) -> QoS:
         """Set history to KEEP_ALL (unbounded)."""
+        self._check_mutable()
         from ._native import get_lib, check_error
         lib = get_lib()
         check_error(lib.hdds_qos_set_history_keep_all(self._handle))
@@ -322,6 +435,7 @@ class QoS:
 
     def persistent(self) -> QoS:
         """Set durability to PERSISTENT (disk storage)."""
+        self._check_mutable()
         from ._native import get_lib, check_error
         lib = get_lib()
         check_error(lib.hdds_qos_set_persistent(self._handle))
@@ -329,6 +443,7 @@ class QoS:
 
     def set_reliable(self) -> QoS:
         """Switch to RELIABLE delivery."""
+        self._check_mutable()
         from ._native import get_lib, check_error
         lib = get_lib()
         check_error(lib.hdds_qos_set_reliable(self._handle))
@@ -336,6 +451,7 @@ class QoS:
 
     def set_best_effort(self) -> QoS:
         """Switch to BEST_EFFORT delivery."""
+        self._check_mutable()
         from ._native import get_lib, check_error
         lib = get_lib()
         check_error(lib.hdds_qos_set_best_effort(self._handle))
@@ -353,6 +469,7 @@ class QoS:
         Returns:
             self (for chaining).
         """
+        self._check_mutable()
         from ._native import get_lib, check_error
         lib = get_lib()
         check_error(lib.hdds_qos_set_deadline_ns(self._handle, milliseconds * 1_000_000))
@@ -367,6 +484,7 @@ class QoS:
         Returns:
             self (for chaining).
         """
+        self._check_mutable()
         from ._native import get_lib, check_error
         lib = get_lib()
         check_error(lib.hdds_qos_set_deadline_ns(self._handle, seconds * 1_000_000_000))
@@ -383,6 +501,7 @@ class QoS:
         Returns:
             self (for chaining).
         """
+        self._check_mutable()
         from ._native import get_lib, check_error
         lib = get_lib()
         check_error(lib.hdds_qos_set_lifespan_ns(self._handle, milliseconds * 1_000_000))
@@ -397,6 +516,7 @@ class QoS:
         Returns:
             self (for chaining).
         """
+        self._check_mutable()
         from ._native import get_lib, check_error
         lib = get_lib()
         check_error(lib.hdds_qos_set_lifespan_ns(self._handle, seconds * 1_000_000_000))
@@ -414,6 +534,7 @@ class QoS:
         Returns:
             self (for chaining).
         """
+        self._check_mutable()
         from ._native import get_lib, check_error
         lib = get_lib()
         check_error(lib.hdds_qos_set_liveliness_automatic_ns(
@@ -431,6 +552,7 @@ class QoS:
         Returns:
             self (for chaining).
         """
+        self._check_mutable()
         from ._native import get_lib, check_error
         lib = get_lib()
         check_error(lib.hdds_qos_set_liveliness_manual_participant_ns(
@@ -448,6 +570,7 @@ class QoS:
         Returns:
             self (for chaining).
         """
+        self._check_mutable()
         from ._native import get_lib, check_error
         lib = get_lib()
         check_error(lib.hdds_qos_set_liveliness_manual_topic_ns(
@@ -456,6 +579,7 @@ class QoS:
 
     def ownership_shared(self) -> QoS:
         """Set ownership to SHARED (multiple writers allowed)."""
+        self._check_mutable()
         from ._native import get_lib, check_error
         lib = get_lib()
         check_error(lib.hdds_qos_set_ownership_shared(self._handle))
@@ -473,6 +597,7 @@ class QoS:
         Returns:
             self (for chaining).
         """
+        self._check_mutable()
         from ._native import get_lib, check_error
         lib = get_lib()
         check_error(lib.hdds_qos_set_ownership_exclusive(self._handle, strength))
@@ -490,9 +615,36 @@ class QoS:
         Returns:
             self (for chaining).
         """
+        self._check_mutable()
+        from ._native import get_lib, check_error
+        lib = get_lib()
+        check_error(lib.hdds_qos_add_partition(self._handle, _encode_partition(name)))
+        return self
+
+    def partitions(self, *names: str) -> QoS:
+        """Add several partition names in a single native call.
+
+        Equivalent to calling ``partition()`` once per name, but crosses
+        the FFI boundary only once.
+
+        Args:
+            *names: Partition name strings.
+
+        Returns:
+            self (for chaining).
+
+        Example:
+            >>> qos = QoS.reliable().partitions("sensors", "lidar", "camera")
+        """
+        self._check_mutable()
         from ._native import get_lib, check_error
+        if not names:
+            return self
         lib = get_lib()
-        check_error(lib.hdds_qos_add_partition(self._handle, name.encode('utf-8')))
+        c_names = (ctypes.c_char_p * len(names))(
+            *[_encode_partition(n) for n in names]
+        )
+        check_error(lib.hdds_qos_add_partitions(self._handle, c_names, len(names)))
         return self
 
     def time_based_filter_ms(self, milliseconds: int) -> QoS:
@@ -507,6 +659,7 @@ class QoS:
         Returns:
             self (for chaining).
         """
+        self._check_mutable()
         from ._native import get_lib, check_error
         lib = get_lib()
         check_error(lib.hdds_qos_set_time_based_filter_ns(
@@ -525,6 +678,7 @@ class QoS:
         Returns:
             self (for chaining).
         """
+        self._check_mutable()
         from ._native import get_lib, check_error
         lib = get_lib()
         check_error(lib.hdds_qos_set_latency_budget_ns(
@@ -543,6 +697,7 @@ class QoS:
         Returns:
             self (for chaining).
         """
+        self._check_mutable()
         from ._native import get_lib, check_error
         lib = get_lib()
         check_error(lib.hdds_qos_set_transport_priority(self._handle, priority))
@@ -566,6 +721,7 @@ class QoS:
         Returns:
             self (for chaining).
         """
+        self._check_mutable()
         from ._native import get_lib, check_error
         lib = get_lib()
         # Convert -1 to SIZE_MAX
@@ -621,6 +777,14 @@ class QoS:
         lib = get_lib()
         return lib.hdds_qos_get_history_depth(self._handle)
 
+    def get_max_payload(self) -> Optional[int]:
+        """Get the reader slot size set by ``preallocated()``.
+
+        Returns:
+            Slot size in bytes, or None if the QoS is not preallocated.
+        """
+        return self._max_payload
+
     def get_deadline_ns(self) -> int:
         """Get deadline period in nanoseconds.
 
@@ -732,6 +896,29 @@ class QoS:
         lib = get_lib()
         return lib.hdds_qos_get_max_samples_per_instance(self._handle)
 
+    def get_partition_count(self) -> int:
+        """Get the number of partition names.
+
+        Returns:
+            Number of partitions added, or 0 for the default partition.
+        """
+        from ._native import get_lib
+        lib = get_lib()
+        return lib.hdds_qos_get_partition_count(self._handle)
+
+    def has_partition(self, name: str) -> bool:
+        """Check whether a partition name has been added.
+
+        Args:
+            name: Partition name to look for.
+
+        Returns:
+            True if ``name`` is one of this QoS's partitions.
+        """
+        from ._native import get_lib
+        lib = get_lib()
+        return lib.hdds_qos_has_partition(self._handle, _encode_partition(name))
+
     @property
     def _c_handle(self) -> ctypes.c_void_p:
         """Internal: get C handle for FFI calls."""
@@ -31,22 +31,44 @@ Copyright (c) 2025-2026 naskel.com
 """
 
 from __future__ import annotations
-from ctypes import byref
-from typing import Optional
+from ctypes import byref, c_uint64
+from operator import attrgetter
+import math
+import threading
+import weakref
+from typing import List, Optional
 from dataclasses import dataclass
 
 from ._native import get_lib, check_error, MetricsSnapshot as _MetricsSnapshot
 
-__all__ = ['init', 'get', 'Metrics', 'MetricsSnapshot', 'Exporter', 'start_exporter']
+__all__ = [
+    'init', 'get', 'Metrics', 'MetricsSnapshot', 'Exporter', 'start_exporter',
+    'histogram_percentile', 'LATENCY_UNBOUNDED_NS',
+]
+
+# Reads every native snapshot field in one call, in ``_fields_`` order.
+# MetricsSnapshot declares its fields in the same order, so the resulting
+# tuple can be passed positionally.
+_read_snapshot_fields = attrgetter(*(name for name, _ in _MetricsSnapshot._fields_))
+
+# Latency samples buffered per thread before a single batched FFI call.
+_LATENCY_BATCH_SIZE = 256
+# A batch is also submitted once its oldest sample is this old (measured on
+# the samples' own end timestamps, so no extra clock read per record).
+_LATENCY_MAX_AGE_NS = 100_000_000
+
+#: Returned by ``histogram_percentile()`` when the rank falls in the
+#: open-ended last bucket, whose latencies have no upper bound (u64 max).
+LATENCY_UNBOUNDED_NS = 2**64 - 1
 
 
 @dataclass
 class MetricsSnapshot:
     """Point-in-time snapshot of all tracked telemetry metrics.
 
-    All latency values are in nanoseconds. Use the convenience properties
-    (``latency_p50_ms``, ``latency_p99_ms``, ``latency_p999_ms``) for
-    millisecond values.
+    All latency values are in nanoseconds. Millisecond values are computed
+    once at construction and exposed as ``latency_p50_ms``,
+    ``latency_p99_ms`` and ``latency_p999_ms``.
 
     Attributes:
         timestamp_ns: Snapshot timestamp in nanoseconds since epoch.
@@ -59,7 +81,21 @@ class MetricsSnapshot:
         latency_p999_ns: 99.9th percentile end-to-end latency in nanoseconds.
         merge_full_count: Number of backpressure events (merge buffer full).
         would_block_count: Number of would-block events (send buffer full).
+        latency_p50_ms: P50 latency in milliseconds.
+        latency_p99_ms: P99 latency in milliseconds.
+        latency_p999_ms: P99.9 latency in milliseconds.
     """
+    # Explicit slots (dataclass(slots=True) needs Python 3.10). The *_ms
+    # values are plain slots rather than fields, so they stay out of
+    # __init__, __repr__ and __eq__.
+    __slots__ = (
+        'timestamp_ns', 'messages_sent', 'messages_received',
+        'messages_dropped', 'bytes_sent', 'latency_p50_ns',
+        'latency_p99_ns', 'latency_p999_ns', 'merge_full_count',
+        'would_block_count', 'latency_p50_ms', 'latency_p99_ms',
+        'latency_p999_ms',
+    )
+
     timestamp_ns: int
     messages_sent: int
     messages_received: int
@@ -71,20 +107,40 @@ class MetricsSnapshot:
     merge_full_count: int
     would_block_count: int
 
-    @property
-    def latency_p50_ms(self) -> float:
-        """P50 latency in milliseconds."""
-        return self.latency_p50_ns / 1_000_000
+    def __post_init__(self) -> None:
+        self.latency_p50_ms = self.latency_p50_ns / 1_000_000
+        self.latency_p99_ms = self.latency_p99_ns / 1_000_000
+        self.latency_p999_ms = self.latency_p999_ns / 1_000_000
 
-    @property
-    def latency_p99_ms(self) -> float:
-        """P99 latency in milliseconds."""
-        return self.latency_p99_ns / 1_000_000
 
-    @property
-    def latency_p999_ms(self) -> float:
-        """P99.9 latency in milliseconds."""
-        return self.latency_p999_ns / 1_000_000
+class _LatencyBatch:
+    """Per-thread buffer of latency samples awaiting submission.
+
+    Filled only by its owning thread, but submitted by any thread calling
+    ``Metrics.flush()``; ``lock`` serializes the two.
+    """
+
+    __slots__ = ('starts', 'ends', 'count', 'first_end_ns', 'lock', '_owner',
+                 '__weakref__')
+
+    def __init__(self, owner: Metrics):
+        self.starts = (c_uint64 * _LATENCY_BATCH_SIZE)()
+        self.ends = (c_uint64 * _LATENCY_BATCH_SIZE)()
+        self.count = 0
+        self.first_end_ns = 0
+        self.lock = threading.Lock()
+        self._owner = weakref.ref(owner)
+
+    def __del__(self):
+        # Thread-local storage is dropped when its thread exits; submit
+        # whatever that thread left behind rather than losing it.
+        owner = self._owner()
+        if self.count and owner is not None and owner._handle:
+            try:
+                with self.lock:
+                    owner._submit(self)
+            except Exception:
+                pass
 
 
 class Metrics:
@@ -92,13 +148,30 @@ class Metrics:
 
     Wraps the native metrics collector. Obtained via ``init()`` or ``get()``.
     Thread-safe: snapshot() and record_latency() can be called from any thread.
+
+    Latency samples are buffered per thread and submitted to the native
+    collector in batches, once ``_LATENCY_BATCH_SIZE`` samples are queued
+    or the oldest queued sample is ``_LATENCY_MAX_AGE_NS`` older than the
+    newest. ``flush()``, ``snapshot()`` and ``latency_histogram()`` submit
+    the pending samples of every thread first, so they always see every
+    sample recorded before the call. Samples of a thread that stops
+    recording reach the native exporter on the next of those calls.
     """
 
     def __init__(self, handle):
         self._handle = handle
+        self._local = threading.local()
+        # Every thread's batch, so flush() can submit them all. Weak, so a
+        # batch dies with its thread's local storage (and submits itself).
+        self._batches: weakref.WeakSet = weakref.WeakSet()
+        self._batches_lock = threading.Lock()
 
     def __del__(self):
         if self._handle:
+            try:
+                self.flush()
+            except Exception:
+                pass
             lib = get_lib()
             lib.hdds_telemetry_release(self._handle)
             self._handle = None
@@ -106,39 +179,115 @@ class Metrics:
     def snapshot(self) -> MetricsSnapshot:
         """Take a point-in-time snapshot of all tracked metrics.
 
+        Latency samples still buffered by any thread are submitted first.
+
         Returns:
             MetricsSnapshot dataclass with current metric values.
 
         Raises:
             HddsException: If the snapshot operation fails.
         """
+        return MetricsSnapshot(*_read_snapshot_fields(self.snapshot_raw()))
+
+    def snapshot_raw(self) -> _MetricsSnapshot:
+        """Take a snapshot into the native ctypes structure, without conversion.
+
+        Cheaper than ``snapshot()`` for exporters that poll at a high rate and
+        only read a few fields: no dataclass is built and fields are converted
+        to Python ints only when accessed. Latency values are nanoseconds.
+
+        Returns:
+            The ``HddsMetricsSnapshot`` ctypes structure filled by the library.
+
+        Raises:
+            HddsException: If the snapshot operation fails.
+        """
+        self.flush()
+
         lib = get_lib()
         raw = _MetricsSnapshot()
         err = lib.hdds_telemetry_snapshot(self._handle, byref(raw))
         check_error(err)
+        return raw
 
-        return MetricsSnapshot(
-            timestamp_ns=raw.timestamp_ns,
-            messages_sent=raw.messages_sent,
-            messages_received=raw.messages_received,
-            messages_dropped=raw.messages_dropped,
-            bytes_sent=raw.bytes_sent,
-            latency_p50_ns=raw.latency_p50_ns,
-            latency_p99_ns=raw.latency_p99_ns,
-            latency_p999_ns=raw.latency_p999_ns,
-            merge_full_count=raw.merge_full_count,
-            would_block_count=raw.would_block_count,
-        )
+    def latency_histogram(self, n_buckets: int = 65) -> List[int]:
+        """Export retained latency samples as a power-of-two histogram.
+
+        Bucket 0 counts zero latencies; bucket ``i > 0`` counts latencies in
+        ``[2**(i-1), 2**i)`` nanoseconds. The last bucket is open-ended: it
+        also counts every larger latency. Histograms can be merged by adding
+        buckets element-wise; use ``histogram_percentile()`` to read
+        percentiles from them.
+
+        Args:
+            n_buckets: Number of buckets. 65 give every u64 latency its own
+                power-of-two bucket; with fewer, large latencies saturate
+                into the last one.
+
+        Returns:
+            List of ``n_buckets`` sample counts.
+
+        Raises:
+            HddsException: If the export fails (e.g. ``n_buckets`` < 1).
+        """
+        self.flush()
+
+        lib = get_lib()
+        buckets = (c_uint64 * n_buckets)()
+        err = lib.hdds_telemetry_snapshot_histogram(self._handle, buckets, n_buckets)
+        check_error(err)
+        return list(buckets)
 
     def record_latency(self, start_ns: int, end_ns: int) -> None:
         """Record a latency sample for percentile tracking.
 
+        The sample is buffered in the calling thread and submitted together
+        with others in a single native call; see the class docstring for
+        when that happens.
+
         Args:
             start_ns: Start timestamp in nanoseconds (epoch-based).
             end_ns: End timestamp in nanoseconds (epoch-based).
         """
+        batch = getattr(self._local, 'batch', None)
+        if batch is None:
+            batch = self._local.batch = _LatencyBatch(self)
+            with self._batches_lock:
+                self._batches.add(batch)
+
+        with batch.lock:
+            i = batch.count
+            if i == 0:
+                batch.first_end_ns = end_ns
+            batch.starts[i] = start_ns
+            batch.ends[i] = end_ns
+            batch.count = i + 1
+            if (batch.count == _LATENCY_BATCH_SIZE
+                    or end_ns - batch.first_end_ns >= _LATENCY_MAX_AGE_NS):
+                self._submit(batch)
+
+    def flush(self) -> None:
+        """Submit latency samples buffered by all threads.
+
+        Raises:
+            HddsException: If the native batch submission fails.
+        """
+        with self._batches_lock:
+            batches = list(self._batches)
+        for batch in batches:
+            with batch.lock:
+                if batch.count:
+                    self._submit(batch)
+
+    def _submit(self, batch: _LatencyBatch) -> None:
+        # Caller holds batch.lock.
+        count = batch.count
+        batch.count = 0
         lib = get_lib()
-        lib.hdds_telemetry_record_latency(self._handle, start_ns, end_ns)
+        err = lib.hdds_telemetry_record_latency_batch(
+            self._handle, batch.starts, batch.ends, count
+        )
+        check_error(err)
 
 
 class Exporter:
@@ -162,6 +311,37 @@ class Exporter:
             self._handle = None
 
 
+def histogram_percentile(buckets: List[int], percentile: float) -> int:
+    """
+    Compute a latency percentile from a ``Metrics.latency_histogram()`` result.
+
+    The value is the inclusive upper bound of the bucket holding the
+    requested rank, so it never under-reports a tail latency. The last
+    bucket is open-ended, so a rank landing there yields
+    ``LATENCY_UNBOUNDED_NS`` rather than a bound its samples may exceed.
+
+    Args:
+        buckets: Power-of-two bucket counts
+        percentile: Percentile in [0, 100] (e.g. 99.9)
+
+    Returns:
+        Latency upper bound in nanoseconds (0 if the histogram is empty,
+        ``LATENCY_UNBOUNDED_NS`` if the rank is in the last bucket)
+    """
+    total = sum(buckets)
+    if total == 0:
+        return 0
+
+    rank = max(1, math.ceil(percentile * total / 100))
+    last = len(buckets) - 1
+    seen = 0
+    for i, count in enumerate(buckets[:last]):
+        seen += count
+        if seen >= rank:
+            return (1 << i) - 1
+    return LATENCY_UNBOUNDED_NS
+
+
 def init() -> Metrics:
     """
     Initialize the global metrics collector.
@@ -190,21 +370,36 @@ def get() -> Optional[Metrics]:
     return Metrics(handle)
 
 
-def start_exporter(bind_addr: str = "127.0.0.1", port: int = 4242) -> Exporter:
+def start_exporter(
+    bind_addr: str = "127.0.0.1",
+    port: int = 4242,
+    chunk_bytes: int = 4096,
+    flush_interval_ms: int = 50,
+) -> Exporter:
     """
     Start the telemetry export server.
 
     The exporter streams metrics to connected clients (e.g., HDDS Viewer).
+    Frames are coalesced and written to each client once ``chunk_bytes``
+    are queued or ``flush_interval_ms`` has elapsed since the last write,
+    so bursts cost one send instead of one per frame. At the default
+    10 Hz push rate every frame still goes out immediately.
 
     Args:
         bind_addr: IP address to bind (default: "127.0.0.1")
         port: Port number (default: 4242)
+        chunk_bytes: Flush threshold in bytes; 0 sends every frame
+            immediately (default: 4096)
+        flush_interval_ms: Maximum time between flushes in milliseconds
+            (default: 50)
 
     Returns:
         Exporter handle (stops when garbage collected)
     """
     lib = get_lib()
-    handle = lib.hdds_telemetry_start_exporter(bind_addr.encode('utf-8'), port)
+    handle = lib.hdds_telemetry_start_exporter_buffered(
+        bind_addr.encode('utf-8'), port, chunk_bytes, flush_interval_ms
+    )
     if not handle:
         raise RuntimeError(f"Failed to start telemetry exporter on {bind_addr}:{port}")
     return Exporter(handle)
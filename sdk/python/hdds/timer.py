@@ -0,0 +1,81 @@
+# SPDX-License-Identifier: Apache-2.0 OR MIT
+# Copyright (c) 2025-2026 naskel.com
+
+"""HDDS PeriodicTimer for fixed-rate publishing.
+
+A ``time.sleep(interval)`` after each ``write()`` drifts: every period is
+stretched by however long the write and the rest of the loop body took, so
+the effective rate falls below ``1 / interval``. PeriodicTimer schedules
+ticks at absolute ``time.monotonic_ns()`` deadlines instead, so loop latency
+is absorbed rather than accumulated.
+
+Typical usage pattern::
+
+    timer = hdds.PeriodicTimer(0.1)
+    for i in range(count):
+        timer.wait()
+        writer.write(payload(i))
+
+SPDX-License-Identifier: Apache-2.0 OR MIT
+Copyright (c) 2025-2026 naskel.com
+"""
+
+from __future__ import annotations
+import time
+
+
+class PeriodicTimer:
+    """Drift-free periodic timer on the monotonic clock.
+
+    The first ``wait()`` returns immediately; tick ``n`` is due ``n``
+    intervals after the timer was created, regardless of how long the
+    caller spent between waits. If the caller falls more than a full
+    interval behind, the missed ticks are skipped (not replayed in a
+    burst) and reported by ``wait()``.
+
+    Args:
+        interval: Tick period in seconds.
+
+    Raises:
+        ValueError: If interval is not at least one nanosecond.
+
+    Example:
+        >>> timer = PeriodicTimer(0.5)
+        >>> while running:
+        ...     if timer.wait():
+        ...         print("running behind")
+        ...     writer.write(sample())
+    """
+
+    __slots__ = ('_interval_ns', '_next_ns')
+
+    def __init__(self, interval: float):
+        self._interval_ns = int(interval * 1_000_000_000)
+        if self._interval_ns <= 0:
+            raise ValueError("interval must be at least 1 ns")
+        self._next_ns = time.monotonic_ns()
+
+    @property
+    def interval(self) -> float:
+        """Tick period in seconds."""
+        return self._interval_ns / 1_000_000_000
+
+    def wait(self) -> int:
+        """Sleep until the next tick is due.
+
+        Returns:
+            The number of ticks missed since the previous ``wait()``
+            (0 when the caller kept up).
+        """
+        interval_ns = self._interval_ns
+        remaining_ns = self._next_ns - time.monotonic_ns()
+        missed = 0
+        if remaining_ns > 0:
+            time.sleep(remaining_ns / 1_000_000_000)
+        else:
+            missed = -remaining_ns // interval_ns
+        self._next_ns += (missed + 1) * interval_ns
+        return missed
+
+    def __repr__(self) -> str:
+        return f"PeriodicTimer(interval={self.interval})"
@@ -25,13 +25,60 @@ Copyright (c) 2025-2026 naskel.com
 """
 
 from __future__ import annotations
-from typing import Optional, List, TYPE_CHECKING
+from typing import Optional, Dict, List, Union, TYPE_CHECKING
 import ctypes
+import time
+
+from ._native import get_lib, check_error, HddsError, HddsException
 
 if TYPE_CHECKING:
     from .entities import DataReader
 
 
+# Native entry points, resolved once by _bind_native() when the first
+# WaitSet or GuardCondition is created. Binding lazily keeps ``import hdds``
+# free of library loading while sparing hot paths (notably ``wait()``) the
+# per-call get_lib() and CDLL attribute lookups.
+_HDDS_WAITSET_CREATE = None
+_HDDS_WAITSET_WAIT = None
+_HDDS_WAITSET_ATTACH_STATUS = None
+_HDDS_WAITSET_ATTACH_GUARD = None
+_HDDS_WAITSET_DETACH = None
+_HDDS_WAITSET_DESTROY = None
+_HDDS_GUARD_CREATE = None
+_HDDS_GUARD_SET_TRIGGER = None
+_HDDS_GUARD_RELEASE = None
+
+# Capacity of the triggered-condition array passed to hdds_waitset_wait().
+_MAX_TRIGGERED = 64
+
+# Return codes checked on every wait(), hoisted out of the HddsError namespace.
+_OK = int(HddsError.OK)
+_NOT_FOUND = int(HddsError.NOT_FOUND)
+
+
+def _bind_native() -> None:
+    """Resolve and cache the native WaitSet/GuardCondition functions."""
+    global _HDDS_WAITSET_CREATE, _HDDS_WAITSET_WAIT, _HDDS_WAITSET_ATTACH_STATUS
+    global _HDDS_WAITSET_ATTACH_GUARD, _HDDS_WAITSET_DETACH, _HDDS_WAITSET_DESTROY
+    global _HDDS_GUARD_CREATE, _HDDS_GUARD_SET_TRIGGER, _HDDS_GUARD_RELEASE
+
+    if _HDDS_GUARD_RELEASE is not None:
+        return
+
+    lib = get_lib()
+    _HDDS_WAITSET_CREATE = lib.hdds_waitset_create
+    _HDDS_WAITSET_WAIT = lib.hdds_waitset_wait
+    _HDDS_WAITSET_ATTACH_STATUS = lib.hdds_waitset_attach_status_condition
+    _HDDS_WAITSET_ATTACH_GUARD = lib.hdds_waitset_attach_guard_condition
+    _HDDS_WAITSET_DETACH = lib.hdds_waitset_detach_condition
+    _HDDS_WAITSET_DESTROY = lib.hdds_waitset_destroy
+    _HDDS_GUARD_CREATE = lib.hdds_guard_condition_create
+    _HDDS_GUARD_SET_TRIGGER = lib.hdds_guard_condition_set_trigger
+    # Assigned last: its presence marks the whole table as bound.
+    _HDDS_GUARD_RELEASE = lib.hdds_guard_condition_release
+
+
 class GuardCondition:
     """Manually triggered condition for waking a WaitSet.
 
@@ -49,11 +96,13 @@ class GuardCondition:
         RuntimeError: If the native guard condition cannot be created.
     """
 
-    def __init__(self):
-        from ._native import get_lib
+    # Guards are often created per timer/shutdown signal; no __dict__ needed.
+    # The native functions are module-level (see _bind_native), not per instance.
+    __slots__ = ('_handle',)
 
-        lib = get_lib()
-        self._handle = lib.hdds_guard_condition_create()
+    def __init__(self):
+        _bind_native()
+        self._handle = _HDDS_GUARD_CREATE()
         if not self._handle:
             raise RuntimeError("Failed to create guard condition")
 
@@ -65,21 +114,15 @@ class GuardCondition:
         Raises:
             RuntimeError: If the guard condition has been destroyed.
         """
-        from ._native import get_lib
-
         if not self._handle:
             raise RuntimeError("Guard condition has been destroyed")
 
-        lib = get_lib()
-        lib.hdds_guard_condition_set_trigger(self._handle, True)
+        _HDDS_GUARD_SET_TRIGGER(self._handle, True)
 
     def close(self) -> None:
         """Release the native guard condition resources. Safe to call multiple times."""
-        from ._native import get_lib
-
         if self._handle:
-            lib = get_lib()
-            lib.hdds_guard_condition_release(self._handle)
+            _HDDS_GUARD_RELEASE(self._handle)
             self._handle = None
 
     def __del__(self):
@@ -112,15 +155,22 @@ class WaitSet:
     """
 
     def __init__(self):
-        from ._native import get_lib
-
-        lib = get_lib()
-        self._handle = lib.hdds_waitset_create()
+        _bind_native()
+        self._handle = _HDDS_WAITSET_CREATE()
         if not self._handle:
             raise RuntimeError("Failed to create waitset")
 
-        self._attached_readers: List[DataReader] = []
-        self._attached_guards: List[GuardCondition] = []
+        # Output buffers for wait(), allocated once and reused on every call
+        self._out_conditions = (ctypes.c_void_p * _MAX_TRIGGERED)()
+        self._out_len = ctypes.c_size_t(0)
+        self._out_len_ref = ctypes.byref(self._out_len)
+
+        # Keyed by id() for O(1) attach/detach; the values keep the attached
+        # objects (and therefore their native conditions) alive.
+        self._attached_readers: Dict[int, DataReader] = {}
+        self._attached_guards: Dict[int, GuardCondition] = {}
+        # Native condition handle -> attached object, for wait_triggered()
+        self._by_condition: Dict[int, Union[DataReader, GuardCondition]] = {}
 
     def attach_reader(self, reader: DataReader) -> None:
         """
@@ -131,15 +181,14 @@ class WaitSet:
         Args:
             reader: DataReader to monitor
         """
-        from ._native import get_lib, check_error
-
-        if reader in self._attached_readers:
+        key = id(reader)
+        if key in self._attached_readers:
             return  # Already attached
 
         cond = reader.get_status_condition()
-        lib = get_lib()
-        check_error(lib.hdds_waitset_attach_status_condition(self._handle, cond))
-        self._attached_readers.append(reader)
+        check_error(_HDDS_WAITSET_ATTACH_STATUS(self._handle, cond))
+        self._attached_readers[key] = reader
+        self._by_condition[cond] = reader
 
     def detach_reader(self, reader: DataReader) -> None:
         """
@@ -148,15 +197,14 @@ class WaitSet:
         Args:
             reader: DataReader to stop monitoring
         """
-        from ._native import get_lib, check_error
-
-        if reader not in self._attached_readers:
+        key = id(reader)
+        if key not in self._attached_readers:
             return
 
         cond = reader.get_status_condition()
-        lib = get_lib()
-        check_error(lib.hdds_waitset_detach_condition(self._handle, cond))
-        self._attached_readers.remove(reader)
+        check_error(_HDDS_WAITSET_DETACH(self._handle, cond))
+        del self._attached_readers[key]
+        self._by_condition.pop(cond, None)
 
     def attach_guard(self, guard: GuardCondition) -> None:
         """
@@ -165,14 +213,13 @@ class WaitSet:
         Args:
             guard: GuardCondition to monitor
         """
-        from ._native import get_lib, check_error
-
-        if guard in self._attached_guards:
+        key = id(guard)
+        if key in self._attached_guards:
             return
 
-        lib = get_lib()
-        check_error(lib.hdds_waitset_attach_guard_condition(self._handle, guard._handle))
-        self._attached_guards.append(guard)
+        check_error(_HDDS_WAITSET_ATTACH_GUARD(self._handle, guard._handle))
+        self._attached_guards[key] = guard
+        self._by_condition[guard._handle] = guard
 
     def detach_guard(self, guard: GuardCondition) -> None:
         """
@@ -181,19 +228,21 @@ class WaitSet:
         Args:
             guard: GuardCondition to stop monitoring
         """
-        from ._native import get_lib, check_error
-
-        if guard not in self._attached_guards:
+        key = id(guard)
+        if key not in self._attached_guards:
             return
 
-        lib = get_lib()
-        check_error(lib.hdds_waitset_detach_condition(self._handle, guard._handle))
-        self._attached_guards.remove(guard)
+        check_error(_HDDS_WAITSET_DETACH(self._handle, guard._handle))
+        del self._attached_guards[key]
+        self._by_condition.pop(guard._handle, None)
 
     def wait(self, timeout: Optional[float] = None) -> bool:
         """
         Wait for conditions to trigger.
 
+        The output buffers are owned by the WaitSet, so a single WaitSet
+        should only be waited on from one thread at a time.
+
         Args:
             timeout: Maximum wait time in seconds.
                      None = block indefinitely
@@ -206,50 +255,112 @@ class WaitSet:
             >>> if waitset.wait(timeout=5.0):
             ...     print("Conditions triggered!")
         """
-        import ctypes
-        from ._native import get_lib, HddsError
+        return self.wait_ns(-1 if timeout is None else int(timeout * 1_000_000_000))
 
-        if not self._handle:
-            raise RuntimeError("WaitSet has been destroyed")
+    def wait_ns(self, timeout_ns: int) -> bool:
+        """
+        Wait for conditions to trigger, with the timeout in nanoseconds.
 
-        if timeout is None:
-            timeout_ns = -1
-        else:
-            timeout_ns = int(timeout * 1_000_000_000)
+        Same as ``wait()`` without the seconds-to-nanoseconds conversion;
+        intended for polling loops that compute the timeout once up front.
 
-        lib = get_lib()
+        Args:
+            timeout_ns: Maximum wait time in nanoseconds.
+                        -1 = block indefinitely
+                        0 = non-blocking poll
+
+        Returns:
+            True if conditions triggered, False on timeout
+
+        Example:
+            >>> timeout_ns = 5_000_000_000
+            >>> while running:
+            ...     if waitset.wait_ns(timeout_ns):
+            ...         drain(reader)
+        """
+        if not self._handle:
+            raise RuntimeError("WaitSet has been destroyed")
 
-        # Allocate output array for triggered conditions
-        max_conditions = 64
-        out_conditions = (ctypes.c_void_p * max_conditions)()
-        out_len = ctypes.c_size_t(0)
+        out_len = self._out_len
+        out_len.value = 0
 
-        err = lib.hdds_waitset_wait(
+        err = _HDDS_WAITSET_WAIT(
             self._handle,
             timeout_ns,
-            out_conditions,
-            max_conditions,
-            ctypes.byref(out_len),
+            self._out_conditions,
+            _MAX_TRIGGERED,
+            self._out_len_ref,
         )
 
-        if err == HddsError.OK:
+        if err == _OK:
             return out_len.value > 0
-        elif err == HddsError.NOT_FOUND:
+        elif err == _NOT_FOUND:
             return False  # Timeout
         else:
-            from ._native import HddsException
             raise HddsException(err)
 
+    def wait_until(self, deadline_ns: int) -> bool:
+        """
+        Wait for conditions to trigger until an absolute deadline.
+
+        ``deadline_ns`` is on the ``time.monotonic_ns()`` clock. Loops that
+        must give up at a fixed point in time can compute the deadline once
+        and call this repeatedly; each call waits only for what is left,
+        so spurious wakeups do not push the deadline back.
+
+        Args:
+            deadline_ns: Deadline in nanoseconds, from ``time.monotonic_ns()``.
+                         A deadline already in the past polls without blocking.
+
+        Returns:
+            True if conditions triggered, False once the deadline passes
+
+        Example:
+            >>> deadline = time.monotonic_ns() + 2_000_000_000
+            >>> while waitset.wait_until(deadline):
+            ...     drain(reader)
+        """
+        return self.wait_ns(max(0, deadline_ns - time.monotonic_ns()))
+
+    def wait_triggered(
+        self, timeout: Optional[float] = None
+    ) -> List[Union[DataReader, GuardCondition]]:
+        """
+        Wait for conditions to trigger and return which ones did.
+
+        Unlike ``wait()``, this reports the ready set, so a loop serving
+        several readers only drains the readers that actually have data
+        instead of polling every attached reader on each wakeup.
+
+        Args:
+            timeout: Maximum wait time in seconds (None = block indefinitely).
+
+        Returns:
+            The attached DataReaders and GuardConditions whose conditions
+            triggered, or an empty list on timeout.
+
+        Example:
+            >>> for reader in waitset.wait_triggered(timeout=1.0):
+            ...     while (data := reader.take()) is not None:
+            ...         handle(topics[reader], data)
+        """
+        if not self.wait(timeout):
+            return []
+        by_condition = self._by_condition
+        return [
+            by_condition[cond]
+            for cond in self._out_conditions[:self._out_len.value]
+            if cond in by_condition
+        ]
+
     def close(self) -> None:
         """Release waitset resources. Safe to call multiple times."""
-        from ._native import get_lib
-
         if self._handle:
-            lib = get_lib()
-            lib.hdds_waitset_destroy(self._handle)
+            _HDDS_WAITSET_DESTROY(self._handle)
             self._handle = None
             self._attached_readers.clear()
             self._attached_guards.clear()
+            self._by_condition.clear()
 
     def __enter__(self) -> WaitSet:
         return self
@@ -6,12 +6,6 @@ Pytest configuration for HDDS Python SDK tests.
 """
 
 import pytest
-import sys
-from pathlib import Path
-
-# Add SDK to path
-SDK_ROOT = Path(__file__).parent.parent
-sys.path.insert(0, str(SDK_ROOT))
 
 
 def pytest_configure(config):
@@ -24,16 +18,16 @@ def pytest_configure(config):
         pytest.skip(f"Native library not available: {e}", allow_module_level=True)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def qos_default():
-    """Fixture for default QoS."""
+    """Fixture for default QoS (session-wide; clone() before mutating)."""
     from hdds.qos import QoS
     return QoS.default()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def qos_reliable():
-    """Fixture for reliable QoS."""
+    """Fixture for reliable QoS (session-wide; clone() before mutating)."""
     from hdds.qos import QoS
     return QoS.reliable()
 
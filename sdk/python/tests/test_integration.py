@@ -8,6 +8,7 @@ These tests exercise real FFI calls via an IntraProcess participant
 support, WaitSet behavior, QoS application, and lifecycle management.
 """
 
+import threading
 import time
 
 import pytest
@@ -37,6 +38,139 @@ class TestPubSub:
         assert data is not None
         assert data == payload
 
+    def test_write_memoryview_slice(self, intra_participant):
+        writer = intra_participant.create_writer("test_write_view")
+        reader = intra_participant.create_reader("test_write_view")
+        time.sleep(0.05)
+
+        buf = bytearray(b"reused buffer....")
+        writer.write(memoryview(buf)[:13])
+        time.sleep(0.05)
+
+        assert reader.take() == b"reused buffer"
+
+    def test_take_view_roundtrip(self, intra_participant):
+        writer = intra_participant.create_writer("test_take_view")
+        reader = intra_participant.create_reader("test_take_view")
+        time.sleep(0.05)
+
+        writer.write(b"viewed")
+        time.sleep(0.05)
+
+        with reader.take_view() as view:
+            assert view.readonly
+            assert view == b"viewed"
+        assert reader.take_view() is None
+
+    def test_take_view_preallocated_slots(self, intra_participant):
+        from hdds.qos import QoS
+
+        qos = QoS.reliable().history_depth(3).preallocated(64)
+        writer = intra_participant.create_writer("test_take_view_slots", qos=qos)
+        reader = intra_participant.create_reader("test_take_view_slots", qos=qos)
+        time.sleep(0.05)
+
+        for i in range(3):
+            writer.write(f"slot-{i}".encode())
+        time.sleep(0.05)
+
+        # Each view has its own slot, so all three are still intact
+        views = [reader.take_view() for _ in range(3)]
+        assert [bytes(v) for v in views] == [b"slot-0", b"slot-1", b"slot-2"]
+        assert reader.take_view() is None
+
+    def test_reader_writer_context_managers(self, intra_participant):
+        with intra_participant.create_writer("test_ctx") as writer, \
+                intra_participant.create_reader("test_ctx") as reader:
+            time.sleep(0.05)
+            writer.write(b"scoped")
+            time.sleep(0.05)
+            assert reader.take() == b"scoped"
+
+        with pytest.raises(RuntimeError):
+            writer.write(b"after close")
+        with pytest.raises(RuntimeError):
+            reader.take()
+        reader.close()  # idempotent
+
+    def test_take_batch(self, intra_participant):
+        writer = intra_participant.create_writer("test_take_batch")
+        reader = intra_participant.create_reader("test_take_batch")
+        time.sleep(0.05)
+
+        for i in range(5):
+            writer.write(f"batch-{i}".encode())
+        time.sleep(0.05)
+
+        first = reader.take_batch(3)
+        rest = reader.take_batch(64)
+        assert [bytes(v) for v in first] == [b"batch-0", b"batch-1", b"batch-2"]
+        assert [bytes(v) for v in rest] == [b"batch-3", b"batch-4"]
+        assert reader.take_batch(64) == []
+
+    def test_has_data(self, intra_participant):
+        writer = intra_participant.create_writer("test_has_data")
+        reader = intra_participant.create_reader("test_has_data")
+        time.sleep(0.05)
+
+        assert not reader.has_data()
+        writer.write(b"ping")
+        time.sleep(0.05)
+
+        assert reader.has_data()
+        assert reader.has_data()  # does not consume the sample
+        assert reader.take() == b"ping"
+        assert not reader.has_data()
+
+    def test_take_batch_typed(self, intra_participant):
+        class Text:
+            @classmethod
+            def decode_cdr2_le(cls, data):
+                assert isinstance(data, bytes)
+                return data.decode(), len(data)
+
+        writer = intra_participant.create_writer("test_take_batch_typed")
+        reader = intra_participant.create_reader("test_take_batch_typed")
+        time.sleep(0.05)
+
+        writer.write(b"one")
+        writer.write(b"two")
+        time.sleep(0.05)
+
+        assert reader.take_batch_typed(Text) == ["one", "two"]
+        assert reader.take_batch_typed(Text) == []
+
+    def test_take_batch_typed_no_copy(self, intra_participant):
+        class Text:
+            @classmethod
+            def decode_cdr2_le(cls, data):
+                assert isinstance(data, memoryview)
+                return str(data, "utf-8"), len(data)
+
+        writer = intra_participant.create_writer("test_take_batch_typed_no_copy")
+        reader = intra_participant.create_reader("test_take_batch_typed_no_copy")
+        time.sleep(0.05)
+
+        writer.write(b"one")
+        time.sleep(0.05)
+
+        assert reader.take_batch_typed(Text, copy=False) == ["one"]
+
+    def test_writer_group_write_all(self, intra_participant):
+        group = intra_participant.create_writer_group(["test_group_a", "test_group_b"])
+        reader_a = intra_participant.create_reader("test_group_a")
+        reader_b = intra_participant.create_reader("test_group_b")
+        time.sleep(0.05)
+
+        group.write_all([b"to a", memoryview(b"to b")])
+        time.sleep(0.05)
+
+        assert len(group) == 2
+        assert reader_a.take() == b"to a"
+        assert reader_b.take() == b"to b"
+        with pytest.raises(ValueError):
+            group.write_all([b"only one"])
+
     def test_take_returns_none_when_empty(self, intra_participant):
         reader = intra_participant.create_reader("test_empty")
         time.sleep(0.05)
@@ -187,6 +321,71 @@ class TestWaitSet:
         ws.close()
         guard.close()
 
+    def test_wait_releases_gil(self):
+        # A thread blocked in wait() must not stop another thread from
+        # running Python code and writing; otherwise this times out.
+        guard = GuardCondition()
+        ws = WaitSet()
+        ws.attach_guard(guard)
+
+        trigger = threading.Timer(0.05, guard.trigger)
+        trigger.start()
+        result = ws.wait(timeout=5.0)
+        trigger.join()
+
+        assert result is True
+        ws.close()
+        guard.close()
+
+    def test_wait_triggered_reports_ready_set(self, intra_participant):
+        writer = intra_participant.create_writer("test_ws_ready_a")
+        reader_a = intra_participant.create_reader("test_ws_ready_a")
+        reader_b = intra_participant.create_reader("test_ws_ready_b")
+        guard = GuardCondition()
+        ws = WaitSet()
+        ws.attach_reader(reader_a)
+        ws.attach_reader(reader_b)
+        ws.attach_guard(guard)
+        time.sleep(0.05)
+
+        assert ws.wait_triggered(timeout=0.05) == []
+
+        writer.write(b"only a")
+        assert ws.wait_triggered(timeout=2.0) == [reader_a]
+
+        guard.trigger()
+        ready = ws.wait_triggered(timeout=1.0)
+        assert guard in ready
+        assert reader_b not in ready
+
+        ws.close()
+        guard.close()
+
+    def test_wait_ns(self):
+        guard = GuardCondition()
+        ws = WaitSet()
+        ws.attach_guard(guard)
+
+        assert ws.wait_ns(10_000_000) is False
+        guard.trigger()
+        assert ws.wait_ns(1_000_000_000) is True
+
+        ws.close()
+        guard.close()
+
+    def test_wait_until(self):
+        guard = GuardCondition()
+        ws = WaitSet()
+        ws.attach_guard(guard)
+
+        assert ws.wait_until(time.monotonic_ns() - 1) is False  # already past
+        assert ws.wait_until(time.monotonic_ns() + 10_000_000) is False
+        guard.trigger()
+        assert ws.wait_until(time.monotonic_ns() + 1_000_000_000) is True
+
+        ws.close()
+        guard.close()
+
     def test_context_manager(self):
         guard = GuardCondition()
 
@@ -263,3 +462,45 @@ class TestPubSubEntities:
         data = reader.take()
         assert data is not None
         assert data == b"via-entities"
+
+
+# =========================================================================
+# TestTelemetry -- latency batching across threads
+# =========================================================================
+
+class TestTelemetry:
+    """Buffered latency samples."""
+
+    def test_histogram_sees_other_threads_samples(self):
+        from hdds import telemetry
+
+        metrics = telemetry.init()
+        before = sum(metrics.latency_histogram())
+
+        recorded = threading.Event()
+        done = threading.Event()
+
+        def worker():
+            # One sample, far below the batch size, on a thread that
+            # stays alive: only the cross-thread flush can submit it.
+            metrics.record_latency(1_000, 2_000)
+            recorded.set()
+            done.wait(5.0)
+
+        t = threading.Thread(target=worker)
+        t.start()
+        try:
+            assert recorded.wait(5.0)
+            assert sum(metrics.latency_histogram()) == before + 1
+        finally:
+            done.set()
+            t.join()
+
+    def test_histogram_percentile_last_bucket_unbounded(self):
+        from hdds.telemetry import LATENCY_UNBOUNDED_NS, histogram_percentile
+
+        # 0, 1, 2, 3, 4 and one 1000 ns sample clamped into the last bucket
+        buckets = [1, 1, 2, 1, 0, 0, 0, 1]
+        assert histogram_percentile(buckets, 50) == 3
+        assert histogram_percentile(buckets, 100) == LATENCY_UNBOUNDED_NS
+        assert histogram_percentile([0] * 8, 99) == 0
@@ -6,11 +6,6 @@ Tests for HDDS QoS module.
 """
 
 import pytest
-import sys
-from pathlib import Path
-
-# Add parent to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
 
 
 class TestQoSCreation:
@@ -81,6 +76,46 @@ class TestQoSFluent:
         assert qos.is_transient_local()
         assert qos.get_history_depth() == 25
 
+    def test_chaining_returns_same_object(self):
+        """Test builder methods mutate in place and carry no __dict__."""
+        from hdds.qos import QoS
+
+        qos = QoS.reliable()
+        assert qos.transient_local().history_depth(5) is qos
+        assert not hasattr(qos, "__dict__")
+
+    def test_partitions_batch(self):
+        """Test adding several partitions in one call."""
+        from hdds.qos import QoS
+
+        qos = QoS.reliable()
+        assert qos.get_partition_count() == 0
+        assert qos.partitions("a", "b", "c") is qos
+        assert qos.partitions() is qos
+        assert qos.get_partition_count() == 3
+        assert all(qos.has_partition(name) for name in ("a", "b", "c"))
+        assert not qos.has_partition("d")
+
+    def test_partition_names_interned(self):
+        """Test that repeated partition names reuse one encoded object."""
+        from hdds.qos import QoS, _encode_partition
+
+        QoS.reliable().partition("interned")
+        QoS.best_effort().partitions("interned", "other")
+        assert _encode_partition("interned") is _encode_partition("interned")
+        assert _encode_partition("caf\u00e9") == "caf\u00e9".encode("utf-8")
+
+    def test_preallocated(self):
+        """Test setting the preallocated reader slot size."""
+        from hdds.qos import QoS
+
+        qos = QoS.reliable().history_depth(10).preallocated(512)
+        assert qos.get_max_payload() == 512
+        assert qos.clone().get_max_payload() == 512
+        assert QoS.default().get_max_payload() is None
+        with pytest.raises(ValueError):
+            QoS.default().preallocated(0)
+
     def test_ownership_exclusive(self):
         """Test setting exclusive ownership."""
         from hdds.qos import QoS
@@ -141,6 +176,32 @@ class TestQoSClone:
         assert cloned.get_history_depth() == 10
 
 
+class TestQoSFreeze:
+    """Test frozen (shared) QoS profiles."""
+
+    def test_freeze_blocks_mutation(self):
+        """Test builder methods raise on a frozen QoS."""
+        from hdds.qos import QoS
+
+        qos = QoS.reliable().history_depth(5).freeze()
+        assert qos.is_frozen
+        with pytest.raises(RuntimeError):
+            qos.history_depth(10)
+        assert qos.get_history_depth() == 5
+
+    def test_clone_of_frozen_shares_handle(self):
+        """Test cloning a frozen QoS reuses the native handle."""
+        from hdds.qos import QoS
+
+        original = QoS.reliable().history_depth(42).freeze()
+        shared = original.clone()
+
+        assert shared.is_frozen
+        assert shared._c_handle == original._c_handle
+        del original
+        assert shared.get_history_depth() == 42
+
+
 class TestQoSRepr:
     """Test QoS string representation."""
 
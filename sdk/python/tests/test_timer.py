@@ -0,0 +1,51 @@
+# SPDX-License-Identifier: Apache-2.0 OR MIT
+# Copyright (c) 2025-2026 naskel.com
+
+"""
+Tests for HDDS PeriodicTimer.
+"""
+
+import time
+
+import pytest
+
+
+class TestPeriodicTimer:
+    """Test fixed-rate pacing."""
+
+    def test_invalid_interval(self):
+        from hdds.timer import PeriodicTimer
+
+        with pytest.raises(ValueError):
+            PeriodicTimer(0)
+        with pytest.raises(ValueError):
+            PeriodicTimer(1e-10)  # truncates to 0 ns
+
+    def test_first_tick_is_immediate(self):
+        from hdds.timer import PeriodicTimer
+
+        timer = PeriodicTimer(10.0)
+        start = time.monotonic()
+        assert timer.wait() == 0
+        assert time.monotonic() - start < 1.0
+
+    def test_loop_latency_does_not_drift(self):
+        from hdds.timer import PeriodicTimer
+
+        timer = PeriodicTimer(0.02)
+        start = time.monotonic()
+        for _ in range(6):
+            assert timer.wait() == 0
+            time.sleep(0.01)  # simulated write latency, absorbed by the timer
+        # Ticks at 0..100 ms; the trailing 10 ms sleep ends around 110 ms,
+        # whereas sleep-after-write pacing would take ~180 ms.
+        assert time.monotonic() - start < 0.16
+
+    def test_missed_ticks_are_skipped(self):
+        from hdds.timer import PeriodicTimer
+
+        timer = PeriodicTimer(0.01)
+        timer.wait()
+        time.sleep(0.035)
+        assert timer.wait() >= 2
+        assert timer.wait() == 0
@@ -0,0 +1,78 @@
+# SPDX-License-Identifier: Apache-2.0 OR MIT
+# Copyright (c) 2025-2026 naskel.com
+
+"""
+HelloWorld CDR2 (little-endian) codec shared by the Python samples.
+
+Produces and reads the same bytes as the generated HelloWorld
+encode_cdr2_le()/decode_cdr2_le() (see sdk/samples/idl/HelloWorld.idl),
+but encodes into reused buffers and decodes straight from
+reader.take_view() memoryviews, so sample loops do not allocate
+intermediate bytes objects:
+
+    [id:i32] [str_len:u32] [str_bytes + NUL] [padding to 4-align]
+
+This is the only hand-written HelloWorld codec; samples import it
+rather than keeping their own copy, so a change to the IDL means
+changing this file alone.
+"""
+
+import struct
+
+HELLO_HEADER = struct.Struct("<iI")  # id:i32 + string length:u32
+HELLO_BUF_SIZE = 256  # large enough for every sample's message text
+_PAD = bytes(4)
+
+
+def pack_hello_into(buf, msg_id, message):
+    """Serialize a HelloWorld sample into buf and return its length.
+
+    Pass ``memoryview(buf)[:length]`` to writer.write() to send it.
+    """
+    encoded = message.encode("utf-8")
+    slen = len(encoded) + 1  # includes NUL terminator
+    end = HELLO_HEADER.size + len(encoded)
+    size = HELLO_HEADER.size + ((slen + 3) & ~3)
+    HELLO_HEADER.pack_into(buf, 0, msg_id, slen)
+    buf[HELLO_HEADER.size:end] = encoded
+    buf[end:size] = _PAD[:size - end]  # NUL terminator + alignment
+    return size
+
+
+def make_counter_packer(prefix, msg_id=None):
+    """Return a function mapping n -> HelloWorld CDR bytes for f"{prefix}{n}".
+
+    The sample id is n, or the fixed msg_id when given. The constant
+    prefix is encoded into the returned function's own buffer once; each
+    call only stores the id, the digits of n, the string length and the
+    padding. The returned view is valid until the next call.
+    """
+    encoded = prefix.encode("utf-8")
+    buf = bytearray(HELLO_BUF_SIZE)
+    view = memoryview(buf)
+    start = HELLO_HEADER.size + len(encoded)
+    buf[HELLO_HEADER.size:start] = encoded
+
+    def pack(n):
+        digits = b"%d" % n
+        end = start + len(digits)
+        slen = end - HELLO_HEADER.size + 1  # includes NUL terminator
+        size = HELLO_HEADER.size + ((slen + 3) & ~3)
+        HELLO_HEADER.pack_into(buf, 0, n if msg_id is None else msg_id, slen)
+        buf[start:end] = digits
+        buf[end:size] = _PAD[:size - end]  # NUL terminator + alignment
+        return view[:size]
+
+    return pack
+
+
+def unpack_hello(view):
+    """Decode a HelloWorld sample from any bytes-like object.
+
+    Slicing a memoryview (e.g. from reader.take_view()) does not copy;
+    only the message text is materialized, as a str. Returns
+    (id, message).
+    """
+    msg_id, slen = HELLO_HEADER.unpack_from(view)
+    start = HELLO_HEADER.size
+    return msg_id, str(view[start:start + slen - 1], "utf-8")
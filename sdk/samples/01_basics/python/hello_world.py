@@ -23,6 +23,7 @@ sys.path.insert(0, '../../../python')
 
 import hdds
 from generated.HelloWorld import HelloWorld
+from hello_codec import HELLO_BUF_SIZE, pack_hello_into
 
 
 def run_publisher(participant):
@@ -30,12 +31,14 @@ def run_publisher(participant):
     print("Creating writer...")
     writer = participant.create_writer("HelloWorldTopic")
 
+    message = "Hello from HDDS Python!"
+    buf = bytearray(HELLO_BUF_SIZE)  # reused for every message
+    view = memoryview(buf)
+
     print("Publishing messages...")
     for i in range(10):
-        msg = HelloWorld(id=i, message="Hello from HDDS Python!")
-        data = msg.encode_cdr2_le()
-        writer.write(data)
-        print(f"  Published: {msg.message} (id={msg.id})")
+        writer.write(view[:pack_hello_into(buf, i, message)])
+        print(f"  Published: {message} (id={i})")
         time.sleep(0.5)
 
     print("Done publishing.")
@@ -52,10 +55,11 @@ def run_subscriber(participant):
 
     print("Waiting for messages (Ctrl+C to exit)...")
     received = 0
+    timeout_ns = 5_000_000_000  # 5 seconds, converted once outside the loop
 
     while received < 10:
         # Wait up to 5 seconds
-        if waitset.wait(timeout=5.0):
+        if waitset.wait_ns(timeout_ns):
             # Take all available samples
             while True:
                 data = reader.take()
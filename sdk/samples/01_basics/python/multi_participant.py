@@ -5,16 +5,18 @@
 """
 HDDS Sample: Multi-Participant (Python)
 
-Demonstrates multiple DDS participants in the same process.
+Demonstrates multiple DDS participants running side by side.
 Each participant can have its own domain, QoS, and discovery settings.
+Every participant runs in its own process, so encoding and decoding in
+one does not compete with the others for the GIL.
 
 Usage:
     python multi_participant.py
 """
 
+import multiprocessing as mp
 import sys
 import time
-import threading
 
 sys.path.insert(0, '../../../python')
 
@@ -22,16 +24,18 @@ import hdds
 from generated.HelloWorld import HelloWorld
 
 
-def publisher_thread(name: str, topic: str, domain: int = 0):
+def publisher_process(name: str, topic: str, domain: int = 0):
     """Run a publisher in its own participant."""
+    hdds.logging.init(hdds.LogLevel.INFO)
     print(f"[{name}] Creating participant on domain {domain}...")
     participant = hdds.Participant(name, domain_id=domain)
 
     writer = participant.create_writer(topic)
     print(f"[{name}] Publishing to '{topic}'...")
 
+    msg = HelloWorld(id=0, message=f"From {name}")  # reused; only the id changes
     for i in range(5):
-        msg = HelloWorld(id=i, message=f"From {name}")
+        msg.id = i
         writer.write(msg.encode_cdr2_le())
         print(f"[{name}] Sent: {msg.message} #{msg.id}")
         time.sleep(0.3)
@@ -39,8 +43,9 @@ def publisher_thread(name: str, topic: str, domain: int = 0):
     print(f"[{name}] Done.")
 
 
-def subscriber_thread(name: str, topic: str, domain: int = 0):
-    """Run a subscriber in its own participant."""
+def subscriber_process(name: str, topic: str, received, domain: int = 0):
+    """Run a subscriber in its own participant, counting into received."""
+    hdds.logging.init(hdds.LogLevel.INFO)
     print(f"[{name}] Creating participant on domain {domain}...")
     participant = hdds.Participant(name, domain_id=domain)
 
@@ -49,9 +54,8 @@ def subscriber_thread(name: str, topic: str, domain: int = 0):
     waitset.attach_reader(reader)
 
     print(f"[{name}] Subscribing to '{topic}'...")
-    received = 0
 
-    while received < 10:  # Expect messages from 2 publishers
+    while received.value < 10:  # Expect messages from 2 publishers
         if waitset.wait(timeout=2.0):
             while True:
                 data = reader.take()
@@ -59,13 +63,14 @@ def subscriber_thread(name: str, topic: str, domain: int = 0):
                     break
                 msg, _ = HelloWorld.decode_cdr2_le(data)
                 print(f"[{name}] Received: {msg.message} #{msg.id}")
-                received += 1
+                received.value += 1
 
     print(f"[{name}] Done.")
 
 
 def main():
-    hdds.logging.init(hdds.LogLevel.INFO)
+    # Fresh interpreters: children must not inherit the parent's hdds state
+    mp.set_start_method("spawn")
 
     print("=" * 60)
     print("Multi-Participant Demo")
@@ -74,24 +79,26 @@ def main():
 
     topic = "MultiParticipantTopic"
 
-    # Start threads
-    threads = [
-        threading.Thread(target=subscriber_thread, args=("Subscriber", topic)),
-        threading.Thread(target=publisher_thread, args=("Publisher-A", topic)),
-        threading.Thread(target=publisher_thread, args=("Publisher-B", topic)),
+    received = mp.Value('i', 0)
+
+    # Start processes
+    procs = [
+        mp.Process(target=subscriber_process, args=("Subscriber", topic, received)),
+        mp.Process(target=publisher_process, args=("Publisher-A", topic)),
+        mp.Process(target=publisher_process, args=("Publisher-B", topic)),
     ]
 
     # Small delay to let subscriber start first
-    threads[0].start()
+    procs[0].start()
     time.sleep(0.2)
-    threads[1].start()
-    threads[2].start()
+    procs[1].start()
+    procs[2].start()
 
-    for t in threads:
-        t.join()
+    for p in procs:
+        p.join()
 
     print("=" * 60)
-    print("All participants finished.")
+    print(f"All participants finished ({received.value} messages received).")
     print("=" * 60)
 
 
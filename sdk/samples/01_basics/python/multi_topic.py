@@ -30,16 +30,20 @@ TOPICS = ["SensorData", "Commands", "Status"]
 
 def run_publisher(participant):
     """Publish to multiple topics."""
-    writers = {}
+    # One writer per topic, grouped so each tick is a single write_all() call
+    group = participant.create_writer_group(TOPICS)
     for topic in TOPICS:
-        writers[topic] = participant.create_writer(topic)
         print(f"  Created writer for '{topic}'")
 
+    # One message object per topic, reused for every send (only the id changes)
+    messages = {topic: HelloWorld(id=0, message=f"{topic} message") for topic in TOPICS}
+
     print("\nPublishing to all topics...")
     for i in range(5):
+        for msg in messages.values():
+            msg.id = i
+        group.write_all([msg.encode_cdr2_le() for msg in messages.values()])
         for topic in TOPICS:
-            msg = HelloWorld(id=i, message=f"{topic} message")
-            writers[topic].write(msg.encode_cdr2_le())
             print(f"  [{topic}] Sent #{i}")
         time.sleep(0.5)
 
@@ -61,10 +65,14 @@ def run_subscriber(participant):
     received = {t: 0 for t in TOPICS}
     total_expected = len(TOPICS) * 5
 
+    # Dispatch table: only readers the WaitSet reports as ready get drained
+    topic_of = {reader: topic for topic, reader in readers.items()}
+
     while sum(received.values()) < total_expected:
-        if waitset.wait(timeout=3.0):
-            # Check all readers
-            for topic, reader in readers.items():
+        ready = waitset.wait_triggered(timeout=3.0)
+        if ready:
+            for reader in ready:
+                topic = topic_of[reader]
                 while True:
                     data = reader.take()
                     if data is None:
@@ -53,11 +53,12 @@ def main() -> int:
     print("  tcp  - TCP point-to-point (NAT traversal, WAN)")
     print()
 
-    # Create participant with selected transport
+    # Create participant with selected transport; anything else is UDP
     if transport == "tcp":
         kind = hdds.TransportKind.TCP
     else:
         kind = hdds.TransportKind.UDP
+        transport = "udp"
 
     participant = hdds.Participant("TransportDemo", transport=kind)
     print(f"[OK] Participant created with {transport.upper()} transport")
@@ -74,9 +75,9 @@ def main() -> int:
 
     for i in range(NUM_MESSAGES):
         msg_id = i + 1
-        payload = f"Transport test #{msg_id} ({transport})".encode('utf-8')
-        writer.write(payload)
-        print(f"[SENT] id={msg_id} msg='Transport test #{msg_id} ({transport})'")
+        text = f"Transport test #{msg_id} ({transport})"
+        writer.write(text.encode('ascii'))  # transport is "tcp" or "udp" here
+        print(f"[SENT] id={msg_id} msg='{text}'")
         time.sleep(0.2)
 
     # Read back
@@ -87,10 +88,10 @@ def main() -> int:
 
     if waitset.wait(timeout=2.0):
         while True:
-            data = reader.take()
-            if data is None:
+            view = reader.take_view()
+            if view is None:
                 break
-            print(f"[RECV] {data.decode('utf-8')}")
+            print(f"[RECV] {str(view, 'utf-8')}")
     else:
         print("[TIMEOUT] No messages received (run two instances to test)")
 
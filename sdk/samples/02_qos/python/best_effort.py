@@ -9,17 +9,20 @@ Demonstrates BEST_EFFORT QoS for fire-and-forget messaging.
 Lower latency than RELIABLE, but no delivery guarantees.
 
 Usage:
-    python best_effort.py        # Subscriber
-    python best_effort.py pub    # Publisher
+    python best_effort.py              # Subscriber
+    python best_effort.py pub          # Publisher
+    python best_effort.py --threads    # Both roles in one process
 """
 
+import os
 import sys
 import time
 
-sys.path.insert(0, str(__file__ + "/../../01_basics/python"))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "01_basics", "python"))
 
 import hdds
-from generated.HelloWorld import HelloWorld
+from hello_codec import HELLO_BUF_SIZE, pack_hello_into, unpack_hello
+from sample_utils import run_in_threads
 
 NUM_MESSAGES = 20
 
@@ -32,18 +35,20 @@ def run_publisher(participant):
     print(f"Publishing {NUM_MESSAGES} messages with BEST_EFFORT QoS...")
     print("(Some messages may be lost - fire-and-forget)\n")
 
+    buf = bytearray(HELLO_BUF_SIZE)
+    view = memoryview(buf)
     for i in range(NUM_MESSAGES):
-        msg = HelloWorld(id=i + 1, message=f"BestEffort #{i + 1}")
-        writer.write(msg.encode_cdr2_le())
-        print(f"  [SENT] id={msg.id} msg='{msg.message}'")
+        msg_id, message = i + 1, f"BestEffort #{i + 1}"
+        writer.write(view[:pack_hello_into(buf, msg_id, message)])
+        print(f"  [SENT] id={msg_id} msg='{message}'")
         time.sleep(0.05)  # Fast publishing
 
     print("\nDone publishing. Some messages may have been dropped.")
 
 
-def run_subscriber(participant):
+def run_subscriber(participant, on_ready=None):
     """Receive messages with BEST_EFFORT QoS."""
-    qos = hdds.QoS.best_effort()
+    qos = hdds.QoS.best_effort().preallocated(HELLO_BUF_SIZE)
     reader = participant.create_reader("BestEffortTopic", qos=qos)
 
     waitset = hdds.WaitSet()
@@ -52,19 +57,26 @@ def run_subscriber(participant):
     print("Waiting for BEST_EFFORT messages...")
     print("(Lower latency, but delivery not guaranteed)\n")
 
+    if on_ready is not None:
+        on_ready()  # reader exists, so the publisher can start
+
     received = 0
     timeouts = 0
     max_timeouts = 3
 
     while timeouts < max_timeouts:
         if waitset.wait(timeout=2.0):
+            # Format the whole drain, then write it once: one stdout write
+            # per wakeup instead of one per sample.
+            lines = []
             while True:
-                data = reader.take()
-                if data is None:
+                view = reader.take_view()
+                if view is None:
                     break
-                msg, _ = HelloWorld.decode_cdr2_le(data)
-                print(f"  [RECV] id={msg.id} msg='{msg.message}'")
-                received += 1
+                msg_id, message = unpack_hello(view)
+                lines.append(f"  [RECV] id={msg_id} msg='{message}'\n")
+            sys.stdout.write("".join(lines))
+            received += len(lines)
             timeouts = 0  # Reset on data
         else:
             timeouts += 1
@@ -76,6 +88,7 @@ def run_subscriber(participant):
 
 def main():
     is_publisher = len(sys.argv) > 1 and sys.argv[1] == "pub"
+    threaded = "--threads" in sys.argv
 
     hdds.logging.init(hdds.LogLevel.INFO)
 
@@ -84,6 +97,10 @@ def main():
     print("QoS: BEST_EFFORT - fire-and-forget, lowest latency")
     print("=" * 60)
 
+    if threaded:
+        run_in_threads("BestEffortDemo", run_publisher, run_subscriber)
+        return
+
     with hdds.Participant("BestEffortDemo") as participant:
         if is_publisher:
             run_publisher(participant)
@@ -9,91 +9,97 @@ Demonstrates DEADLINE QoS for monitoring update rates.
 Publisher must send data within deadline or violation is reported.
 
 Usage:
-    python deadline_monitor.py        # Subscriber (monitors deadline)
-    python deadline_monitor.py pub    # Publisher (normal rate)
-    python deadline_monitor.py slow   # Publisher (misses deadlines)
+    python deadline_monitor.py              # Subscriber (monitors deadline)
+    python deadline_monitor.py pub          # Publisher (normal rate)
+    python deadline_monitor.py slow         # Publisher (misses deadlines)
+    python deadline_monitor.py --threads    # Both roles in one process
 """
 
+import os
 import sys
 import time
 
-sys.path.insert(0, str(__file__ + "/../../01_basics/python"))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "01_basics", "python"))
 
 import hdds
-from generated.HelloWorld import HelloWorld
+from hello_codec import HELLO_BUF_SIZE, pack_hello_into, unpack_hello
+from sample_utils import run_in_threads
 
 DEADLINE_MS = 500  # 500ms deadline period
+DEADLINE_NS = DEADLINE_MS * 1_000_000
 NUM_MESSAGES = 10
+_STATUS = ("OK", "DEADLINE MISSED!")  # indexed by the 0/1 violation flag
 
 
 def run_publisher(participant, slow_mode):
     """Publish messages at specified rate."""
     qos = hdds.QoS.reliable().deadline_ms(DEADLINE_MS)
-    writer = participant.create_writer("DeadlineTopic", qos=qos)
+    with participant.create_writer("DeadlineTopic", qos=qos) as writer:
+        interval_ms = 800 if slow_mode else 300
 
-    interval_ms = 800 if slow_mode else 300
-
-    print(f"Publishing with {interval_ms}ms interval (deadline: {DEADLINE_MS}ms)")
-    if slow_mode:
-        print("WARNING: This will MISS deadlines!")
-    else:
-        print("This should meet all deadlines.")
-    print()
+        print(f"Publishing with {interval_ms}ms interval (deadline: {DEADLINE_MS}ms)")
+        if slow_mode:
+            print("WARNING: This will MISS deadlines!")
+        else:
+            print("This should meet all deadlines.")
+        print()
 
-    start = time.monotonic()
+        start_ns = time.monotonic_ns()
 
-    for i in range(NUM_MESSAGES):
-        msg = HelloWorld(id=i + 1, message=f"Update #{i + 1}")
-        writer.write(msg.encode_cdr2_le())
+        buf = bytearray(HELLO_BUF_SIZE)
+        view = memoryview(buf)
+        for i in range(NUM_MESSAGES):
+            msg_id = i + 1
+            writer.write(view[:pack_hello_into(buf, msg_id, f"Update #{msg_id}")])
 
-        elapsed = int((time.monotonic() - start) * 1000)
-        print(f"  [{elapsed:5d}ms] Sent id={msg.id}")
+            elapsed = (time.monotonic_ns() - start_ns) // 1_000_000
+            print(f"  [{elapsed:5d}ms] Sent id={msg_id}")
 
-        time.sleep(interval_ms / 1000.0)
+            time.sleep(interval_ms / 1000.0)
 
-    print("\nDone publishing.")
+        print("\nDone publishing.")
 
 
-def run_subscriber(participant):
+def run_subscriber(participant, on_ready=None):
     """Monitor for deadline violations."""
     qos = hdds.QoS.reliable().deadline_ms(DEADLINE_MS)
-    reader = participant.create_reader("DeadlineTopic", qos=qos)
-
-    waitset = hdds.WaitSet()
-    waitset.attach_reader(reader)
-
-    print(f"Monitoring for deadline violations (deadline: {DEADLINE_MS}ms)...\n")
-
-    received = 0
-    deadline_violations = 0
-    start = time.monotonic()
-    last_recv = start
-
-    while received < NUM_MESSAGES:
-        if waitset.wait(timeout=DEADLINE_MS * 2 / 1000.0):
-            while True:
-                data = reader.take()
-                if data is None:
-                    break
-
-                msg, _ = HelloWorld.decode_cdr2_le(data)
-                now = time.monotonic()
-                elapsed = int((now - start) * 1000)
-                delta = int((now - last_recv) * 1000)
-
-                status = "DEADLINE MISSED!" if (delta > DEADLINE_MS and received > 0) else "OK"
-
-                if delta > DEADLINE_MS and received > 0:
-                    deadline_violations += 1
-
-                print(f"  [{elapsed:5d}ms] Received id={msg.id} (delta={delta}ms) {status}")
-
-                last_recv = now
-                received += 1
-        else:
-            elapsed = int((time.monotonic() - start) * 1000)
-            print(f"  [{elapsed:5d}ms] DEADLINE VIOLATION - no data received!")
-            deadline_violations += 1
+    with participant.create_reader("DeadlineTopic", qos=qos) as reader, \
+            hdds.WaitSet() as waitset:
+        waitset.attach_reader(reader)
+
+        print(f"Monitoring for deadline violations (deadline: {DEADLINE_MS}ms)...\n")
+
+        if on_ready is not None:
+            on_ready()  # reader exists, so the publisher can start
+
+        received = 0
+        deadline_violations = 0
+        start_ns = time.monotonic_ns()
+        last_recv_ns = start_ns
+
+        while received < NUM_MESSAGES:
+            if waitset.wait_ns(DEADLINE_NS * 2):
+                while True:
+                    view = reader.take_view()
+                    if view is None:
+                        break
+
+                    msg_id, _ = unpack_hello(view)
+                    now_ns = time.monotonic_ns()
+                    elapsed = (now_ns - start_ns) // 1_000_000
+                    delta_ns = now_ns - last_recv_ns
+                    violated = int(delta_ns > DEADLINE_NS and received > 0)
+                    deadline_violations += violated
+
+                    print(f"  [{elapsed:5d}ms] Received id={msg_id} "
+                          f"(delta={delta_ns // 1_000_000}ms) {_STATUS[violated]}")
+
+                    last_recv_ns = now_ns
+                    received += 1
+            else:
+                elapsed = (time.monotonic_ns() - start_ns) // 1_000_000
+                print(f"  [{elapsed:5d}ms] DEADLINE VIOLATION - no data received!")
+                deadline_violations += 1
 
     print()
     print("-" * 60)
@@ -103,6 +109,7 @@ def run_subscriber(participant):
 
 def main():
     is_publisher = len(sys.argv) > 1 and sys.argv[1] == "pub"
+    threaded = "--threads" in sys.argv
     slow_mode = len(sys.argv) > 1 and sys.argv[1] == "slow"
 
     hdds.logging.init(hdds.LogLevel.INFO)
@@ -112,6 +119,10 @@ def main():
     print("QoS: DEADLINE - monitor update rate violations")
     print("=" * 60)
 
+    if threaded:
+        run_in_threads("DeadlineDemo", run_publisher, run_subscriber, publisher_args=(False,))
+        return
+
     with hdds.Participant("DeadlineDemo") as participant:
         if is_publisher or slow_mode:
             run_publisher(participant, slow_mode)
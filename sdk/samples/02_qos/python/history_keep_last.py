@@ -14,15 +14,18 @@ Usage:
     python history_keep_last.py sub 5  # Subscriber with depth=5
 """
 
+import os
 import sys
 import time
 
-sys.path.insert(0, str(__file__ + "/../../01_basics/python"))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "01_basics", "python"))
 
 import hdds
-from generated.HelloWorld import HelloWorld
+from hello_codec import HELLO_BUF_SIZE, pack_hello_into, unpack_hello
+from sample_utils import wait_for_shutdown
 
 NUM_MESSAGES = 10
+KEEP_ALIVE_S = 60  # how long the publisher waits for late joiners
 
 
 def run_publisher(participant):
@@ -32,19 +35,27 @@ def run_publisher(participant):
 
     print(f"Publishing {NUM_MESSAGES} messages in rapid succession...\n")
 
+    buf = bytearray(HELLO_BUF_SIZE)
+    view = memoryview(buf)
+    sent = []  # printed after the burst so terminal I/O does not pace it
     for i in range(NUM_MESSAGES):
-        msg = HelloWorld(id=i + 1, message=f"Message #{i + 1}")
-        writer.write(msg.encode_cdr2_le())
-        print(f"  [SENT] id={msg.id} msg='{msg.message}'")
+        msg_id, message = i + 1, f"Message #{i + 1}"
+        writer.write(view[:pack_hello_into(buf, msg_id, message)])
+        sent.append(f"  [SENT] id={msg_id} msg='{message}'")
+    print("\n".join(sent))
 
     print(f"\nAll {NUM_MESSAGES} messages published.")
     print(f"Subscriber with history depth < {NUM_MESSAGES} will only see most recent.")
-    input("Press Enter to exit (keep writer alive for late-join test)...")
+    # HDDS_CI: exit promptly instead of waiting for a late joiner
+    keep_alive_s = 1 if os.environ.get("HDDS_CI") else KEEP_ALIVE_S
+    print(f"Keeping writer alive {keep_alive_s}s for late-join test (Ctrl+C to exit)...")
+    wait_for_shutdown(keep_alive_s)
 
 
 def run_subscriber(participant, history_depth):
     """Subscribe with configurable history depth."""
-    qos = hdds.QoS.reliable().transient_local().history_depth(history_depth)
+    qos = (hdds.QoS.reliable().transient_local().history_depth(history_depth)
+           .preallocated(HELLO_BUF_SIZE))
     reader = participant.create_reader("HistoryTopic", qos=qos)
 
     waitset = hdds.WaitSet()
@@ -58,13 +69,16 @@ def run_subscriber(participant, history_depth):
 
     while timeouts < 2:
         if waitset.wait(timeout=2.0):
+            # Batch the drain's output into a single write
+            lines = []
             while True:
-                data = reader.take()
-                if data is None:
+                view = reader.take_view()
+                if view is None:
                     break
-                msg, _ = HelloWorld.decode_cdr2_le(data)
-                print(f"  [RECV] id={msg.id} msg='{msg.message}'")
-                received += 1
+                msg_id, message = unpack_hello(view)
+                lines.append(f"  [RECV] id={msg_id} msg='{message}'\n")
+            sys.stdout.write("".join(lines))
+            received += len(lines)
             timeouts = 0
         else:
             timeouts += 1
@@ -10,17 +10,20 @@ A low budget (0ms) requests immediate delivery, while a higher budget
 (100ms) allows the middleware to batch or optimize delivery.
 
 Usage:
-    python latency_budget.py        # Subscriber (monitors both topics)
-    python latency_budget.py pub    # Publisher (sends on both topics)
+    python latency_budget.py              # Subscriber (monitors both topics)
+    python latency_budget.py pub          # Publisher (sends on both topics)
+    python latency_budget.py --threads    # Both roles in one process
 """
 
+import os
 import sys
 import time
 
-sys.path.insert(0, str(__file__ + "/../../01_basics/python"))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "01_basics", "python"))
 
 import hdds
-from generated.HelloWorld import HelloWorld
+from hello_codec import HELLO_BUF_SIZE, pack_hello_into, unpack_hello
+from sample_utils import run_in_threads
 
 LOW_LATENCY_MS = 0
 HIGH_LATENCY_MS = 100
@@ -32,75 +35,76 @@ def run_publisher(participant):
     qos_low = hdds.QoS.reliable().latency_budget_ms(LOW_LATENCY_MS)
     qos_high = hdds.QoS.reliable().latency_budget_ms(HIGH_LATENCY_MS)
 
-    writer_low = participant.create_writer("LowLatencyTopic", qos=qos_low)
-    writer_high = participant.create_writer("BatchedTopic", qos=qos_high)
+    with participant.create_writer("LowLatencyTopic", qos=qos_low) as writer_low, \
+            participant.create_writer("BatchedTopic", qos=qos_high) as writer_high:
+        print(f"Publishing {NUM_MESSAGES} messages on each topic...")
+        print(f"  LowLatencyTopic: latency_budget = {LOW_LATENCY_MS}ms (immediate)")
+        print(f"  BatchedTopic:    latency_budget = {HIGH_LATENCY_MS}ms (batched)\n")
 
-    print(f"Publishing {NUM_MESSAGES} messages on each topic...")
-    print(f"  LowLatencyTopic: latency_budget = {LOW_LATENCY_MS}ms (immediate)")
-    print(f"  BatchedTopic:    latency_budget = {HIGH_LATENCY_MS}ms (batched)\n")
+        start_ns = time.monotonic_ns()
 
-    start = time.monotonic()
+        buf = bytearray(HELLO_BUF_SIZE)
+        view = memoryview(buf)
+        for i in range(NUM_MESSAGES):
+            elapsed = (time.monotonic_ns() - start_ns) // 1_000_000
 
-    for i in range(NUM_MESSAGES):
-        elapsed = int((time.monotonic() - start) * 1000)
+            writer_low.write(view[:pack_hello_into(buf, i + 1, f"Low-latency #{i + 1}")])
+            print(f"  [{elapsed:5d}ms] Sent LowLatency  id={i + 1}")
 
-        msg_low = HelloWorld(id=i + 1, message=f"Low-latency #{i + 1}")
-        writer_low.write(msg_low.encode_cdr2_le())
-        print(f"  [{elapsed:5d}ms] Sent LowLatency  id={msg_low.id}")
+            writer_high.write(view[:pack_hello_into(buf, i + 1, f"Batched #{i + 1}")])
+            print(f"  [{elapsed:5d}ms] Sent Batched     id={i + 1}")
 
-        msg_high = HelloWorld(id=i + 1, message=f"Batched #{i + 1}")
-        writer_high.write(msg_high.encode_cdr2_le())
-        print(f"  [{elapsed:5d}ms] Sent Batched     id={msg_high.id}")
+            time.sleep(0.3)
 
-        time.sleep(0.3)
+        print("\nDone publishing on both topics.")
 
-    print("\nDone publishing on both topics.")
 
-
-def run_subscriber(participant):
+def run_subscriber(participant, on_ready=None):
     """Monitor both topics and compare delivery timing."""
     qos_low = hdds.QoS.reliable().latency_budget_ms(LOW_LATENCY_MS)
     qos_high = hdds.QoS.reliable().latency_budget_ms(HIGH_LATENCY_MS)
 
-    reader_low = participant.create_reader("LowLatencyTopic", qos=qos_low)
-    reader_high = participant.create_reader("BatchedTopic", qos=qos_high)
-
-    waitset = hdds.WaitSet()
-    waitset.attach_reader(reader_low)
-    waitset.attach_reader(reader_high)
-
-    print("Subscribing to both topics...")
-    print(f"  LowLatencyTopic: latency_budget = {LOW_LATENCY_MS}ms")
-    print(f"  BatchedTopic:    latency_budget = {HIGH_LATENCY_MS}ms\n")
-
-    received_low = 0
-    received_high = 0
-    start = time.monotonic()
-    timeouts = 0
-
-    while timeouts < 3:
-        if waitset.wait(timeout=2.0):
-            while True:
-                data = reader_low.take()
-                if data is None:
-                    break
-                msg, _ = HelloWorld.decode_cdr2_le(data)
-                elapsed = int((time.monotonic() - start) * 1000)
-                print(f"  [{elapsed:5d}ms] LowLatency  received id={msg.id}")
-                received_low += 1
-
-            while True:
-                data = reader_high.take()
-                if data is None:
-                    break
-                msg, _ = HelloWorld.decode_cdr2_le(data)
-                elapsed = int((time.monotonic() - start) * 1000)
-                print(f"  [{elapsed:5d}ms] Batched     received id={msg.id}")
-                received_high += 1
-
-            timeouts = 0
-        else:
-            timeouts += 1
+    with participant.create_reader("LowLatencyTopic", qos=qos_low) as reader_low, \
+            participant.create_reader("BatchedTopic", qos=qos_high) as reader_high, \
+            hdds.WaitSet() as waitset:
+        waitset.attach_reader(reader_low)
+        waitset.attach_reader(reader_high)
+
+        print("Subscribing to both topics...")
+        print(f"  LowLatencyTopic: latency_budget = {LOW_LATENCY_MS}ms")
+        print(f"  BatchedTopic:    latency_budget = {HIGH_LATENCY_MS}ms\n")
+
+        if on_ready is not None:
+            on_ready()  # reader exists, so the publisher can start
+
+        received_low = 0
+        received_high = 0
+        start_ns = time.monotonic_ns()
+        timeouts = 0
+
+        while timeouts < 3:
+            if waitset.wait(timeout=2.0):
+                while True:
+                    view = reader_low.take_view()
+                    if view is None:
+                        break
+                    msg_id, _ = unpack_hello(view)
+                    elapsed = (time.monotonic_ns() - start_ns) // 1_000_000
+                    print(f"  [{elapsed:5d}ms] LowLatency  received id={msg_id}")
+                    received_low += 1
+
+                while True:
+                    view = reader_high.take_view()
+                    if view is None:
+                        break
+                    msg_id, _ = unpack_hello(view)
+                    elapsed = (time.monotonic_ns() - start_ns) // 1_000_000
+                    print(f"  [{elapsed:5d}ms] Batched     received id={msg_id}")
+                    received_high += 1
+
+                timeouts = 0
+            else:
+                timeouts += 1
 
     print()
     print("-" * 60)
@@ -115,6 +119,7 @@ def run_subscriber(participant):
 
 def main():
     is_publisher = len(sys.argv) > 1 and sys.argv[1] == "pub"
+    threaded = "--threads" in sys.argv
 
     hdds.logging.init(hdds.LogLevel.INFO)
 
@@ -123,6 +128,10 @@ def main():
     print("QoS: LATENCY_BUDGET - delivery latency hints for optimization")
     print("=" * 60)
 
+    if threaded:
+        run_in_threads("LatencyBudgetDemo", run_publisher, run_subscriber)
+        return
+
     with hdds.Participant("LatencyBudgetDemo") as participant:
         if is_publisher:
             run_publisher(participant)
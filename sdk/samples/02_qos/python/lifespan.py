@@ -14,46 +14,53 @@ Usage:
     python lifespan.py pub    # Publisher (sends 10 msgs with 2s lifespan)
 """
 
+import os
 import sys
 import time
 
-sys.path.insert(0, str(__file__ + "/../../01_basics/python"))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "01_basics", "python"))
 
 import hdds
-from generated.HelloWorld import HelloWorld
+from hello_codec import HELLO_BUF_SIZE, pack_hello_into, unpack_hello
+from sample_utils import wait_for_shutdown
 
 LIFESPAN_MS = 2000  # 2 second lifespan
 NUM_MESSAGES = 10
 PUBLISH_INTERVAL_MS = 500  # 500ms between messages
 SUBSCRIBER_DELAY_S = 3  # 3 second delay before subscribing
+KEEP_ALIVE_S = 60  # how long the publisher waits for late joiners
 
 
 def run_publisher(participant):
     """Publish messages with TRANSIENT_LOCAL + LIFESPAN QoS."""
     qos = hdds.QoS.transient_local().lifespan_ms(LIFESPAN_MS)
-    writer = participant.create_writer("LifespanTopic", qos=qos)
+    with participant.create_writer("LifespanTopic", qos=qos) as writer:
+        print(f"Publishing {NUM_MESSAGES} messages with {LIFESPAN_MS}ms lifespan...")
+        print(f"Interval: {PUBLISH_INTERVAL_MS}ms between messages")
+        print(f"Messages will expire {LIFESPAN_MS}ms after being written.\n")
 
-    print(f"Publishing {NUM_MESSAGES} messages with {LIFESPAN_MS}ms lifespan...")
-    print(f"Interval: {PUBLISH_INTERVAL_MS}ms between messages")
-    print(f"Messages will expire {LIFESPAN_MS}ms after being written.\n")
+        start_ns = time.monotonic_ns()
 
-    start = time.monotonic()
+        buf = bytearray(HELLO_BUF_SIZE)
+        view = memoryview(buf)
+        for i in range(NUM_MESSAGES):
+            msg_id, message = i + 1, f"Lifespan sample #{i + 1}"
+            writer.write(view[:pack_hello_into(buf, msg_id, message)])
 
-    for i in range(NUM_MESSAGES):
-        msg = HelloWorld(id=i + 1, message=f"Lifespan sample #{i + 1}")
-        writer.write(msg.encode_cdr2_le())
+            elapsed = (time.monotonic_ns() - start_ns) // 1_000_000
+            print(f"  [{elapsed:5d}ms] Sent id={msg_id} msg='{message}'")
 
-        elapsed = int((time.monotonic() - start) * 1000)
-        print(f"  [{elapsed:5d}ms] Sent id={msg.id} msg='{msg.message}'")
+            time.sleep(PUBLISH_INTERVAL_MS / 1000.0)
 
-        time.sleep(PUBLISH_INTERVAL_MS / 1000.0)
-
-    total_ms = int((time.monotonic() - start) * 1000)
-    print(f"\nAll {NUM_MESSAGES} messages sent in {total_ms}ms.")
-    print(f"Oldest messages will have expired by now (lifespan={LIFESPAN_MS}ms).")
-    print("Waiting for late-joining subscribers...")
-    print("(Run 'python lifespan.py' in another terminal)")
-    input("Press Enter to exit...")
+        total_ms = (time.monotonic_ns() - start_ns) // 1_000_000
+        print(f"\nAll {NUM_MESSAGES} messages sent in {total_ms}ms.")
+        print(f"Oldest messages will have expired by now (lifespan={LIFESPAN_MS}ms).")
+        print("Waiting for late-joining subscribers...")
+        print("(Run 'python lifespan.py' in another terminal)")
+        # HDDS_CI: stay up just long enough for the last sample to expire
+        keep_alive_s = LIFESPAN_MS / 1000 + 1 if os.environ.get("HDDS_CI") else KEEP_ALIVE_S
+        print(f"Keeping writer alive {keep_alive_s:g}s (Ctrl+C to exit)...")
+        wait_for_shutdown(keep_alive_s)
 
 
 def run_subscriber(participant):
@@ -64,29 +71,28 @@ def run_subscriber(participant):
     time.sleep(SUBSCRIBER_DELAY_S)
 
     qos = hdds.QoS.transient_local().lifespan_ms(LIFESPAN_MS)
-    reader = participant.create_reader("LifespanTopic", qos=qos)
-
-    waitset = hdds.WaitSet()
-    waitset.attach_reader(reader)
-
-    print("Reader created. Checking for surviving messages...\n")
-
-    received = 0
-    timeouts = 0
-
-    while timeouts < 2:
-        if waitset.wait(timeout=2.0):
-            while True:
-                data = reader.take()
-                if data is None:
-                    break
-
-                msg, _ = HelloWorld.decode_cdr2_le(data)
-                print(f"  [SURVIVED] id={msg.id} msg='{msg.message}'")
-                received += 1
-            timeouts = 0
-        else:
-            timeouts += 1
+    with participant.create_reader("LifespanTopic", qos=qos) as reader, \
+            hdds.WaitSet() as waitset:
+        waitset.attach_reader(reader)
+
+        print("Reader created. Checking for surviving messages...\n")
+
+        received = 0
+        timeouts = 0
+
+        while timeouts < 2:
+            if waitset.wait(timeout=2.0):
+                while True:
+                    view = reader.take_view()
+                    if view is None:
+                        break
+
+                    msg_id, message = unpack_hello(view)
+                    print(f"  [SURVIVED] id={msg_id} msg='{message}'")
+                    received += 1
+                timeouts = 0
+            else:
+                timeouts += 1
 
     expired = NUM_MESSAGES - received
 
@@ -13,10 +13,11 @@ Usage:
     python liveliness_auto.py pub    # Publisher (sends periodic data)
 """
 
+import os
 import sys
 import time
 
-sys.path.insert(0, str(__file__ + "/../../01_basics/python"))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "01_basics", "python"))
 
 import hdds
 from generated.HelloWorld import HelloWorld
@@ -33,17 +34,18 @@ def run_publisher(participant):
     print(f"Publishing with AUTOMATIC liveliness (lease: {LEASE_DURATION_MS}ms)")
     print("System automatically sends heartbeats to maintain liveliness.\n")
 
-    start = time.monotonic()
+    mono_ns = time.monotonic_ns
+    start_ns = mono_ns()
 
+    timer = hdds.PeriodicTimer(0.4)  # 400ms - faster than lease
     for i in range(NUM_MESSAGES):
+        timer.wait()
         msg = HelloWorld(id=i + 1, message=f"Heartbeat #{i + 1}")
         writer.write(msg.encode_cdr2_le())
 
-        elapsed = int((time.monotonic() - start) * 1000)
+        elapsed = (mono_ns() - start_ns) // 1_000_000
         print(f"  [{elapsed}ms] Published id={msg.id} - writer is ALIVE")
 
-        time.sleep(0.4)  # 400ms - faster than lease
-
     print("\nPublisher going offline. Subscriber should detect liveliness lost.")
 
 
@@ -60,26 +62,23 @@ def run_subscriber(participant):
 
     received = 0
     liveliness_lost_count = 0
-    start = time.monotonic()
-    last_msg = start
+    mono_ns = time.monotonic_ns
+    start_ns = mono_ns()
+    last_msg_ns = start_ns
+    wait_window_ns = LEASE_DURATION_MS * 2_000_000
 
     while received < NUM_MESSAGES + 2:
-        if waitset.wait(timeout=LEASE_DURATION_MS * 2 / 1000.0):
-            while True:
-                data = reader.take()
-                if data is None:
-                    break
-
-                msg, _ = HelloWorld.decode_cdr2_le(data)
-                elapsed = int((time.monotonic() - start) * 1000)
+        if waitset.wait_until(mono_ns() + wait_window_ns):
+            for msg in reader.take_batch_typed(HelloWorld):
+                elapsed = (mono_ns() - start_ns) // 1_000_000
                 print(f"  [{elapsed}ms] Received id={msg.id} - writer ALIVE")
 
-                last_msg = time.monotonic()
+                last_msg_ns = mono_ns()
                 received += 1
         else:
-            now = time.monotonic()
-            elapsed = int((now - start) * 1000)
-            since_last = int((now - last_msg) * 1000)
+            now_ns = mono_ns()
+            elapsed = (now_ns - start_ns) // 1_000_000
+            since_last = (now_ns - last_msg_ns) // 1_000_000
 
             if since_last > LEASE_DURATION_MS:
                 print(f"  [{elapsed}ms] LIVELINESS LOST - no heartbeat for {since_last}ms!")
@@ -13,10 +13,11 @@ Usage:
     python liveliness_manual.py pub    # Publisher (with manual assertion)
 """
 
+import os
 import sys
 import time
 
-sys.path.insert(0, str(__file__ + "/../../01_basics/python"))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "01_basics", "python"))
 
 import hdds
 from generated.HelloWorld import HelloWorld
@@ -33,7 +34,8 @@ def run_publisher(participant):
     print(f"Publishing with MANUAL_BY_PARTICIPANT liveliness (lease: {LEASE_DURATION_MS}ms)")
     print("Application must explicitly assert liveliness.\n")
 
-    start = time.monotonic()
+    mono_ns = time.monotonic_ns
+    start_ns = mono_ns()
 
     for i in range(NUM_MESSAGES):
         msg = HelloWorld(id=i + 1, message=f"Manual update #{i + 1}")
@@ -41,7 +43,7 @@ def run_publisher(participant):
         # Writing data implicitly asserts liveliness
         writer.write(msg.encode_cdr2_le())
 
-        elapsed = int((time.monotonic() - start) * 1000)
+        elapsed = (mono_ns() - start_ns) // 1_000_000
         print(f"  [{elapsed}ms] Published id={msg.id} (liveliness asserted via write)")
 
         # First 3 messages: normal rate
@@ -68,31 +70,28 @@ def run_subscriber(participant):
 
     received = 0
     liveliness_changed = 0
-    start = time.monotonic()
-    last_msg = start
+    mono_ns = time.monotonic_ns
+    start_ns = mono_ns()
+    last_msg_ns = start_ns
+    wait_window_ns = LEASE_DURATION_MS * 1_000_000
 
     while received < NUM_MESSAGES or liveliness_changed < 3:
-        if waitset.wait(timeout=LEASE_DURATION_MS / 1000.0):
-            while True:
-                data = reader.take()
-                if data is None:
-                    break
-
-                msg, _ = HelloWorld.decode_cdr2_le(data)
-                now = time.monotonic()
-                elapsed = int((now - start) * 1000)
-                delta = int((now - last_msg) * 1000)
+        if waitset.wait_until(mono_ns() + wait_window_ns):
+            for msg in reader.take_batch_typed(HelloWorld):
+                now_ns = mono_ns()
+                elapsed = (now_ns - start_ns) // 1_000_000
+                delta = (now_ns - last_msg_ns) // 1_000_000
 
                 status = " [LIVELINESS WAS LOST]" if (delta > LEASE_DURATION_MS and received > 0) else ""
 
                 print(f"  [{elapsed}ms] Received id={msg.id} (delta={delta}ms){status}")
 
-                last_msg = now
+                last_msg_ns = now_ns
                 received += 1
         else:
-            now = time.monotonic()
-            elapsed = int((now - start) * 1000)
-            since_last = int((now - last_msg) * 1000)
+            now_ns = mono_ns()
+            elapsed = (now_ns - start_ns) // 1_000_000
+            since_last = (now_ns - last_msg_ns) // 1_000_000
 
             if since_last > LEASE_DURATION_MS and received > 0:
                 print(f"  [{elapsed}ms] LIVELINESS LOST! (no assertion for {since_last}ms)")
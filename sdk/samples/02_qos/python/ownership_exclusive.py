@@ -14,21 +14,18 @@ Usage:
     python ownership_exclusive.py pub 200     # Publisher with strength 200 (wins)
 """
 
+import os
 import sys
 import time
-import signal
 
-sys.path.insert(0, str(__file__ + "/../../01_basics/python"))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "01_basics", "python"))
 
 import hdds
 from generated.HelloWorld import HelloWorld
+from hello_codec import make_counter_packer
+from sample_utils import shutdown_guard
 
-running = True
-
-
-def signal_handler(sig, frame):
-    global running
-    running = False
+PUBLISH_PERIOD_NS = 500_000_000
 
 
 def run_publisher(participant, strength):
@@ -39,16 +36,19 @@ def run_publisher(participant, strength):
     print(f"Publishing with EXCLUSIVE ownership (strength: {strength})")
     print("Higher strength wins ownership. Start another publisher with different strength.\n")
 
-    signal.signal(signal.SIGINT, signal_handler)
-
+    pack = make_counter_packer(f"Writer[{strength}] seq=", strength)
     seq = 0
-    while running:
-        msg = HelloWorld(id=strength, message=f"Writer[{strength}] seq={seq}")
-        writer.write(msg.encode_cdr2_le())
-        print(f"  [PUBLISHED strength={strength}] seq={seq}")
-
-        seq += 1
-        time.sleep(0.5)
+    with shutdown_guard() as shutdown, hdds.WaitSet() as waitset:
+        waitset.attach_guard(shutdown)
+        # Sleep on the WaitSet rather than time.sleep() so Ctrl+C ends the
+        # wait at once; each timeout is the next publish tick.
+        next_ns = time.monotonic_ns()
+        while not waitset.wait_until(next_ns):
+            next_ns += PUBLISH_PERIOD_NS
+            writer.write(pack(seq))
+            print(f"  [PUBLISHED strength={strength}] seq={seq}")
+
+            seq += 1
 
     print(f"\nPublisher (strength={strength}) shutting down.")
 
@@ -58,30 +58,24 @@ def run_subscriber(participant):
     qos = hdds.QoS.reliable().ownership_exclusive(0)  # Strength doesn't matter for reader
     reader = participant.create_reader("OwnershipTopic", qos=qos)
 
-    waitset = hdds.WaitSet()
-    waitset.attach_reader(reader)
-
     print("Subscribing with EXCLUSIVE ownership...")
     print("Only data from the highest-strength writer will be received.\n")
 
-    signal.signal(signal.SIGINT, signal_handler)
-
     last_owner = -1
 
-    while running:
-        if waitset.wait(timeout=1.0):
-            while True:
-                data = reader.take()
-                if data is None:
-                    break
-
-                msg, _ = HelloWorld.decode_cdr2_le(data)
+    with shutdown_guard() as shutdown, hdds.WaitSet() as waitset:
+        waitset.attach_reader(reader)
+        waitset.attach_guard(shutdown)
 
-                if msg.id != last_owner:
-                    print(f"\n  ** OWNERSHIP CHANGED to writer with strength={msg.id} **\n")
-                    last_owner = msg.id
+        # No timeout needed: Ctrl+C wakes the wait through the shutdown guard.
+        while shutdown not in waitset.wait_triggered():
+            for msg in reader.take_batch_typed(HelloWorld):
+                strength = msg.id
+                if strength != last_owner:
+                    print(f"\n  ** OWNERSHIP CHANGED to writer with strength={strength} **\n")
+                    last_owner = strength
 
-                print(f"  [RECV from strength={msg.id}] {msg.message}")
+                print(f"  [RECV from strength={strength}] {msg.message}")
 
     print("\nSubscriber shutting down.")
 
@@ -15,10 +15,10 @@ Usage:
     python partition_filter.py sub B          # Subscriber (partition B)
 """
 
+import os
 import sys
-import time
 
-sys.path.insert(0, str(__file__ + "/../../01_basics/python"))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "01_basics", "python"))
 
 import hdds
 from generated.HelloWorld import HelloWorld
@@ -33,11 +33,12 @@ def run_publisher(participant, partition):
 
     print(f"Publishing to partition '{partition}'...\n")
 
+    timer = hdds.PeriodicTimer(0.2)
     for i in range(NUM_MESSAGES):
+        timer.wait()
         msg = HelloWorld(id=i + 1, message=f"[{partition}] Message #{i + 1}")
         writer.write(msg.encode_cdr2_le())
         print(f"  [SENT:{partition}] id={msg.id} msg='{msg.message}'")
-        time.sleep(0.2)
 
     print(f"\nDone publishing to partition '{partition}'.")
     print("Only readers in matching partition will receive data.")
@@ -59,11 +60,7 @@ def run_subscriber(participant, partition):
 
     while timeouts < 3:
         if waitset.wait(timeout=2.0):
-            while True:
-                data = reader.take()
-                if data is None:
-                    break
-                msg, _ = HelloWorld.decode_cdr2_le(data)
+            for msg in reader.take_batch_typed(HelloWorld):
                 print(f"  [RECV:{partition}] id={msg.id} msg='{msg.message}'")
                 received += 1
             timeouts = 0
@@ -9,20 +9,24 @@ Demonstrates RELIABLE QoS for guaranteed message delivery.
 Messages are retransmitted if lost (NACK-based recovery).
 
 Usage:
-    python reliable_delivery.py        # Subscriber
-    python reliable_delivery.py pub    # Publisher
+    python reliable_delivery.py              # Subscriber
+    python reliable_delivery.py pub          # Publisher
+    python reliable_delivery.py --threads    # Both roles in one process
 """
 
+import os
 import sys
-import time
 
 # Add parent path for generated types
-sys.path.insert(0, str(__file__ + "/../../01_basics/python"))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "01_basics", "python"))
 
 import hdds
 from generated.HelloWorld import HelloWorld
+from hello_codec import make_counter_packer
+from sample_utils import run_in_threads
 
 NUM_MESSAGES = 10
+_MESSAGE_PREFIX = "Reliable message #"
 
 
 def run_publisher(participant):
@@ -32,16 +36,17 @@ def run_publisher(participant):
 
     print(f"Publishing {NUM_MESSAGES} messages with RELIABLE QoS...\n")
 
-    for i in range(NUM_MESSAGES):
-        msg = HelloWorld(id=i + 1, message=f"Reliable message #{i + 1}")
-        writer.write(msg.encode_cdr2_le())
-        print(f"  [SENT] id={msg.id} msg='{msg.message}'")
-        time.sleep(0.1)
+    pack = make_counter_packer(_MESSAGE_PREFIX)
+    timer = hdds.PeriodicTimer(0.1)
+    for msg_id in range(1, NUM_MESSAGES + 1):
+        timer.wait()
+        writer.write(pack(msg_id))
+        print(f"  [SENT] id={msg_id} msg='{_MESSAGE_PREFIX}{msg_id}'")
 
     print("\nDone publishing. RELIABLE ensures all messages delivered.")
 
 
-def run_subscriber(participant):
+def run_subscriber(participant, on_ready=None):
     """Receive messages with RELIABLE QoS."""
     qos = hdds.QoS.reliable()
     reader = participant.create_reader("ReliableTopic", qos=qos)
@@ -51,16 +56,17 @@ def run_subscriber(participant):
 
     print("Waiting for RELIABLE messages...\n")
 
+    if on_ready is not None:
+        on_ready()  # reader exists, so the publisher can start
+
     received = 0
     while received < NUM_MESSAGES:
         if waitset.wait(timeout=5.0):
-            while True:
-                data = reader.take()
-                if data is None:
-                    break
-                msg, _ = HelloWorld.decode_cdr2_le(data)
-                print(f"  [RECV] id={msg.id} msg='{msg.message}'")
-                received += 1
+            # One stdout write per wakeup instead of one per sample
+            lines = [f"  [RECV] id={msg.id} msg='{msg.message}'\n"
+                     for msg in reader.take_batch_typed(HelloWorld)]
+            sys.stdout.write("".join(lines))
+            received += len(lines)
         else:
             print("  (timeout waiting for messages)")
 
@@ -69,6 +75,7 @@ def run_subscriber(participant):
 
 def main():
     is_publisher = len(sys.argv) > 1 and sys.argv[1] == "pub"
+    threaded = "--threads" in sys.argv
 
     hdds.logging.init(hdds.LogLevel.INFO)
 
@@ -77,6 +84,10 @@ def main():
     print("QoS: RELIABLE - guaranteed delivery via NACK retransmission")
     print("=" * 60)
 
+    if threaded:
+        run_in_threads("ReliableDemo", run_publisher, run_subscriber)
+        return
+
     with hdds.Participant("ReliableDemo") as participant:
         if is_publisher:
             run_publisher(participant)
@@ -15,10 +15,11 @@ Usage:
     python resource_limits.py
 """
 
+import os
 import sys
 import time
 
-sys.path.insert(0, str(__file__ + "/../../01_basics/python"))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "01_basics", "python"))
 
 import hdds
 from generated.HelloWorld import HelloWorld
@@ -45,13 +46,14 @@ def main():
         # --- Publish all messages first ---
         print(f"\nPublishing {NUM_MESSAGES} messages...\n")
 
-        start = time.monotonic()
+        mono_ns = time.monotonic_ns
+        start_ns = mono_ns()
 
         for i in range(NUM_MESSAGES):
             msg = HelloWorld(id=i + 1, message=f"Resource sample #{i + 1}")
             writer.write(msg.encode_cdr2_le())
 
-            elapsed = int((time.monotonic() - start) * 1000)
+            elapsed = (mono_ns() - start_ns) // 1_000_000
             print(f"  [{elapsed:5d}ms] Sent id={msg.id}")
 
         print(f"\nAll {NUM_MESSAGES} messages published and cached.\n")
@@ -72,12 +74,6 @@ def main():
         reader_unlimited = participant.create_reader("ResourceTopic",
                                                      qos=qos_unlimited)
 
-        waitset_limited = hdds.WaitSet()
-        waitset_limited.attach_reader(reader_limited)
-
-        waitset_unlimited = hdds.WaitSet()
-        waitset_unlimited.attach_reader(reader_unlimited)
-
         print(f"Reader A: resource_limits(max_samples={MAX_SAMPLES}, "
               f"max_instances={MAX_INSTANCES}, "
               f"max_per_instance={MAX_SAMPLES_PER_INSTANCE})")
@@ -86,33 +82,18 @@ def main():
         # --- Give readers time to receive cached data ---
         time.sleep(1.0)
 
-        # --- Drain Reader A (limited) ---
+        # --- Drain each reader until empty (no trailing idle wait) ---
         received_limited = 0
+        received_unlimited = 0
         print("Reader A (limited) received:")
-        while True:
-            if not waitset_limited.wait(timeout=1.0):
-                break
-            while True:
-                data = reader_limited.take()
-                if data is None:
-                    break
-                msg, _ = HelloWorld.decode_cdr2_le(data)
+        while reader_limited.has_data():
+            for msg in reader_limited.take_batch_typed(HelloWorld):
                 print(f"  [LIMITED]   id={msg.id} msg='{msg.message}'")
                 received_limited += 1
+        while reader_unlimited.has_data():
+            received_unlimited += len(reader_unlimited.take_batch(64))
 
-        # --- Drain Reader B (unlimited) ---
-        received_unlimited = 0
         print("\nReader B (unlimited) received:")
-        while True:
-            if not waitset_unlimited.wait(timeout=1.0):
-                break
-            while True:
-                data = reader_unlimited.take()
-                if data is None:
-                    break
-                msg, _ = HelloWorld.decode_cdr2_le(data)
-                received_unlimited += 1
-
         if received_unlimited > 10:
             print(f"  ... {received_unlimited} messages total (showing summary)")
         else:
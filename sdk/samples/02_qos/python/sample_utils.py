@@ -0,0 +1,91 @@
+# SPDX-License-Identifier: Apache-2.0 OR MIT
+# Copyright (c) 2025-2026 naskel.com
+
+"""
+Helpers shared by the 02_qos Python samples.
+
+Not a sample itself: the samples in this directory import it to keep
+their own code focused on the QoS policy they demonstrate.
+"""
+
+import contextlib
+import os
+import signal
+import threading
+
+import hdds
+
+
+@contextlib.contextmanager
+def shutdown_guard():
+    """Yield a GuardCondition that Ctrl+C triggers.
+
+    While the main thread is blocked inside a native WaitSet wait, Python
+    signal handlers cannot run, so a flag set from one is only noticed at
+    the next timeout. signal.set_wakeup_fd() has the C-level handler write
+    the signal number to a pipe instead; a watcher thread turns that byte
+    into guard.trigger(), which wakes any WaitSet the guard is attached to
+    immediately.
+
+    On exit the previous SIGINT handling is restored, the watcher thread
+    is stopped and the pipe is closed. Must be entered from the main
+    thread (a restriction of signal.set_wakeup_fd()).
+
+    Example:
+        >>> with shutdown_guard() as shutdown, hdds.WaitSet() as waitset:
+        ...     waitset.attach_guard(shutdown)
+        ...     waitset.wait()
+    """
+    guard = hdds.GuardCondition()
+    read_fd, write_fd = os.pipe()
+    os.set_blocking(write_fd, False)
+    old_wakeup_fd = signal.set_wakeup_fd(write_fd)
+    # The guard carries the shutdown; the handler only has to not raise.
+    old_handler = signal.signal(signal.SIGINT, lambda sig, frame: None)
+
+    def watch():
+        if os.read(read_fd, 1):
+            guard.trigger()
+
+    watcher = threading.Thread(target=watch, daemon=True)
+    watcher.start()
+    try:
+        yield guard
+    finally:
+        signal.signal(signal.SIGINT, old_handler)
+        signal.set_wakeup_fd(old_wakeup_fd)
+        os.close(write_fd)  # EOF releases the watcher if Ctrl+C never came
+        watcher.join()
+        os.close(read_fd)
+
+
+def wait_for_shutdown(timeout_s=None):
+    """Block until Ctrl+C, or until timeout_s seconds elapse if given.
+
+    Unlike input(), this never reads stdin, so the sample can run
+    unattended (e.g. from a benchmark driver) and still exit on its own.
+    """
+    with shutdown_guard() as shutdown, hdds.WaitSet() as waitset:
+        waitset.attach_guard(shutdown)
+        waitset.wait(timeout_s)
+
+
+def run_in_threads(name, run_publisher, run_subscriber, publisher_args=()):
+    """Run a sample's subscriber and publisher in one process.
+
+    Both share one Participant on the intra-process transport, which
+    delivers samples without sockets or discovery traffic; the quickest
+    way to smoke-test a sample locally or in CI. run_subscriber is called
+    as run_subscriber(participant, on_ready=...) and must call on_ready()
+    once its reader exists; that starts run_publisher(participant,
+    *publisher_args) on a second thread.
+    """
+    transport = hdds.TransportMode.INTRA_PROCESS
+    with hdds.Participant(name, transport=transport) as participant:
+        publisher = threading.Thread(
+            target=run_publisher, args=(participant, *publisher_args))
+        try:
+            run_subscriber(participant, on_ready=publisher.start)
+        finally:
+            if publisher.is_alive():
+                publisher.join()
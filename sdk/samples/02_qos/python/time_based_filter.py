@@ -15,10 +15,11 @@ Usage:
     python time_based_filter.py
 """
 
+import os
 import sys
 import time
 
-sys.path.insert(0, str(__file__ + "/../../01_basics/python"))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "01_basics", "python"))
 
 import hdds
 from generated.HelloWorld import HelloWorld
@@ -37,67 +38,47 @@ def main():
     print("=" * 60)
 
     with hdds.Participant("TimeFilterDemo") as participant:
+        # Built once and frozen: clones share the native handle (no FFI copy)
+        best_effort = hdds.QoS.best_effort().freeze()
+
         # --- Writer ---
-        writer_qos = hdds.QoS.best_effort()
-        writer = participant.create_writer("FilteredTopic", qos=writer_qos)
+        writer = participant.create_writer("FilteredTopic", qos=best_effort.clone())
 
         # --- Reader A: no filter (receives all) ---
-        qos_all = hdds.QoS.best_effort()
-        reader_all = participant.create_reader("FilteredTopic", qos=qos_all)
+        reader_all = participant.create_reader("FilteredTopic", qos=best_effort.clone())
 
         # --- Reader B: 500ms time-based filter ---
         qos_filtered = hdds.QoS.best_effort().time_based_filter_ms(FILTER_MS)
         reader_filtered = participant.create_reader("FilteredTopic", qos=qos_filtered)
 
-        waitset_all = hdds.WaitSet()
-        waitset_all.attach_reader(reader_all)
-
-        waitset_filtered = hdds.WaitSet()
-        waitset_filtered.attach_reader(reader_filtered)
-
         print(f"\nPublishing {NUM_MESSAGES} messages at {PUBLISH_INTERVAL_MS}ms intervals...")
         print(f"Reader A: no filter (expects all {NUM_MESSAGES} messages)")
         print(f"Reader B: {FILTER_MS}ms filter (expects ~{int(NUM_MESSAGES * PUBLISH_INTERVAL_MS / FILTER_MS)} messages)\n")
 
         # --- Publish all messages ---
-        start = time.monotonic()
+        mono_ns = time.monotonic_ns
+        start_ns = mono_ns()
 
+        timer = hdds.PeriodicTimer(PUBLISH_INTERVAL_MS / 1000.0)
         for i in range(NUM_MESSAGES):
+            timer.wait()
             msg = HelloWorld(id=i + 1, message=f"Sample #{i + 1}")
             writer.write(msg.encode_cdr2_le())
 
-            elapsed = int((time.monotonic() - start) * 1000)
+            elapsed = (mono_ns() - start_ns) // 1_000_000
             print(f"  [{elapsed:5d}ms] Sent id={msg.id}")
 
-            time.sleep(PUBLISH_INTERVAL_MS / 1000.0)
-
         # --- Give readers time to process ---
         print("\nWaiting for readers to process...\n")
         time.sleep(0.5)
 
-        # --- Drain Reader A ---
+        # --- Drain each reader until empty (no trailing idle wait) ---
         received_all = 0
-        while True:
-            if not waitset_all.wait(timeout=0.5):
-                break
-            while True:
-                data = reader_all.take()
-                if data is None:
-                    break
-                msg, _ = HelloWorld.decode_cdr2_le(data)
-                received_all += 1
-
-        # --- Drain Reader B ---
+        while reader_all.has_data():
+            received_all += len(reader_all.take_batch(64))
         received_filtered = 0
-        while True:
-            if not waitset_filtered.wait(timeout=0.5):
-                break
-            while True:
-                data = reader_filtered.take()
-                if data is None:
-                    break
-                msg, _ = HelloWorld.decode_cdr2_le(data)
-                received_filtered += 1
+        while reader_filtered.has_data():
+            received_filtered += len(reader_filtered.take_batch(64))
 
         # --- Results ---
         print("-" * 60)
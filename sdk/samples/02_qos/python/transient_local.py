@@ -13,22 +13,16 @@ Usage:
     python transient_local.py pub    # Publisher (publishes and waits)
 """
 
+import os
 import sys
-import time
-import signal
 
-sys.path.insert(0, str(__file__ + "/../../01_basics/python"))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "01_basics", "python"))
 
 import hdds
 from generated.HelloWorld import HelloWorld
+from sample_utils import wait_for_shutdown
 
 NUM_MESSAGES = 5
-running = True
-
-
-def signal_handler(sig, frame):
-    global running
-    running = False
 
 
 def run_publisher(participant):
@@ -47,9 +41,7 @@ def run_publisher(participant):
     print("(Run 'python transient_local.py' in another terminal to see late-join)")
     print("Press Ctrl+C to exit.")
 
-    signal.signal(signal.SIGINT, signal_handler)
-    while running:
-        time.sleep(1)
+    wait_for_shutdown()
 
 
 def run_subscriber(participant):
@@ -70,11 +62,7 @@ def run_subscriber(participant):
 
     while timeouts < 2:
         if waitset.wait(timeout=3.0):
-            while True:
-                data = reader.take()
-                if data is None:
-                    break
-                msg, _ = HelloWorld.decode_cdr2_le(data)
+            for msg in reader.take_batch_typed(HelloWorld):
                 print(f"  [HISTORICAL] id={msg.id} msg='{msg.message}'")
                 received += 1
             timeouts = 0
@@ -14,13 +14,14 @@ Usage:
     python transport_priority.py pub    # Publisher (sends on both topics)
 """
 
+import os
 import sys
 import time
 
-sys.path.insert(0, str(__file__ + "/../../01_basics/python"))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "..", "01_basics", "python"))
 
 import hdds
-from generated.HelloWorld import HelloWorld
+from hello_codec import make_counter_packer, unpack_hello
 
 PRIORITY_HIGH = 10  # Alarm data
 PRIORITY_LOW = 0    # Telemetry data
@@ -39,19 +40,24 @@ def run_publisher(participant):
     print(f"  AlarmTopic:     priority = {PRIORITY_HIGH} (high)")
     print(f"  TelemetryTopic: priority = {PRIORITY_LOW} (low)\n")
 
-    start = time.monotonic()
+    # Telemetry first, then alarm: one sample per writer each tick, handed
+    # to the native layer in a single write_all() call.
+    group = hdds.WriterGroup([writer_telemetry, writer_alarm])
 
-    # Send interleaved bursts: telemetry first, then alarm
-    for i in range(NUM_MESSAGES):
-        elapsed = int((time.monotonic() - start) * 1000)
+    # One packer, and so one send buffer, per writer; write_all() takes
+    # the returned views as-is.
+    pack_tel = make_counter_packer("Telemetry #")
+    pack_alarm = make_counter_packer("ALARM #")
 
-        msg_tel = HelloWorld(id=i + 1, message=f"Telemetry #{i + 1}")
-        writer_telemetry.write(msg_tel.encode_cdr2_le())
-        print(f"  [{elapsed:5d}ms] Sent Telemetry (priority={PRIORITY_LOW})  id={msg_tel.id}")
+    start_ns = time.monotonic_ns()
 
-        msg_alarm = HelloWorld(id=i + 1, message=f"ALARM #{i + 1}")
-        writer_alarm.write(msg_alarm.encode_cdr2_le())
-        print(f"  [{elapsed:5d}ms] Sent Alarm     (priority={PRIORITY_HIGH}) id={msg_alarm.id}")
+    for msg_id in range(1, NUM_MESSAGES + 1):
+        elapsed = (time.monotonic_ns() - start_ns) // 1_000_000
+
+        group.write_all([pack_tel(msg_id), pack_alarm(msg_id)])
+        sys.stdout.write(
+            f"  [{elapsed:5d}ms] Sent Telemetry (priority={PRIORITY_LOW})  id={msg_id}\n"
+            f"  [{elapsed:5d}ms] Sent Alarm     (priority={PRIORITY_HIGH}) id={msg_id}\n")
 
         time.sleep(0.2)
 
@@ -79,34 +85,44 @@ def run_subscriber(participant):
     received_alarm = 0
     received_telemetry = 0
     arrival_order = []
-    start = time.monotonic()
+    start_ns = time.monotonic_ns()
     timeouts = 0
 
     while timeouts < 3:
-        if waitset.wait(timeout=2.0):
+        # Only drain the readers that actually woke the waitset
+        ready = waitset.wait_triggered(timeout=2.0)
+        if not ready:
+            timeouts += 1
+            continue
+
+        # Log lines are collected and written once per wakeup, keeping
+        # stdout out of the drain loops. Samples drained together arrived
+        # by the same wakeup, so the clock is read once for all of them.
+        lines = []
+        elapsed = (time.monotonic_ns() - start_ns) // 1_000_000
+
+        if reader_alarm in ready:
             while True:
-                data = reader_alarm.take()
-                if data is None:
+                view = reader_alarm.take_view()
+                if view is None:
                     break
-                msg, _ = HelloWorld.decode_cdr2_le(data)
-                elapsed = int((time.monotonic() - start) * 1000)
-                print(f"  [{elapsed:5d}ms] ALARM     received id={msg.id}")
-                arrival_order.append(f"ALARM-{msg.id}")
+                msg_id, _ = unpack_hello(view)
+                lines.append(f"  [{elapsed:5d}ms] ALARM     received id={msg_id}\n")
+                arrival_order.append(f"ALARM-{msg_id}")
                 received_alarm += 1
 
+        if reader_telemetry in ready:
             while True:
-                data = reader_telemetry.take()
-                if data is None:
+                view = reader_telemetry.take_view()
+                if view is None:
                     break
-                msg, _ = HelloWorld.decode_cdr2_le(data)
-                elapsed = int((time.monotonic() - start) * 1000)
-                print(f"  [{elapsed:5d}ms] Telemetry received id={msg.id}")
-                arrival_order.append(f"TEL-{msg.id}")
+                msg_id, _ = unpack_hello(view)
+                lines.append(f"  [{elapsed:5d}ms] Telemetry received id={msg_id}\n")
+                arrival_order.append(f"TEL-{msg_id}")
                 received_telemetry += 1
 
-            timeouts = 0
-        else:
-            timeouts += 1
+        sys.stdout.write("".join(lines))
+        timeouts = 0
 
     print()
     print("-" * 60)
@@ -33,6 +33,18 @@ NUM_MESSAGES: int = 5
 XML_PATH: str = os.path.join(os.path.dirname(__file__), '..', 'qos_profile.xml')
 
 
+def load_qos(loader):
+    """Load XML_PATH with a QoS loader; None if unavailable or unparsable.
+
+    The SDK caches the parsed file, so loading it again for each entity
+    only clones the already-parsed profile.
+    """
+    try:
+        return loader(XML_PATH)
+    except (NotImplementedError, ValueError):
+        return None
+
+
 def main() -> int:
     print("=" * 60)
     print("XML QoS Loading Demo")
@@ -48,14 +60,14 @@ def main() -> int:
     # --- Load QoS from standard OMG DDS XML ---
     print("--- Standard OMG DDS XML ---\n")
 
-    writer_qos = hdds.QoS.from_xml(XML_PATH, "reliable_profile")
+    writer_qos = load_qos(hdds.QoS.from_file)
     if writer_qos:
         print("[OK] Loaded writer QoS from 'reliable_profile'")
     else:
         print("[WARN] XML loading failed, falling back to defaults")
         writer_qos = hdds.QoS.reliable()
 
-    reader_qos = hdds.QoS.from_xml(XML_PATH, "reliable_profile")
+    reader_qos = load_qos(hdds.QoS.from_file)
     if reader_qos:
         print("[OK] Loaded reader QoS from 'reliable_profile'")
     else:
@@ -69,7 +81,7 @@ def main() -> int:
     # --- Load FastDDS-compatible XML ---
     print("--- FastDDS-Compatible XML ---\n")
 
-    fastdds_qos = hdds.QoS.from_fastdds_xml(XML_PATH, "reliable_profile")
+    fastdds_qos = load_qos(hdds.QoS.from_fastdds_xml)
     if fastdds_qos:
         print("[OK] Loaded FastDDS-compatible XML profile")
     else:
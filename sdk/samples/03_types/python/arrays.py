@@ -12,7 +12,6 @@ This sample shows how to work with array types:
 """
 
 import sys
-sys.path.insert(0, '.')
 
 from generated.Arrays import Arrays
 
@@ -11,11 +11,25 @@ This sample shows how to work with bit types:
 """
 
 import sys
-sys.path.insert(0, '.')
 
 from generated.Bits import Permissions, StatusFlags, Bits
 
 
+def has_all(bits, mask):
+    """True if every flag in mask is set: one AND and one compare."""
+    return (bits & mask) == mask
+
+
+def has_any(bits, mask):
+    """True if at least one flag in mask is set."""
+    return (bits & mask) != 0
+
+
+def count_set(bits):
+    """Number of flags set (popcount; int.bit_count() needs 3.10)."""
+    return bin(bits).count("1")
+
+
 def main():
     print("=== HDDS Bitsets and Bitmasks Sample ===\n")
 
@@ -31,12 +45,19 @@ def main():
     perms = Permissions(Permissions.READ | Permissions.WRITE)
 
     print(f"\nPermissions with READ | WRITE:")
-    print(f"  bits: 0x{int(perms):02X}")
+    print(f"  bits: 0x{perms.value:02X}")
     print(f"  has READ:    {bool(perms & Permissions.READ)}")
     print(f"  has WRITE:   {bool(perms & Permissions.WRITE)}")
     print(f"  has EXECUTE: {bool(perms & Permissions.EXECUTE)}")
     print(f"  has DELETE:  {bool(perms & Permissions.DELETE)}")
 
+    # Test several flags with one mask instead of one branch per flag
+    read_write = Permissions.READ | Permissions.WRITE
+    exec_delete = Permissions.EXECUTE | Permissions.DELETE
+    print(f"  has READ and WRITE:     {has_all(perms, read_write)}")
+    print(f"  has EXECUTE or DELETE:  {has_any(perms, exec_delete)}")
+    print(f"  flags set:              {count_set(perms.value)}")
+
     # StatusFlags bitset (dataclass with bit fields)
     print("\n--- StatusFlags Bitset ---")
     print("Bitset fields: priority[4 bits], active[1], error[1], warning[1]")
@@ -61,7 +82,7 @@ def main():
     )
 
     print("Original:")
-    print(f"  perms: 0x{int(demo.perms):02X}")
+    print(f"  perms: 0x{demo.perms.value:02X}")
     print(f"  flags.bits: 0x{demo.flags.bits:02X}")
     print(f"  flags.priority: {demo.flags.priority}")
     print(f"  flags.active: {demo.flags.active}")
@@ -72,7 +93,7 @@ def main():
 
     deser, _ = Bits.decode_cdr2_le(data)
     print("Deserialized:")
-    print(f"  perms: 0x{int(deser.perms):02X}")
+    print(f"  perms: 0x{deser.perms.value:02X}")
     print(f"  flags.bits: 0x{deser.flags.bits:02X}")
     print(f"  flags.priority: {deser.flags.priority}")
     print(f"  flags.active: {deser.flags.active}")
@@ -84,24 +105,24 @@ def main():
     print("--- Flag Operations ---")
 
     flags = Permissions(0)
-    print(f"Initial:      0x{int(flags):02X}")
+    print(f"Initial:      0x{flags.value:02X}")
 
     flags = flags | Permissions.READ
-    print(f"After +READ:  0x{int(flags):02X}")
+    print(f"After +READ:  0x{flags.value:02X}")
 
     flags = flags | Permissions.WRITE
-    print(f"After +WRITE: 0x{int(flags):02X}")
+    print(f"After +WRITE: 0x{flags.value:02X}")
 
     flags = flags ^ Permissions.EXECUTE
-    print(f"After ^EXEC:  0x{int(flags):02X}")
+    print(f"After ^EXEC:  0x{flags.value:02X}")
 
     flags = flags & ~Permissions.READ
-    print(f"After -READ:  0x{int(flags):02X}")
+    print(f"After -READ:  0x{flags.value:02X}")
 
     # All permissions
     print("\n--- All Permissions ---")
     all_perms = Permissions(Permissions.READ | Permissions.WRITE | Permissions.EXECUTE | Permissions.DELETE)
-    print(f"All permissions: 0x{int(all_perms):02X}")
+    print(f"All permissions: 0x{all_perms.value:02X}")
 
     all_flags = StatusFlags()
     all_flags.priority = 15
@@ -112,7 +133,7 @@ def main():
     all_demo = Bits(perms=all_perms, flags=all_flags)
     all_data = all_demo.encode_cdr2_le()
     all_deser, _ = Bits.decode_cdr2_le(all_data)
-    print(f"Round-trip perms: 0x{int(all_deser.perms):02X}")
+    print(f"Round-trip perms: 0x{all_deser.perms.value:02X}")
     print(f"Round-trip flags: priority={all_deser.flags.priority}, active={all_deser.flags.active}, "
           f"error={all_deser.flags.error}, warning={all_deser.flags.warning}")
 
@@ -11,7 +11,6 @@ This sample shows how to work with enum types:
 """
 
 import sys
-sys.path.insert(0, '.')
 
 from generated.Enums import Color, Status, Enums
 
@@ -56,7 +55,7 @@ def main():
 
     # Test all color values
     print("--- All Color Values Test ---")
-    for color in [Color.RED, Color.GREEN, Color.BLUE]:
+    for color in (Color.RED, Color.GREEN, Color.BLUE):
         test = Enums(color=color, status=Status.UNKNOWN)
         test_data = test.encode_cdr2_le()
         test_deser, _ = Enums.decode_cdr2_le(test_data)
@@ -66,8 +65,8 @@ def main():
 
     # Test all status values
     print("--- All Status Values Test ---")
-    for status in [Status.UNKNOWN, Status.ACTIVE, Status.INACTIVE,
-                   Status.ERROR]:
+    for status in (Status.UNKNOWN, Status.ACTIVE, Status.INACTIVE,
+                   Status.ERROR):
         test = Enums(color=Color.RED, status=status)
         test_data = test.encode_cdr2_le()
         test_deser, _ = Enums.decode_cdr2_le(test_data)
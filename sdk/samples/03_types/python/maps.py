@@ -12,7 +12,6 @@ This sample shows how to work with map types:
 """
 
 import sys
-sys.path.insert(0, '.')
 
 from generated.Maps import Maps
 
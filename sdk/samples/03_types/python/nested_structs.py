@@ -13,7 +13,6 @@ This sample shows how to work with nested types:
 
 import sys
 import math
-sys.path.insert(0, '.')
 
 from generated.Nested import Point, Pose, Robot
 
@@ -12,7 +12,6 @@ This sample shows how to work with optional fields:
 """
 
 import sys
-sys.path.insert(0, '.')
 
 from generated.Optional import OptionalFields
 
@@ -14,7 +14,6 @@ This sample shows how to work with all basic DDS primitive types:
 """
 
 import sys
-sys.path.insert(0, '.')
 
 from generated.Primitives import Primitives
 
@@ -12,7 +12,6 @@ This sample shows how to work with sequence types:
 """
 
 import sys
-sys.path.insert(0, '.')
 
 from generated.Sequences import Sequences
 
@@ -12,7 +12,6 @@ This sample shows how to work with union types:
 """
 
 import sys
-sys.path.insert(0, '.')
 
 from generated.Unions import DataKind, DataValue, Unions
 
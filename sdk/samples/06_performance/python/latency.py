@@ -19,6 +19,8 @@ Key concepts:
 import os
 import sys
 import time
+import struct
+import functools
 import statistics
 from dataclasses import dataclass, field
 from typing import List, Optional
@@ -34,6 +36,13 @@ PAYLOAD_SIZE = 64
 
 PING_TOPIC = "LatencyPing"
 PONG_TOPIC = "LatencyPong"
+_LATENCY_HEADER = struct.Struct('<QQ')  # sequence, timestamp_ns
+
+
+@functools.lru_cache(maxsize=8)
+def _latency_msg_struct(payload_size: int) -> struct.Struct:
+    """Return the packer for a latency message with the given payload size."""
+    return struct.Struct(f'<QQ{payload_size}x')
 
 
 @dataclass
@@ -120,18 +129,15 @@ def print_histogram(samples: List[float]) -> None:
 
 def serialize_latency_msg(sequence: int, timestamp_ns: int, payload_size: int) -> bytes:
     """Serialize a latency message to bytes"""
-    # Simple format: sequence (8 bytes) + timestamp (8 bytes) + payload
-    import struct
-    header = struct.pack('<QQ', sequence, timestamp_ns)
-    payload = bytes(payload_size)
-    return header + payload
+    # Simple format: sequence (8 bytes) + timestamp (8 bytes) + zeroed payload,
+    # emitted by one pack call (the 'x' pad bytes are the payload)
+    return _latency_msg_struct(payload_size).pack(sequence, timestamp_ns)
 
 
 def deserialize_latency_msg(data: bytes) -> tuple:
     """Deserialize a latency message from bytes"""
-    import struct
-    sequence, timestamp_ns = struct.unpack('<QQ', data[:16])
-    return sequence, timestamp_ns
+    # unpack_from reads the header in place; no data[:16] slice copy
+    return _LATENCY_HEADER.unpack_from(data, 0)
 
 
 def run_ping(participant: hdds.Participant, num_samples: int) -> int:
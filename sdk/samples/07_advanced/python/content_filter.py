@@ -36,6 +36,10 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', 'py
 
 import hdds
 
+# SensorData wire layout: header, location bytes, then the fixed tail
+_SENSOR_HEADER = struct.Struct('<iI')  # sensor_id, location length
+_SENSOR_TAIL = struct.Struct('<ddq')   # temperature, humidity, timestamp
+
 
 @dataclass
 class SensorData:
@@ -46,28 +50,24 @@ class SensorData:
     humidity: float = 0.0
     timestamp: int = 0
 
-    def serialize(self) -> bytes:
-        """Serialize to bytes."""
+    def serialize(self) -> bytearray:
+        """Serialize into a single buffer sized up front."""
         location_bytes = self.location.encode('utf-8')
-        # Format: sensor_id(i), loc_len(I), location(s), temp(d), humidity(d), timestamp(q)
-        return struct.pack(
-            f'<iI{len(location_bytes)}sddq',
-            self.sensor_id,
-            len(location_bytes),
-            location_bytes,
-            self.temperature,
-            self.humidity,
-            self.timestamp
-        )
+        offset = _SENSOR_HEADER.size + len(location_bytes)
+        buf = bytearray(offset + _SENSOR_TAIL.size)
+        _SENSOR_HEADER.pack_into(buf, 0, self.sensor_id, len(location_bytes))
+        buf[_SENSOR_HEADER.size:offset] = location_bytes
+        _SENSOR_TAIL.pack_into(buf, offset, self.temperature, self.humidity, self.timestamp)
+        return buf
 
     @classmethod
     def deserialize(cls, data: bytes) -> 'SensorData':
         """Deserialize from bytes."""
-        sensor_id, loc_len = struct.unpack_from('<iI', data, 0)
-        offset = 8
-        location = data[offset:offset + loc_len].decode('utf-8')
+        sensor_id, loc_len = _SENSOR_HEADER.unpack_from(data, 0)
+        offset = _SENSOR_HEADER.size
+        location = str(memoryview(data)[offset:offset + loc_len], 'utf-8')
         offset += loc_len
-        temperature, humidity, timestamp = struct.unpack_from('<ddq', data, offset)
+        temperature, humidity, timestamp = _SENSOR_TAIL.unpack_from(data, offset)
         return cls(sensor_id, location, temperature, humidity, timestamp)
 
 
@@ -29,6 +29,29 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', 'py
 
 import hdds
 
+_U32 = struct.Struct('<I')
+_I32 = struct.Struct('<i')
+_I64 = struct.Struct('<q')
+
+
+def _put_string(buf: bytearray, offset: int, data: bytes) -> int:
+    """Write a u32 length prefix and data at offset; return the end offset."""
+    _U32.pack_into(buf, offset, len(data))
+    offset += _U32.size
+    end = offset + len(data)
+    buf[offset:end] = data
+    return end
+
+
+def _get_string(mv: memoryview, offset: int) -> tuple:
+    """Read a u32 length prefix and string at offset; return (str, end offset)."""
+    length, = _U32.unpack_from(mv, offset)
+    offset += _U32.size
+    if not length:
+        return "", offset  # empty fields (e.g. the "time" payload) skip decoding
+    end = offset + length
+    return str(mv[offset:end], 'utf-8'), end
+
 
 @dataclass
 class Request:
@@ -39,40 +62,29 @@ class Request:
     payload: str = ""
     timestamp: int = 0
 
-    def serialize(self) -> bytes:
-        """Serialize to bytes."""
+    def serialize(self) -> bytearray:
+        """Serialize into a single buffer sized up front."""
         client_bytes = self.client_id.encode('utf-8')
         op_bytes = self.operation.encode('utf-8')
         payload_bytes = self.payload.encode('utf-8')
-        return struct.pack(
-            f'<qI{len(client_bytes)}sI{len(op_bytes)}sI{len(payload_bytes)}sq',
-            self.request_id,
-            len(client_bytes), client_bytes,
-            len(op_bytes), op_bytes,
-            len(payload_bytes), payload_bytes,
-            self.timestamp
-        )
+        buf = bytearray(2 * _I64.size + 3 * _U32.size
+                        + len(client_bytes) + len(op_bytes) + len(payload_bytes))
+        _I64.pack_into(buf, 0, self.request_id)
+        offset = _put_string(buf, _I64.size, client_bytes)
+        offset = _put_string(buf, offset, op_bytes)
+        offset = _put_string(buf, offset, payload_bytes)
+        _I64.pack_into(buf, offset, self.timestamp)
+        return buf
 
     @classmethod
     def deserialize(cls, data: bytes) -> 'Request':
         """Deserialize from bytes."""
-        offset = 0
-        request_id, client_len = struct.unpack_from('<qI', data, offset)
-        offset += 12
-        client_id = data[offset:offset + client_len].decode('utf-8')
-        offset += client_len
-
-        op_len, = struct.unpack_from('<I', data, offset)
-        offset += 4
-        operation = data[offset:offset + op_len].decode('utf-8')
-        offset += op_len
-
-        payload_len, = struct.unpack_from('<I', data, offset)
-        offset += 4
-        payload = data[offset:offset + payload_len].decode('utf-8')
-        offset += payload_len
-
-        timestamp, = struct.unpack_from('<q', data, offset)
+        mv = memoryview(data)  # string fields are decoded without slice copies
+        request_id, = _I64.unpack_from(mv, 0)
+        client_id, offset = _get_string(mv, _I64.size)
+        operation, offset = _get_string(mv, offset)
+        payload, offset = _get_string(mv, offset)
+        timestamp, = _I64.unpack_from(mv, offset)
         return cls(request_id, client_id, operation, payload, timestamp)
 
 
@@ -85,34 +97,28 @@ class Reply:
     result: str = ""
     timestamp: int = 0
 
-    def serialize(self) -> bytes:
-        """Serialize to bytes."""
+    def serialize(self) -> bytearray:
+        """Serialize into a single buffer sized up front."""
         client_bytes = self.client_id.encode('utf-8')
         result_bytes = self.result.encode('utf-8')
-        return struct.pack(
-            f'<qI{len(client_bytes)}siI{len(result_bytes)}sq',
-            self.request_id,
-            len(client_bytes), client_bytes,
-            self.status_code,
-            len(result_bytes), result_bytes,
-            self.timestamp
-        )
+        buf = bytearray(2 * _I64.size + _I32.size + 2 * _U32.size
+                        + len(client_bytes) + len(result_bytes))
+        _I64.pack_into(buf, 0, self.request_id)
+        offset = _put_string(buf, _I64.size, client_bytes)
+        _I32.pack_into(buf, offset, self.status_code)
+        offset = _put_string(buf, offset + _I32.size, result_bytes)
+        _I64.pack_into(buf, offset, self.timestamp)
+        return buf
 
     @classmethod
     def deserialize(cls, data: bytes) -> 'Reply':
         """Deserialize from bytes."""
-        offset = 0
-        request_id, client_len = struct.unpack_from('<qI', data, offset)
-        offset += 12
-        client_id = data[offset:offset + client_len].decode('utf-8')
-        offset += client_len
-
-        status_code, result_len = struct.unpack_from('<iI', data, offset)
-        offset += 8
-        result = data[offset:offset + result_len].decode('utf-8')
-        offset += result_len
-
-        timestamp, = struct.unpack_from('<q', data, offset)
+        mv = memoryview(data)
+        request_id, = _I64.unpack_from(mv, 0)
+        client_id, offset = _get_string(mv, _I64.size)
+        status_code, = _I32.unpack_from(mv, offset)
+        result, offset = _get_string(mv, offset + _I32.size)
+        timestamp, = _I64.unpack_from(mv, offset)
         return cls(request_id, client_id, status_code, result, timestamp)
 
 
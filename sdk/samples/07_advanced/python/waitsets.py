@@ -29,6 +29,10 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', 'py
 
 import hdds
 
+# Wire layouts, compiled once instead of on every (de)serialize call
+_SENSOR_READING = struct.Struct('<idq')  # sensor_id, value, timestamp
+_COMMAND_HEADER = struct.Struct('<iI')  # command_id, action length
+
 
 @dataclass
 class SensorReading:
@@ -38,11 +42,11 @@ class SensorReading:
     timestamp: int = 0
 
     def serialize(self) -> bytes:
-        return struct.pack('<idq', self.sensor_id, self.value, self.timestamp)
+        return _SENSOR_READING.pack(self.sensor_id, self.value, self.timestamp)
 
     @classmethod
     def deserialize(cls, data: bytes) -> 'SensorReading':
-        sensor_id, value, timestamp = struct.unpack('<idq', data)
+        sensor_id, value, timestamp = _SENSOR_READING.unpack(data)
         return cls(sensor_id, value, timestamp)
 
 
@@ -54,12 +58,13 @@ class Command:
 
     def serialize(self) -> bytes:
         action_bytes = self.action.encode('utf-8')
-        return struct.pack(f'<iI{len(action_bytes)}s', self.command_id, len(action_bytes), action_bytes)
+        return _COMMAND_HEADER.pack(self.command_id, len(action_bytes)) + action_bytes
 
     @classmethod
     def deserialize(cls, data: bytes) -> 'Command':
-        command_id, action_len = struct.unpack_from('<iI', data, 0)
-        action = data[8:8 + action_len].decode('utf-8')
+        command_id, action_len = _COMMAND_HEADER.unpack_from(data, 0)
+        start = _COMMAND_HEADER.size
+        action = str(memoryview(data)[start:start + action_len], 'utf-8')
         return cls(command_id, action)
 
 
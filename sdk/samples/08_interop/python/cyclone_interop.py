@@ -22,28 +22,41 @@ Expected:
 import sys
 import struct
 import time
+import functools
 import threading
 
 sys.path.insert(0, "../../../python")
 import hdds
 
+# StringMsg header: id (u32) + string length incl. NUL (u32)
+_STRING_MSG_HEADER = struct.Struct("<II")
+
+
+@functools.lru_cache(maxsize=64)
+def _string_msg_struct(slen: int) -> struct.Struct:
+    """Return the packer for a StringMsg whose encoded string is slen bytes."""
+    return struct.Struct(f"<II{slen}s{(-slen) & 3}x")
+
 
 def serialize_string_msg(msg_id: int, text: str) -> bytes:
     """Serialize StringMsg {id: u32, message: string} to CDR LE."""
     encoded = text.encode("utf-8") + b"\x00"
     slen = len(encoded)
-    pad = (4 - (slen % 4)) % 4
-    return struct.pack("<II", msg_id, slen) + encoded + b"\x00" * pad
+    return _string_msg_struct(slen).pack(msg_id, slen, encoded)
 
 
 def deserialize_string_msg(data: bytes) -> tuple:
-    """Deserialize StringMsg from CDR LE."""
+    """Deserialize StringMsg from CDR LE.
+
+    Accepts bytes or a memoryview; the string body is decoded in place.
+    """
     if len(data) < 8:
         return (0, "")
-    msg_id, slen = struct.unpack_from("<II", data, 0)
+    msg_id, slen = _STRING_MSG_HEADER.unpack_from(data, 0)
     if slen == 0 or 8 + slen > len(data):
         return (msg_id, "")
-    text = data[8 : 8 + slen - 1].decode("utf-8", errors="replace")
+    # Decode straight from a view so the string body is not copied first
+    text = str(memoryview(data)[8 : 8 + slen - 1], "utf-8", errors="replace")
     return (msg_id, text)
 
 
@@ -54,10 +67,7 @@ def subscriber_loop(reader: hdds.DataReader) -> None:
 
     for _ in range(60):
         if waitset.wait(timeout=0.5):
-            while True:
-                data = reader.take()
-                if data is None:
-                    break
+            for data in reader.take_batch(64):
                 msg_id, text = deserialize_string_msg(data)
                 print(f'[SUB] Got {len(data)} bytes: id={msg_id}, msg="{text}"')
 
@@ -21,17 +21,23 @@ Expected:
 import sys
 import struct
 import time
+import functools
 
 sys.path.insert(0, "../../../python")
 import hdds
 
 
+@functools.lru_cache(maxsize=64)
+def _string_msg_struct(slen: int) -> struct.Struct:
+    """Return the packer for a StringMsg whose encoded string is slen bytes."""
+    return struct.Struct(f"<II{slen}s{(-slen) & 3}x")
+
+
 def serialize_string_msg(msg_id: int, text: str) -> bytes:
     """Serialize StringMsg {id: u32, message: string} to CDR LE."""
     encoded = text.encode("utf-8") + b"\x00"  # null-terminated
     slen = len(encoded)
-    pad = (4 - (slen % 4)) % 4
-    return struct.pack("<II", msg_id, slen) + encoded + b"\x00" * pad
+    return _string_msg_struct(slen).pack(msg_id, slen, encoded)
 
 
 def main() -> None:
@@ -24,15 +24,22 @@ import struct
 sys.path.insert(0, "../../../python")
 import hdds
 
+# StringMsg header: id (u32) + string length incl. NUL (u32)
+_STRING_MSG_HEADER = struct.Struct("<II")
+
 
 def deserialize_string_msg(data: bytes) -> tuple:
-    """Deserialize StringMsg {id: u32, message: string} from CDR LE."""
+    """Deserialize StringMsg {id: u32, message: string} from CDR LE.
+
+    Accepts bytes or a memoryview; the string body is decoded in place.
+    """
     if len(data) < 8:
         return (0, "")
-    msg_id, slen = struct.unpack_from("<II", data, 0)
+    msg_id, slen = _STRING_MSG_HEADER.unpack_from(data, 0)
     if slen == 0 or 8 + slen > len(data):
         return (msg_id, "")
-    text = data[8 : 8 + slen - 1].decode("utf-8", errors="replace")
+    # Decode straight from a view so the string body is not copied first
+    text = str(memoryview(data)[8 : 8 + slen - 1], "utf-8", errors="replace")
     return (msg_id, text)
 
 
@@ -51,10 +58,7 @@ def main() -> None:
     received = 0
     for _ in range(60):
         if waitset.wait(timeout=1.0):
-            while True:
-                data = reader.take()
-                if data is None:
-                    break
+            for data in reader.take_batch(64):
                 msg_id, text = deserialize_string_msg(data)
                 print(f'Received {len(data)} bytes: id={msg_id}, msg="{text}"')
                 received += 1
@@ -44,8 +44,8 @@ def decode_ros2_string(data: bytes) -> str:
     length = struct.unpack_from('<I', data, 0)[0]
     if length == 0:
         return ""
-    # Strip null terminator
-    return data[4:4 + length - 1].decode('utf-8', errors='replace')
+    # Strip null terminator; decoding the memoryview avoids a bytes copy
+    return str(memoryview(data)[4:4 + length - 1], 'utf-8', 'replace')
 
 
 def main() -> int:
@@ -31,16 +31,22 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', '..', '..', 'py
 
 import hdds
 
+_U32 = struct.Struct('<I')
 
-def encode_ros2_string(text: str) -> bytes:
+
+def encode_ros2_string(text: str) -> bytearray:
     """Encode a string in ROS2 std_msgs/String CDR format.
 
     ROS2 String message layout (CDR little-endian):
       - uint32 length (including null terminator)
       - char[length] data (null-terminated)
     """
-    encoded = text.encode('utf-8') + b'\x00'
-    return struct.pack('<I', len(encoded)) + encoded
+    encoded = text.encode('utf-8')
+    # One zeroed buffer sized up front: the last byte is the terminator
+    buf = bytearray(_U32.size + len(encoded) + 1)
+    _U32.pack_into(buf, 0, len(encoded) + 1)
+    buf[_U32.size:_U32.size + len(encoded)] = encoded
+    return buf
 
 
 def main() -> int:
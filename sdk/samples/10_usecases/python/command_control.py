@@ -25,14 +25,12 @@ import hdds
 CN = {0: "NOP", 1: "MOVE_TO", 2: "STOP", 3: "SET_SPEED", 4: "RETURN_HOME"}
 SN = {0: "OK", 1: "BUSY", 2: "ERROR", 3: "REJECTED"}
 
-def pk_cmd(seq, t, p1, p2):
-    b = bytearray(16); struct.pack_into("<I", b, 0, seq); b[4] = t
-    struct.pack_into("<f", b, 8, p1); struct.pack_into("<f", b, 12, p2)
-    return bytes(b)
+CMD = struct.Struct("<IB3xff")  # wire layouts above, compiled once
+RSP = struct.Struct("<IB3xI")
 
-def pk_rsp(seq, st, err):
-    b = bytearray(12); struct.pack_into("<I", b, 0, seq); b[4] = st
-    struct.pack_into("<I", b, 8, err); return bytes(b)
+def pk_cmd(seq, t, p1, p2): return CMD.pack(seq, t, p1, p2)
+
+def pk_rsp(seq, st, err): return RSP.pack(seq, st, err)
 
 def run_cmd(p, q):
     cw = p.create_writer("rt/cmd/request", qos=q)
@@ -20,12 +20,9 @@ import math, struct, sys, time
 sys.path.insert(0, "../../../python")
 import hdds
 
-def pk(seq, ts, sp, hd, la, lo, al):
-    b = bytearray(48)
-    struct.pack_into("<I", b, 0, seq); struct.pack_into("<Q", b, 8, ts)
-    struct.pack_into("<f", b, 16, sp); struct.pack_into("<f", b, 20, hd)
-    struct.pack_into("<d", b, 24, la); struct.pack_into("<d", b, 32, lo)
-    struct.pack_into("<f", b, 40, al); return bytes(b)
+TEL = struct.Struct("<I4xQffddf4x")  # wire layout above, compiled once
+
+def pk(seq, ts, sp, hd, la, lo, al): return TEL.pack(seq, ts, sp, hd, la, lo, al)
 
 def now_ns(): return int(time.monotonic_ns())
 
@@ -55,12 +52,7 @@ def run_sub(p, q):
         while True:
             d = rd.take()
             if d is None: break
-            seq = struct.unpack_from("<I", d, 0)[0]
-            ts = struct.unpack_from("<Q", d, 8)[0]
-            sp = struct.unpack_from("<f", d, 16)[0]
-            hd = struct.unpack_from("<f", d, 20)[0]
-            la = struct.unpack_from("<d", d, 24)[0]
-            lo = struct.unpack_from("<d", d, 32)[0]
+            seq, ts, sp, hd, la, lo, _ = TEL.unpack_from(d)
             lat_ms = (now_ns() - ts) / 1e6
             if n % 10 == 0:
                 print(f"[GND] #{seq:<3} spd={sp:.1f} hdg={hd:.1f}"